@@ -38,23 +38,78 @@ def _use_eerepr(token="USE_EEREPR"):
         return False
 
 
-if use_folium():
-    from .foliumap import *
-else:
+_backend = None
+
+# Public names of the backend that shadow a submodule of the same name.
+_backend_names = {"basemaps"}
+
+
+def _load_backend():
+    """Imports the plotting backend the first time a public name is requested.
+    Importing the package itself only defines the helpers above, so headless code that uses
+    submodules such as geeltermap.common does not pay for the map widgets.
+    """
+    global _backend
+
+    if _backend is None:
+        import importlib
+
+        try:
+            if use_folium():
+                _backend = importlib.import_module(".foliumap", __name__)
+            else:
+                _backend = importlib.import_module(".geeltermap", __name__)
+        except Exception as e:
+            if in_colab_shell():
+                print(
+                    "Please restart Colab runtime after installation if you encounter any errors when importing geemap."
+                )
+            else:
+                print(
+                    "Please restart Jupyter kernel after installation if you encounter any errors when importing geemap."
+                )
+            raise Exception(e)
+
+        if _use_eerepr():
+            import eerepr
+
+        # Same effect as the former `from .geeltermap import *`.
+        globals().update({n: getattr(_backend, n) for n in _public_names(_backend)})
+
+    return _backend
+
+
+def _public_names(module):
+    return [name for name in vars(module) if not name.startswith("_")]
+
+
+def __getattr__(name):
+    import importlib
+    import importlib.util
+
+    if name == "Report":
+        from .report import Report
+
+        return Report
+
+    if name.startswith("__") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if (
+        name not in _backend_names
+        and name != "__all__"
+        and importlib.util.find_spec(f"{__name__}.{name}")
+    ):
+        return importlib.import_module(f".{name}", __name__)
+
+    backend = _load_backend()
+    if name == "__all__":
+        return _public_names(backend) + ["Report"]
     try:
-        from .geeltermap import *
-    except Exception as e:
-        if in_colab_shell():
-            print(
-                "Please restart Colab runtime after installation if you encounter any errors when importing geemap."
-            )
-        else:
-            print(
-                "Please restart Jupyter kernel after installation if you encounter any errors when importing geemap."
-            )
-        raise Exception(e)
-
-if _use_eerepr():
-    import eerepr
-
-from .report import Report
+        return getattr(backend, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_public_names(_load_backend())) | {"Report"})
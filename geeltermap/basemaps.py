@@ -13,12 +13,11 @@ More WMS basemaps can be found at the following websites:
 """
 
 import collections
+import collections.abc
+import json
 import os
 import requests
-import folium
 import ipyleaflet
-import xyzservices.providers as xyz
-from xyzservices import TileProvider
 from .common import check_package, planet_tiles
 
 # Custom XYZ tile services.
@@ -232,8 +231,11 @@ def get_xyz_dict(free_only=True, _collection=None, _output=None):
     Returns:
         dict: A dictionary of xyz services.
     """
+    from xyzservices import TileProvider
 
     if _collection is None:
+        import xyzservices.providers as xyz
+
         _collection = xyz
 
     if _output is None:
@@ -249,177 +251,238 @@ def get_xyz_dict(free_only=True, _collection=None, _output=None):
     return collections.OrderedDict(sorted(_output.items()))
 
 
-def xyz_to_leaflet():
-    """Convert xyz tile services to ipyleaflet tile layers.
-
-    Returns:
-        dict: A dictionary of ipyleaflet tile layers.
-    """
-    leaflet_dict = {}
-
-    for key, tile in xyz_tiles.items():
-        name = tile["name"]
-        url = tile["url"]
-        attribution = tile["attribution"]
-        leaflet_dict[key] = ipyleaflet.TileLayer(
-            url=url, name=name, attribution=attribution, max_zoom=22
-        )
+_descriptors = None
 
-    for key, tile in wms_tiles.items():
-        leaflet_dict[key] = ipyleaflet.WMSLayer(
-            url=tile["url"],
-            layers=tile["layers"],
-            name=tile["name"],
-            attribution=tile["attribution"],
-            format=tile["format"],
-            transparent=tile["transparent"],
-        )
 
-    for item in get_xyz_dict().values():
-        leaflet_dict[item.name] = ipyleaflet.TileLayer(
-            url=item.build_url(),
-            name=item.name,
-            max_zoom=item.get("max_zoom", 22),
-            attribution=item.attribution,
-        )
+def _descriptor_cache_path():
+    """Returns the path of the on-disk basemap descriptor index. The file name includes the xyzservices and
+    package versions, so the index is rebuilt whenever either changes.
+    """
+    from importlib.metadata import version, PackageNotFoundError
 
-    if os.environ.get("PLANET_API_KEY") is not None:
+    try:
+        xyz_version = version("xyzservices")
+    except PackageNotFoundError:
+        xyz_version = "unknown"
+    from . import __version__
 
-        planet_dict = planet_tiles(tile_format="ipyleaflet")
-        leaflet_dict.update(planet_dict)
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "geeltermap")
+    return os.path.join(cache_dir, f"basemaps-v2-{__version__}-{xyz_version}.json")
 
-    return leaflet_dict
 
+def get_basemap_descriptors(refresh=False):
+    """Returns lightweight descriptors of all built-in basemaps without creating any map layers.
+        The descriptors of the xyzservices providers are cached on disk, so later sessions do not walk
+        the xyzservices catalog again.
 
-def xyz_to_pydeck():
-    """Convert xyz tile services to pydeck custom tile layers.
+    Args:
+        refresh (bool, optional): Whether to rebuild the descriptor index. Defaults to False.
 
     Returns:
-        dict: A dictionary of pydeck tile layers.
+        dict: A dictionary of basemap descriptors. Each descriptor is a dict with the keys kind ('xyz' or 'wms'),
+            source ('custom' or 'xyzservices'), key, url, name and attribution, plus max_zoom for xyz tiles
+            (None if the provider does not set it) and layers, format and transparent for WMS tiles.
     """
+    global _descriptors
 
-    check_package("pydeck", "https://deckgl.readthedocs.io/en/latest/installation.html")
-    import pydeck as pdk
-
-    pydeck_dict = {}
+    if _descriptors is not None and not refresh:
+        return _descriptors
 
+    descriptors = collections.OrderedDict()
     for key, tile in xyz_tiles.items():
-        url = tile["url"]
-        pydeck_dict[key] = url
-
-    for key, item in get_xyz_dict().items():
-        url = item.build_url()
-        pydeck_dict[key] = url
-
-        if os.environ.get("PLANET_API_KEY") is not None:
-
-            planet_dict = planet_tiles(tile_format="ipyleaflet")
-            for id_, tile in planet_dict.items():
-                pydeck_dict[id_] = tile.url
-
-    pdk.settings.custom_libraries = [
-        {
-            "libraryName": "MyTileLayerLibrary",
-            "resourceUri": "https://cdn.jsdelivr.net/gh/giswqs/pydeck_myTileLayer@master/dist/bundle.js",
+        descriptors[key] = {
+            "kind": "xyz",
+            "source": "custom",
+            "key": key,
+            "url": tile["url"],
+            "name": tile["name"],
+            "attribution": tile["attribution"],
+            "max_zoom": 22,
         }
-    ]
-
-    for key in pydeck_dict:
-        pydeck_dict[key] = pdk.Layer("MyTileLayer", pydeck_dict[key], key)
-
-    return pydeck_dict
-
-
-def xyz_to_folium():
-    """Convert xyz tile services to folium tile layers.
-
-    Returns:
-        dict: A dictionary of folium tile layers.
+    for key, tile in wms_tiles.items():
+        descriptors[key] = {"kind": "wms", "source": "custom", "key": key, **tile}
+
+    cache_path = _descriptor_cache_path()
+    providers = None
+    if not refresh and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as f:
+                providers = json.load(f, object_pairs_hook=collections.OrderedDict)
+        except (OSError, ValueError):
+            providers = None
+
+    if providers is None:
+        providers = collections.OrderedDict()
+        for item in get_xyz_dict().values():
+            providers[item.name] = {
+                "kind": "xyz",
+                "source": "xyzservices",
+                "key": item.name,
+                "url": item.build_url(),
+                "name": item.name,
+                "attribution": item.attribution,
+                "max_zoom": item.get("max_zoom"),
+            }
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + f".{os.getpid()}"
+            with open(tmp_path, "w") as f:
+                json.dump(providers, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    descriptors.update(providers)
+    _descriptors = descriptors
+    return _descriptors
+
+
+class BasemapRegistry(collections.abc.Mapping):
+    """A read-only mapping from basemap names to map layers that creates each layer the first time it is requested.
+    Iterating over the registry, checking membership or listing its keys only uses the basemap descriptors.
     """
-    folium_dict = {}
 
-    for key, tile in xyz_tiles.items():
-        folium_dict[key] = folium.TileLayer(
-            tiles=tile["url"],
-            attr=tile["attribution"],
-            name=tile["name"],
-            overlay=True,
-            control=True,
-            max_zoom=22,
+    def __init__(self, factory, kinds=("xyz", "wms"), extra=None):
+        """Initialize the BasemapRegistry object.
+
+        Args:
+            factory (function): A function that converts a basemap descriptor to a layer object.
+            kinds (tuple, optional): The descriptor kinds supported by the factory. Defaults to ("xyz", "wms").
+            extra (function, optional): A function returning a dict of additional, ready-made layers. It is called
+                once, the first time the full list of basemaps is needed. Defaults to None.
+        """
+        self._factory = factory
+        self._kinds = kinds
+        self._extra = extra
+        self._extra_layers = None
+        self._layers = {}
+
+    def _names(self):
+        names = [
+            key
+            for key, descriptor in get_basemap_descriptors().items()
+            if descriptor["kind"] in self._kinds
+        ]
+        if self._extra is not None:
+            if self._extra_layers is None:
+                self._extra_layers = self._extra()
+            names += [key for key in self._extra_layers if key not in names]
+        return names
+
+    def __getitem__(self, key):
+        if key not in self._layers:
+            descriptor = get_basemap_descriptors().get(key)
+            if descriptor is not None and descriptor["kind"] in self._kinds:
+                self._layers[key] = self._factory(descriptor)
+            elif key in self._names() and key in self._extra_layers:
+                self._layers[key] = self._extra_layers[key]
+            else:
+                raise KeyError(key)
+        return self._layers[key]
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __contains__(self, key):
+        return key in self._names()
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+    def descriptor(self, key):
+        """Returns the descriptor of a basemap, or None for layers added by the extra function."""
+        return get_basemap_descriptors().get(key)
+
+
+def _leaflet_layer(descriptor):
+    """Creates an ipyleaflet layer from a basemap descriptor."""
+    if descriptor["kind"] == "wms":
+        return ipyleaflet.WMSLayer(
+            url=descriptor["url"],
+            layers=descriptor["layers"],
+            name=descriptor["name"],
+            attribution=descriptor["attribution"],
+            format=descriptor["format"],
+            transparent=descriptor["transparent"],
         )
+    return ipyleaflet.TileLayer(
+        url=descriptor["url"],
+        name=descriptor["name"],
+        max_zoom=descriptor["max_zoom"] or 22,
+        attribution=descriptor["attribution"],
+    )
 
-    for key, tile in wms_tiles.items():
-        folium_dict[key] = folium.WmsTileLayer(
-            url=tile["url"],
-            layers=tile["layers"],
-            name=tile["name"],
-            attr=tile["attribution"],
-            fmt=tile["format"],
-            transparent=tile["transparent"],
-            overlay=True,
-            control=True,
-        )
 
-    for item in get_xyz_dict().values():
-        folium_dict[item.name] = folium.TileLayer(
-            tiles=item.build_url(),
-            attr=item.attribution,
-            name=item.name,
-            max_zoom=item.get("max_zoom", 22),
+def _folium_layer(descriptor):
+    """Creates a folium layer from a basemap descriptor."""
+    import folium
+
+    if descriptor["kind"] == "wms":
+        return folium.WmsTileLayer(
+            url=descriptor["url"],
+            layers=descriptor["layers"],
+            name=descriptor["name"],
+            attr=descriptor["attribution"],
+            fmt=descriptor["format"],
+            transparent=descriptor["transparent"],
             overlay=True,
             control=True,
         )
+    return folium.TileLayer(
+        tiles=descriptor["url"],
+        attr=descriptor["attribution"],
+        name=descriptor["name"],
+        max_zoom=descriptor["max_zoom"] or 22,
+        overlay=True,
+        control=True,
+    )
 
-    if os.environ.get("PLANET_API_KEY") is not None:
-
-        planet_dict = planet_tiles(tile_format="folium")
-        folium_dict.update(planet_dict)
-
-    return folium_dict
-
-
-def xyz_to_plotly():
-    """Convert xyz tile services to plotly tile layers.
 
-    Returns:
-        dict: A dictionary of plotly tile layers.
-    """
-    plotly_dict = {}
+def _plotly_layer(descriptor):
+    """Creates a plotly mapbox layer from a basemap descriptor. Plotly layers are named by their key."""
+    return {
+        "below": "traces",
+        "sourcetype": "raster",
+        "sourceattribution": descriptor["attribution"],
+        "source": [descriptor["url"]],
+        "name": descriptor["key"],
+    }
 
-    for key, tile in xyz_tiles.items():
-        plotly_dict[key] = {
-            "below": "traces",
-            "sourcetype": "raster",
-            "sourceattribution": tile["attribution"],
-            "source": [tile["url"]],
-            "name": key,
-        }
 
-    for item in get_xyz_dict().values():
-        plotly_dict[item.name] = {
-            "below": "traces",
-            "sourcetype": "raster",
-            "sourceattribution": item.attribution,
-            "source": [item.build_url()],
-            "name": item.name,
-        }
+def _heremap_layer(descriptor):
+    """Creates a heremap tile layer from a basemap descriptor."""
+    import here_map_widget
 
-    return plotly_dict
+    provider_kwargs = {
+        "url": descriptor["url"],
+        "attribution": descriptor["attribution"],
+        "name": descriptor["name"],
+    }
+    if descriptor["source"] == "xyzservices":
+        provider_kwargs["max_zoom"] = descriptor["max_zoom"] or 22
+    return here_map_widget.TileLayer(
+        provider=here_map_widget.ImageTileProvider(**provider_kwargs)
+    )
 
 
-def xyz_to_heremap():
-    """Convert xyz tile services to hermap tile layers.
+def _planet_layers(tile_format):
+    """Returns the Planet basemaps if the PLANET_API_KEY environment variable is set."""
+    if os.environ.get("PLANET_API_KEY") is not None:
+        return planet_tiles(tile_format=tile_format)
+    return {}
 
-    Returns:
-        dict: A dictionary of heremap tile layers.
-    """
 
-    try:
-        import here_map_widget
-    except ImportError:
-        raise ImportError(
-            'This module requires the hermap package. Please install it using "pip install here-map-widget-for-jupyter".'
-        )
+def _here_default_layers():
+    """Returns the built-in heremap tile services."""
+    import here_map_widget
 
     # Built-in heremap tile services.
     here_tiles = {
@@ -476,28 +539,115 @@ def xyz_to_heremap():
         ),
     }
 
-    heremap_dict = {}
+    return here_tiles
 
-    for key, tile in xyz_tiles.items():
-        heremap_dict[key] = here_map_widget.TileLayer(
-            provider=here_map_widget.ImageTileProvider(
-                url=tile["url"], attribution=tile["attribution"], name=tile["name"]
-            )
-        )
 
-    for item in get_xyz_dict().values():
-        heremap_dict[item.name] = here_map_widget.TileLayer(
-            provider=here_map_widget.ImageTileProvider(
-                url=item.build_url(),
-                attribution=item.attribution,
-                name=item.name,
-                max_zoom=item.get("max_zoom", 22),
+def basemap_registry(backend="ipyleaflet"):
+    """Returns a lazy registry of basemaps for a mapping backend.
+
+    Args:
+        backend (str, optional): The mapping backend. Can be one of 'ipyleaflet', 'folium', 'plotly' or 'heremap'. Defaults to "ipyleaflet".
+
+    Returns:
+        BasemapRegistry: A mapping from basemap names to layers of the backend.
+    """
+    if backend == "ipyleaflet":
+        return BasemapRegistry(
+            _leaflet_layer, extra=lambda: _planet_layers("ipyleaflet")
+        )
+    elif backend == "folium":
+        return BasemapRegistry(_folium_layer, extra=lambda: _planet_layers("folium"))
+    elif backend == "plotly":
+        return BasemapRegistry(_plotly_layer, kinds=("xyz",))
+    elif backend == "heremap":
+        from importlib.util import find_spec
+
+        if find_spec("here_map_widget") is None:
+            raise ImportError(
+                'This module requires the hermap package. Please install it using "pip install here-map-widget-for-jupyter".'
             )
+        return BasemapRegistry(
+            _heremap_layer, kinds=("xyz",), extra=_here_default_layers
+        )
+    else:
+        raise ValueError(
+            "backend must be one of 'ipyleaflet', 'folium', 'plotly' or 'heremap'."
         )
 
-    heremap_dict.update(here_tiles)
 
-    return heremap_dict
+def xyz_to_leaflet():
+    """Convert xyz tile services to ipyleaflet tile layers.
+
+    Returns:
+        dict: A dictionary of ipyleaflet tile layers.
+    """
+    return dict(basemap_registry("ipyleaflet"))
+
+
+def xyz_to_pydeck():
+    """Convert xyz tile services to pydeck custom tile layers.
+
+    Returns:
+        dict: A dictionary of pydeck tile layers.
+    """
+
+    check_package("pydeck", "https://deckgl.readthedocs.io/en/latest/installation.html")
+    import pydeck as pdk
+
+    pydeck_dict = {}
+
+    for key, tile in xyz_tiles.items():
+        url = tile["url"]
+        pydeck_dict[key] = url
+
+    for key, item in get_xyz_dict().items():
+        url = item.build_url()
+        pydeck_dict[key] = url
+
+        if os.environ.get("PLANET_API_KEY") is not None:
+
+            planet_dict = planet_tiles(tile_format="ipyleaflet")
+            for id_, tile in planet_dict.items():
+                pydeck_dict[id_] = tile.url
+
+    pdk.settings.custom_libraries = [
+        {
+            "libraryName": "MyTileLayerLibrary",
+            "resourceUri": "https://cdn.jsdelivr.net/gh/giswqs/pydeck_myTileLayer@master/dist/bundle.js",
+        }
+    ]
+
+    for key in pydeck_dict:
+        pydeck_dict[key] = pdk.Layer("MyTileLayer", pydeck_dict[key], key)
+
+    return pydeck_dict
+
+
+def xyz_to_folium():
+    """Convert xyz tile services to folium tile layers.
+
+    Returns:
+        dict: A dictionary of folium tile layers.
+    """
+    return dict(basemap_registry("folium"))
+
+
+def xyz_to_plotly():
+    """Convert xyz tile services to plotly tile layers.
+
+    Returns:
+        dict: A dictionary of plotly tile layers.
+    """
+    return dict(basemap_registry("plotly"))
+
+
+def xyz_to_heremap():
+    """Convert xyz tile services to hermap tile layers.
+
+    Returns:
+        dict: A dictionary of heremap tile layers.
+    """
+    return dict(basemap_registry("heremap"))
 
 
 def search_qms(keywords, limit=10):
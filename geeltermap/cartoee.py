@@ -16,6 +16,7 @@ from matplotlib import cm, colors
 from matplotlib import font_manager as mfonts
 
 from .basemaps import xyz_tiles
+from .common import ee_object_info
 
 try:
 
@@ -143,7 +144,7 @@ def get_map(ee_object, proj=None, basemap=None, zoom_level=2, **kwargs):
         else:
             style = {}
 
-        props = features.first().propertyNames().getInfo()
+        props = ee_object_info(features, "property_names")["property_names"]
         if "style" in props:
             ee_object = features.style(**{"styleProperty": "style"})
         else:
@@ -208,7 +209,7 @@ def add_layer(
         else:
             style = {}
 
-        props = features.first().propertyNames().getInfo()
+        props = ee_object_info(features, "property_names")["property_names"]
         if "style" in props:
             ee_object = features.style(**{"styleProperty": "style"})
         else:
@@ -223,12 +224,13 @@ def add_layer(
         map_region = ee.Geometry.Rectangle(region).getInfo()["coordinates"]
         view_extent = (region[2], region[0], region[1], region[3])
     else:
-        map_region = ee_object.geometry(100).bounds(1).getInfo()["coordinates"]
-        # get the image bounds
+        # fetch the image bounds and band names in one request
+        info = ee_object_info(ee_object, ["bounds", "band_names"])
+        map_region = info["bounds"]
         x, y = list(zip(*map_region[0]))
         view_extent = [min(x), max(x), min(y), max(y)]
 
-        if ee_object.bandNames().getInfo() == ["vis-red", "vis-green", "vis-blue"]:
+        if info["band_names"] == ["vis-red", "vis-green", "vis-blue"]:
             warnings.warn(
                 f"The region parameter is not specified. Using the default region {map_region}. Please specify a region if you get a blank image."
             )
@@ -242,6 +244,33 @@ def add_layer(
             "or cartopy.mpl.geoaxes.GeoAxesSubplot"
         )
 
+    args = _thumb_args(map_region, dims, cmap, vis_params)
+    image = _fetch_thumbnail(ee_object, args)
+
+    ax.imshow(
+        np.squeeze(image),
+        extent=view_extent,
+        origin="upper",
+        transform=ccrs.PlateCarree(),
+        zorder=1,
+    )
+
+    return
+
+
+def _thumb_args(map_region, dims=1000, cmap=None, vis_params=None):
+    """Build the getThumbUrl parameters shared by add_layer and the gif renderer.
+
+    Args:
+        map_region (list): Coordinates of the region to render.
+        dims (list | tuple | int, optional): Dimensions of the thumbnail. Defaults to 1000.
+        cmap (str, optional): Matplotlib colormap used to colorize the image. Defaults to None.
+        vis_params (dict, optional): Visualization parameters. Defaults to None.
+
+    Returns:
+        dict: The thumbnail request parameters.
+    """
+
     args = {"format": "png", "crs": "EPSG:4326"}
     args["region"] = map_region
     if dims:
@@ -260,6 +289,20 @@ def add_layer(
 
         args = {**args, **vis_params}
 
+    return args
+
+
+def _fetch_thumbnail(ee_object, args):
+    """Download an Earth Engine thumbnail and decode it into a numpy array.
+
+    Args:
+        ee_object (ee.Image): The image to download.
+        args (dict): The thumbnail request parameters, see _thumb_args().
+
+    Returns:
+        np.ndarray: The RGB(A) image array.
+    """
+
     url = ee_object.getThumbUrl(args)
     response = requests.get(url)
     if response.status_code != 200:
@@ -273,15 +316,7 @@ def add_layer(
             [np.repeat(image[:, :, 0:1], 3, axis=2), image[:, :, -1:]], axis=2
         )
 
-    ax.imshow(
-        np.squeeze(image),
-        extent=view_extent,
-        origin="upper",
-        transform=ccrs.PlateCarree(),
-        zorder=1,
-    )
-
-    return
+    return image
 
 
 def build_palette(cmap, n=256):
@@ -1133,6 +1168,104 @@ def add_legend(
         raise Exception(e)
 
 
+# Per-process figure template used by the gif frame renderer.
+_frame_template = None
+
+
+def _build_frame_template(
+    image,
+    view_extent,
+    proj=None,
+    fig_size=(10, 10),
+    grid_interval=None,
+    north_arrow_dict={},
+    scale_bar_dict={},
+):
+    """Build the static part of a gif frame once: figure, axes, gridlines, scale bar and north arrow.
+
+    Args:
+        image (np.ndarray): The first frame, used to initialize the image artist.
+        view_extent (list): The extent of the image as [W, E, S, N].
+        proj (cartopy.crs, optional): Cartopy projection of the plot. Defaults to PlateCarree.
+        fig_size (tuple, optional): Size of the figure. Defaults to (10, 10).
+        grid_interval (float | tuple[float], optional): Gridline interval in decimal degrees. Defaults to None.
+        north_arrow_dict (dict, optional): Parameters for the north arrow. Defaults to {}.
+        scale_bar_dict (dict, optional): Parameters for the scale bar. Defaults to {}.
+
+    Returns:
+        tuple: The figure, the axes and the image artist.
+    """
+
+    if proj is None:
+        proj = ccrs.PlateCarree()
+
+    fig = plt.figure(figsize=fig_size)
+    fig.patch.set_facecolor("white")
+    ax = fig.add_subplot(1, 1, 1, projection=proj)
+
+    artist = ax.imshow(
+        np.squeeze(image),
+        extent=view_extent,
+        origin="upper",
+        transform=ccrs.PlateCarree(),
+        zorder=1,
+    )
+
+    if grid_interval is not None:
+        add_gridlines(ax, interval=grid_interval, linestyle=":")
+    if len(scale_bar_dict) > 0:
+        add_scale_bar_lite(ax, **scale_bar_dict)
+    if len(north_arrow_dict) > 0:
+        add_north_arrow(ax, **north_arrow_dict)
+
+    return fig, ax, artist
+
+
+def _init_frame_template(template_kwargs):
+    """Pool initializer that switches to the Agg backend and builds the frame template.
+
+    Args:
+        template_kwargs (dict): Keyword arguments passed to _build_frame_template().
+    """
+
+    global _frame_template
+
+    plt.switch_backend("Agg")
+    _frame_template = _build_frame_template(**template_kwargs)
+
+
+def _render_frame(frame, dpi_plot=100):
+    """Render one gif frame by swapping the image and title on the frame template.
+
+    Args:
+        frame (tuple): A tuple of (image, title, out_img).
+        dpi_plot (int, optional): The resolution in dots per inch of the plot. Defaults to 100.
+
+    Returns:
+        np.ndarray: The rendered RGB frame.
+    """
+
+    image, title, out_img = frame
+    fig, ax, artist = _frame_template
+
+    artist.set_data(np.squeeze(image))
+    ax.set_title(label=title, fontsize=15)
+
+    buf = BytesIO()
+    fig.savefig(
+        buf,
+        format="png",
+        dpi=dpi_plot,
+        bbox_inches="tight",
+        facecolor=fig.get_facecolor(),
+    )
+    buf.seek(0)
+    rendered = Image.open(buf).convert("RGB")
+    rendered.save(out_img)
+
+    return np.array(rendered)
+
+
 def get_image_collection_gif(
     ee_ic,
     out_dir,
@@ -1152,8 +1285,13 @@ def get_image_collection_gif(
     north_arrow_dict={},
     scale_bar_dict={},
     verbose=True,
+    dims=1000,
+    num_threads=8,
+    processes=None,
 ):
     """Download all the images in an image collection and use them to generate a gif/video.
+        The static decorations (gridlines, scale bar, north arrow) are built once, the frame
+        thumbnails are downloaded concurrently and the frames are rendered across a process pool.
     Args:
         ee_ic (object): ee.ImageCollection
         out_dir (str): The output directory of images and video.
@@ -1171,84 +1309,107 @@ def get_image_collection_gif(
         north_arrow_dict (dict, optional): Parameters for the north arrow. See https://geemap.org/cartoee/#geemap.cartoee.add_north_arrow. Defaults to {}.
         scale_bar_dict (dict, optional): Parameters for the scale bar. See https://geemap.org/cartoee/#geemap.cartoee.add_scale_bar. Defaults. to {}.
         verbose (bool, optional): Whether or not to print text when the program is running. Defaults to True.
+        dims (list | tuple | int, optional): Dimensions of the downloaded thumbnails. Defaults to 1000.
+        num_threads (int, optional): Number of thumbnails to download concurrently. Defaults to 8.
+        processes (int, optional): Number of processes used to render the frames. Defaults to None, which uses cpu_count - 1. Use 1 to render in the current process.
     """
 
-    from .geemap import png_to_gif, jpg_to_gif
+    import multiprocessing as mp
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    if file_format not in ["png", "jpg"]:
+        raise ValueError("The file_format must be either 'png' or 'jpg'.")
 
     out_dir = os.path.abspath(out_dir)
     if not os.path.exists(out_dir):
         os.makedirs(out_dir)
 
-    out_gif = os.path.join(out_dir, out_gif)
-
-    count = int(ee_ic.size().getInfo())
-    names = ee_ic.aggregate_array("system:index").getInfo()
-    images = ee_ic.toList(count)
+    out_gif = os.path.abspath(os.path.join(out_dir, out_gif))
 
     dates = ee_ic.aggregate_array("system:time_start")
     dates = dates.map(lambda d: ee.Date(d).format(date_format)).getInfo()
+    count = len(dates)
 
-    digits = len(str(len(dates)))
+    if count == 0:
+        raise ValueError("The image collection is empty.")
 
-    # list of file name
-    img_list = []
+    images = ee_ic.toList(count)
+    digits = len(str(count))
 
-    for i, date in enumerate(dates):
-        image = ee.Image(images.get(i))
-        name = str(i + 1).zfill(digits) + "." + file_format
-        out_img = os.path.join(out_dir, name)
-        img_list.append(out_img)
+    # The region is shared by all frames, so it is resolved only once.
+    map_region = ee.Geometry.Rectangle(region).getInfo()["coordinates"]
+    view_extent = (region[2], region[0], region[1], region[3])
+    args = _thumb_args(map_region, dims, cmap, vis_params)
 
+    def fetch(i):
         if verbose:
-            print(f"Downloading {i+1}/{count}: {name} ...")
-
-        # Size plot
-        fig = plt.figure(figsize=fig_size)
-
-        # Set the facecolor
-        fig.patch.set_facecolor("white")
-
-        # Plot image
-        ax = get_map(image, region=region, vis_params=vis_params, cmap=cmap, proj=proj)
-
-        # Add grid
-        if grid_interval is not None:
-            add_gridlines(ax, interval=grid_interval, linestyle=":")
-
-        # Add title
-        if len(plot_title) > 0:
-            ax.set_title(label=plot_title + " " + date + "\n", fontsize=15)
-
-        # Add scale bar
-        if len(scale_bar_dict) > 0:
-            add_scale_bar_lite(ax, **scale_bar_dict)
-        # Add north arrow
-        if len(north_arrow_dict) > 0:
-            add_north_arrow(ax, **north_arrow_dict)
-
-        # Save plot
-        plt.savefig(
-            fname=out_img,
-            dpi=dpi_plot,
-            bbox_inches="tight",
-            facecolor=fig.get_facecolor(),
-        )
+            print(f"Downloading {i+1}/{count} ...")
+        return _fetch_thumbnail(ee.Image(images.get(i)), args)
 
-        plt.clf()
-        plt.close()
+    with ThreadPoolExecutor(max_workers=max(1, num_threads)) as executor:
+        thumbnails = list(executor.map(fetch, range(count)))
 
-    out_gif = os.path.abspath(out_gif)
-    if file_format == "png":
-        png_to_gif(out_dir, out_gif, fps)
-    elif file_format == "jpg":
-        jpg_to_gif(out_dir, out_gif, fps)
+    img_list = [
+        os.path.join(out_dir, str(i + 1).zfill(digits) + "." + file_format)
+        for i in range(count)
+    ]
+    titles = [
+        plot_title + " " + date + "\n" if len(plot_title) > 0 else ""
+        for date in dates
+    ]
+    frames = list(zip(thumbnails, titles, img_list))
+
+    template_kwargs = {
+        "image": thumbnails[0],
+        "view_extent": view_extent,
+        "proj": proj,
+        "fig_size": fig_size,
+        "grid_interval": grid_interval,
+        "north_arrow_dict": north_arrow_dict,
+        "scale_bar_dict": scale_bar_dict,
+    }
+
+    if processes is None:
+        processes = mp.cpu_count() - 1
+    processes = max(1, min(processes, mp.cpu_count(), count))
+
+    if verbose:
+        print(f"Rendering {count} frames ...")
+
+    render = partial(_render_frame, dpi_plot=dpi_plot)
+    if processes == 1:
+        global _frame_template
+        backend = mpl.get_backend()
+        try:
+            _init_frame_template(template_kwargs)
+            rendered = [render(frame) for frame in frames]
+        finally:
+            if _frame_template is not None:
+                plt.close(_frame_template[0])
+                _frame_template = None
+            plt.switch_backend(backend)
+    else:
+        with mp.Pool(
+            processes,
+            initializer=_init_frame_template,
+            initargs=(template_kwargs,),
+        ) as pool:
+            rendered = pool.map(render, frames)
+
+    gif_frames = [Image.fromarray(frame) for frame in rendered]
+    gif_frames[0].save(
+        out_gif,
+        format="GIF",
+        append_images=gif_frames[1:],
+        save_all=True,
+        duration=1000 / fps,
+        loop=0,
+    )
     if verbose:
         print(f"GIF saved to {out_gif}")
 
     if mp4:
-
-        video_filename = out_gif.replace(".gif", ".mp4")
-
         try:
             import cv2
         except ImportError:
@@ -1256,48 +1417,18 @@ def get_image_collection_gif(
             subprocess.check_call(["python", "-m", "pip", "install", "opencv-python"])
             import cv2
 
-        # Video file name
-        output_video_file_name = os.path.join(out_dir, video_filename)
+        output_video_file_name = out_gif.replace(".gif", ".mp4")
 
-        frame = cv2.imread(img_list[0])
-        height, width, _ = frame.shape
+        height, width, _ = rendered[0].shape
         frame_size = (width, height)
-        fps_video = fps
 
-        # Make mp4
         fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-
-        # Function
-        def convert_frames_to_video(
-            input_list, output_video_file_name, fps_video, frame_size
-        ):
-            """Convert frames to video
-
-            Args:
-
-                input_list (list): Downloaded Image Name List.
-                output_video_file_name (str): The name of the video file in the image directory.
-                fps_video (int): Video frames per second.
-                frame_size (tuple): Frame size.
-            """
-            out = cv2.VideoWriter(output_video_file_name, fourcc, fps_video, frame_size)
-            num_frames = len(input_list)
-
-            for i in range(num_frames):
-                img_path = input_list[i]
-                img = cv2.imread(img_path)
-                out.write(img)
-
-            out.release()
-            cv2.destroyAllWindows()
-
-        # Use function
-        convert_frames_to_video(
-            input_list=img_list,
-            output_video_file_name=output_video_file_name,
-            fps_video=fps_video,
-            frame_size=frame_size,
-        )
+        out = cv2.VideoWriter(output_video_file_name, fourcc, fps, frame_size)
+        for frame in rendered:
+            if frame.shape[:2] != (height, width):
+                frame = cv2.resize(frame, frame_size)
+            out.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        out.release()
 
         if verbose:
             print(f"MP4 saved to {output_video_file_name}")
@@ -7,15 +7,99 @@ import numpy as np
 from bqplot import Tooltip
 from bqplot import pyplot as plt
 
-from .common import ee_to_df
-
 from typing import Union
 
 
+_chart_data_cache = {}
+_chart_data_cache_size = 32
+
+
+def _to_feature_collection(regions):
+    """Converts a geometry, feature or list of them to an ee.FeatureCollection."""
+    if isinstance(regions, ee.FeatureCollection):
+        return regions
+    elif isinstance(regions, ee.Feature):
+        return ee.FeatureCollection([regions])
+    elif isinstance(regions, ee.Geometry):
+        return ee.FeatureCollection([ee.Feature(regions)])
+    elif isinstance(regions, list):
+        return ee.FeatureCollection(
+            [r if isinstance(r, ee.Feature) else ee.Feature(r) for r in regions]
+        )
+    else:
+        raise TypeError(
+            "regions must be an ee.Geometry, ee.Feature, ee.FeatureCollection or a list of them."
+        )
+
+
+def _fetch_chart_data(
+    collection, columns=None, extra=None, page_size=2000, max_workers=4, cache=True
+):
+    """Downloads the properties of a feature collection as a DataFrame.
+        The first page, the collection size and any extra values are fetched in one request;
+        the remaining pages, if any, are fetched concurrently. Results are memoized per serialized request,
+        so re-rendering a chart does not contact Earth Engine again.
+
+    Args:
+        collection (ee.FeatureCollection): The features to download.
+        columns (list, optional): The properties to download. Defaults to None, which downloads all properties.
+        extra (dict, optional): Earth Engine objects fetched in the same request as the first page. Defaults to None.
+        page_size (int, optional): The number of features per request. Defaults to 2000.
+        max_workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
+        cache (bool, optional): Whether to use the in-memory cache. Defaults to True.
+
+    Returns:
+        tuple: The DataFrame and the dictionary of extra values.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if columns is not None:
+        collection = collection.select(list(columns), None, False)
+
+    request = {"size": collection.size(), "page": collection.toList(page_size)}
+    for key, value in (extra or {}).items():
+        request["extra_" + key] = value
+    request = ee.Dictionary(request)
+
+    cache_key = request.serialize() if cache else None
+    if cache and cache_key in _chart_data_cache:
+        df, info = _chart_data_cache[cache_key]
+        return df.copy(), dict(info)
+
+    info = request.getInfo()
+    features = info["page"]
+    if info["size"] > page_size:
+        offsets = range(page_size, info["size"], page_size)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for page in executor.map(
+                lambda offset: collection.toList(page_size, offset).getInfo(), offsets
+            ):
+                features.extend(page)
+
+    df = pd.DataFrame([f["properties"] for f in features], columns=columns)
+    extra_info = {
+        key[len("extra_") :]: value
+        for key, value in info.items()
+        if key.startswith("extra_")
+    }
+
+    if cache:
+        if len(_chart_data_cache) >= _chart_data_cache_size:
+            _chart_data_cache.pop(next(iter(_chart_data_cache)))
+        _chart_data_cache[cache_key] = (df, extra_info)
+
+    return df.copy(), dict(extra_info)
+
+
+def clear_chart_cache():
+    """Clears the DataFrames memoized by the chart functions."""
+    _chart_data_cache.clear()
+
+
 class BaseChartClass:
     """This should include everything a chart module requires to plot figures."""
 
-    def __init__(self, features, default_labels, name, **kwargs):
+    def __init__(self, features, default_labels, name, columns=None, **kwargs):
         self.ylim = None
         self.xlim = None
         self.title = ""
@@ -29,7 +113,8 @@ class BaseChartClass:
         self.width = None
         self.height = None
         self.colors = "black"
-        self.df = ee_to_df(features)
+        # Only the charted properties are downloaded, once per collection.
+        self.df, _ = _fetch_chart_data(features, columns=columns)
         self.name = name
 
         for key, value in kwargs.items():
@@ -50,8 +135,10 @@ class BaseChartClass:
 class BarChart(BaseChartClass):
     """Create Bar Chart. All histogram/bar charts can use this object."""
 
-    def __init__(self, features, default_labels, name, type="grouped", **kwargs):
-        super().__init__(features, default_labels, name, **kwargs)
+    def __init__(
+        self, features, default_labels, name, type="grouped", columns=None, **kwargs
+    ):
+        super().__init__(features, default_labels, name, columns, **kwargs)
         self.type = type
 
     def generate_tooltip(self):
@@ -113,7 +200,8 @@ class Feature_ByFeature(BarChart):
         self, features, xProperty, yProperties, name="feature.byFeature", **kwargs
     ):
         default_labels = yProperties
-        super().__init__(features, default_labels, name, **kwargs)
+        columns = [xProperty] + list(yProperties)
+        super().__init__(features, default_labels, name, columns=columns, **kwargs)
         self.x_data, self.y_data = self.get_data(xProperty, yProperties)
 
     def get_data(self, xProperty, yProperties):
@@ -129,7 +217,8 @@ class Feature_ByProperty(BarChart):
         self, features, xProperties, seriesProperty, name="feature.byProperty", **kwargs
     ):
         default_labels = None
-        super().__init__(features, default_labels, name, **kwargs)
+        columns = list(xProperties) + [seriesProperty]
+        super().__init__(features, default_labels, name, columns=columns, **kwargs)
         if "labels" in kwargs:
             raise Exception("Please remove labels in kwargs and try again.")
 
@@ -162,29 +251,24 @@ class Feature_Groups(BarChart):
         type="stacked",
         **kwargs,
     ):
-        df = ee_to_df(features)
-        self.unique_series_values = df[seriesProperty].unique().tolist()
-        default_labels = [str(x) for x in self.unique_series_values]
         self.yProperty = yProperty
-        super().__init__(features, default_labels, name, type, **kwargs)
-
-        self.new_column_names = self.get_column_names(seriesProperty, yProperty)
-        self.x_data, self.y_data = self.get_data(xProperty, self.new_column_names)
+        columns = [xProperty, yProperty, seriesProperty]
+        super().__init__(features, None, name, type, columns, **kwargs)
 
-    def get_column_names(self, seriesProperty, yProperty):
-        new_column_names = []
+        self.unique_series_values = self.df[seriesProperty].unique().tolist()
+        if "labels" not in kwargs:
+            self.labels = [str(x) for x in self.unique_series_values]
 
-        for value in self.unique_series_values:
-            sample_filter = (self.df[seriesProperty] == value).map({True: 1, False: 0})
-            column_name = str(yProperty) + "_" + str(value)
-            self.df[column_name] = self.df[yProperty] * sample_filter
-            new_column_names.append(column_name)
+        self.x_data, self.y_data = self.get_data(xProperty, yProperty, seriesProperty)
 
-        return new_column_names
-
-    def get_data(self, xProperty, new_column_names):
-        x_data = list(self.df[xProperty])
-        y_data = [self.df[x] for x in new_column_names]
+    def get_data(self, xProperty, yProperty, seriesProperty):
+        # One column per series value and one row per feature, so features sharing
+        # an x value keep their own bar. Series a feature does not belong to are NaN.
+        df = self.df.reset_index(drop=True)
+        pivot = df.pivot(columns=seriesProperty, values=yProperty)
+        pivot = pivot.reindex(index=df.index, columns=self.unique_series_values)
+        x_data = list(df[xProperty])
+        y_data = pivot.values.T
 
         return x_data, y_data
 
@@ -276,8 +360,61 @@ def feature_groups(features, xProperty, yProperty, seriesProperty, **kwargs):
         raise Exception(e)
 
 
+def _histogram_bins(min_value, max_value, maxBuckets=None, minBucketWidth=None):
+    """Computes the histogram buckets with the bucket-width rules of ui.Chart.feature.histogram.
+
+    Args:
+        min_value (float): The minimum value.
+        max_value (float): The maximum value.
+        maxBuckets (int, optional): The maximum number of buckets, rounded up to a power of 2. Defaults to None.
+        minBucketWidth (float, optional): The minimum bucket width. Defaults to None.
+
+    Returns:
+        tuple: The lower edge of the first bucket, the bucket width and the number of buckets.
+    """
+    import math
+
+    def nextPowerOf2(n):
+        return pow(2, math.ceil(math.log2(n)))
+
+    def grow_bin(bin_size, ref):
+        while bin_size < ref:
+            bin_size *= 2
+        return bin_size
+
+    data_range = max_value - min_value
+
+    if data_range <= 0:
+        initial_bin_size = 1
+    elif not maxBuckets:
+        initial_bin_size = nextPowerOf2(data_range / pow(2, 8))
+    else:
+        initial_bin_size = math.ceil(data_range / nextPowerOf2(maxBuckets))
+
+    if minBucketWidth:
+        if minBucketWidth < initial_bin_size:
+            bin_size = grow_bin(minBucketWidth, initial_bin_size)
+        else:
+            bin_size = minBucketWidth
+    else:
+        bin_size = initial_bin_size
+
+    start_bins = (math.floor(min_value / bin_size) * bin_size) - (bin_size / 2)
+    end_bins = (math.ceil(max_value / bin_size) * bin_size) + (bin_size / 2)
+    num_bins = max(1, int(round((end_bins - start_bins) / bin_size)))
+
+    return start_bins, bin_size, num_bins
+
+
 def feature_histogram(
-    features, property, maxBuckets=None, minBucketWidth=None, show=True, **kwargs
+    features,
+    property,
+    maxBuckets=None,
+    minBucketWidth=None,
+    show=True,
+    server_side=None,
+    max_client_values=5000,
+    **kwargs,
 ):
     """
     Generates a Chart from a set of features.
@@ -295,79 +432,67 @@ def feature_histogram(
                                           will be rounded up to a power of 2.
         minBucketWidth (float, optional): The minimum histogram bucket width, or null to allow any power of 2.
         show (bool, optional): Whether to show the chart. If not, it will return the bqplot chart object, which can be used to retrieve data for the chart. Defaults to True.
+        server_side (bool, optional): Whether to count the buckets with ee.Reducer.fixedHistogram on Earth Engine, so only
+            the bucket edges and counts are downloaded. If None, the buckets are counted on Earth Engine when the
+            collection has more than max_client_values features. Defaults to None.
+        max_client_values (int, optional): The maximum number of values downloaded to count the buckets locally. Defaults to 5000.
 
     Raises:
         Exception: If the provided xProperties is not a list or dict.
         Exception: If the chart fails to create.
     """
-    import math
 
     if not isinstance(features, ee.FeatureCollection):
         raise Exception("features must be an ee.FeatureCollection")
 
-    first = features.first()
-    props = first.propertyNames().getInfo()
+    # The property names and the range of the values in a single request.
+    stats = ee.Reducer.minMax().combine(ee.Reducer.count(), sharedInputs=True)
+    info = ee.Dictionary(
+        {
+            "props": features.first().propertyNames(),
+            "stats": features.reduceColumns(stats, [property]),
+        }
+    ).getInfo()
+
+    props = info["props"]
     if property not in props:
         raise Exception(
             f"property {property} not found. Available properties: {', '.join(props)}"
         )
 
-    def nextPowerOf2(n):
-        return pow(2, math.ceil(math.log2(n)))
-
-    def grow_bin(bin_size, ref):
-        while bin_size < ref:
-            bin_size *= 2
-        return bin_size
-
     try:
-
-        raw_data = pd.to_numeric(
-            pd.Series(features.aggregate_array(property).getInfo())
-        )
-        y_data = raw_data.tolist()
-
         if "ylim" in kwargs:
             min_value = kwargs["ylim"][0]
             max_value = kwargs["ylim"][1]
         else:
-            min_value = raw_data.min()
-            max_value = raw_data.max()
-
-        data_range = max_value - min_value
-
-        if not maxBuckets:
-            initial_bin_size = nextPowerOf2(data_range / pow(2, 8))
-            if minBucketWidth:
-                if minBucketWidth < initial_bin_size:
-                    bin_size = grow_bin(minBucketWidth, initial_bin_size)
-                else:
-                    bin_size = minBucketWidth
-            else:
-                bin_size = initial_bin_size
-        else:
-            initial_bin_size = math.ceil(data_range / nextPowerOf2(maxBuckets))
-            if minBucketWidth:
-                if minBucketWidth < initial_bin_size:
-                    bin_size = grow_bin(minBucketWidth, initial_bin_size)
-                else:
-                    bin_size = minBucketWidth
-            else:
-                bin_size = initial_bin_size
-
-        start_bins = (math.floor(min_value / bin_size) * bin_size) - (bin_size / 2)
-        end_bins = (math.ceil(max_value / bin_size) * bin_size) + (bin_size / 2)
-
-        if start_bins < min_value:
-            y_data.append(start_bins)
-        else:
-            y_data[y_data.index(min_value)] = start_bins
-        if end_bins > max_value:
-            y_data.append(end_bins)
+            min_value = info["stats"]["min"]
+            max_value = info["stats"]["max"]
+
+        start_bins, bin_size, num_bins = _histogram_bins(
+            min_value, max_value, maxBuckets, minBucketWidth
+        )
+        edges = start_bins + bin_size * np.arange(num_bins + 1)
+
+        if server_side is None:
+            server_side = info["stats"]["count"] > max_client_values
+
+        if server_side:
+            hist = (
+                features.reduceColumns(
+                    ee.Reducer.fixedHistogram(start_bins, edges[-1], num_bins),
+                    [property],
+                )
+                .get("histogram")
+                .getInfo()
+            )
+            counts = np.array([row[1] for row in hist])
         else:
-            y_data[y_data.index(max_value)] = end_bins
+            values = pd.to_numeric(
+                pd.Series(features.aggregate_array(property).getInfo())
+            )
+            counts, _ = np.histogram(values.dropna(), bins=edges)
 
-        num_bins = math.floor((end_bins - start_bins) / bin_size)
+        midpoints = (edges[:-1] + edges[1:]) / 2
 
         if "title" not in kwargs:
             title = ""
@@ -391,10 +516,11 @@ def feature_histogram(
         else:
             ylabel = kwargs["ylabel"]
 
-        histogram = plt.hist(
-            sample=y_data,
-            bins=num_bins,
-            axes_options={"count": {"label": ylabel}, "sample": {"label": xlabel}},
+        histogram = plt.bar(
+            x=midpoints,
+            y=counts,
+            padding=0,
+            axes_options={"y": {"label": ylabel}, "x": {"label": xlabel}},
         )
 
         if "colors" in kwargs:
@@ -410,11 +536,11 @@ def feature_histogram(
 
         if ("xlabel" in kwargs) and ("ylabel" in kwargs):
             histogram.tooltip = Tooltip(
-                fields=["midpoint", "count"],
+                fields=["x", "y"],
                 labels=[kwargs["xlabel"], kwargs["ylabel"]],
             )
         else:
-            histogram.tooltip = Tooltip(fields=["midpoint", "count"])
+            histogram.tooltip = Tooltip(fields=["x", "y"], labels=["midpoint", "count"])
 
         if show:
             plt.show()
@@ -425,82 +551,545 @@ def feature_histogram(
         raise Exception(e)
 
 
+def _label_regions(regions, labelProperty):
+    """Copies a region property to a "label" property, so system:index can also be used to label regions."""
+    return _to_feature_collection(regions).map(
+        lambda f: f.set("label", f.get(labelProperty))
+    )
+
+
+def _reduce_collection(imageCollection, regions, reducer, scale, properties=None):
+    """Reduces every image of a collection over every region with a single mapped reduceRegions.
+
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        regions (ee.FeatureCollection): The regions to reduce over.
+        reducer (ee.Reducer): The reducer. Its outputs are named after the bands.
+        scale (float): The scale in meters.
+        properties (dict, optional): A dictionary mapping property names to functions computing a value from an image.
+            The values are set on every feature reduced from that image. Defaults to None.
+
+    Returns:
+        ee.FeatureCollection: One feature per image and region.
+    """
+    properties = properties or {}
+
+    def reduce(image):
+        values = {name: func(image) for name, func in properties.items()}
+        stats = image.reduceRegions(
+            collection=regions,
+            reducer=reducer.forEach(image.bandNames()),
+            scale=scale,
+        )
+        return stats.map(lambda f: f.set(values))
+
+    return imageCollection.map(reduce).flatten()
+
+
+def _time_start(image):
+    return image.get("system:time_start")
+
+
+def _day_of_year(image):
+    return ee.Date(image.get("system:time_start")).getRelative("day", "year").add(1)
+
+
+def _year(image):
+    return ee.Date(image.get("system:time_start")).get("year")
+
+
+def _x_values(df, xProperty):
+    """Converts system:time_start values to datetimes."""
+    if xProperty == "system:time_start":
+        return pd.to_datetime(df[xProperty], unit="ms")
+    return df[xProperty]
+
+
+def _axis_labels(names, labels):
+    """Returns the labels for a list of names, given as a list or a dict mapping names to labels."""
+    if labels is None:
+        return [str(n) for n in names]
+    elif isinstance(labels, dict):
+        return [str(labels.get(n, n)) for n in names]
+    else:
+        return list(labels)
+
+
+def _plot_series(x_data, y_data, labels, chart_type="line", show=True, **kwargs):
+    """Plots one or more series sharing the same x values with bqplot.
+
+    Args:
+        x_data (list): The x values.
+        y_data (list): The y values, one list per series.
+        labels (list): The series labels.
+        chart_type (str, optional): Either "line" or "bar". Defaults to "line".
+        show (bool, optional): Whether to show the chart. If not, it will return the bqplot mark. Defaults to True.
+    """
+    fig = plt.figure(
+        title=kwargs.get("title", ""),
+        legend_location=kwargs.get("legend_location", "top-left"),
+    )
+
+    if chart_type == "bar":
+        mark = plt.bar(
+            x_data,
+            y_data,
+            labels=labels,
+            display_legend=kwargs.get("display_legend", True),
+        )
+        mark.type = kwargs.get("type", "grouped")
+        if "padding" in kwargs:
+            mark.padding = kwargs["padding"]
+    else:
+        mark = plt.plot(
+            x_data,
+            y_data,
+            labels=labels,
+            display_legend=kwargs.get("display_legend", True),
+        )
+        if "marker" in kwargs:
+            mark.marker = kwargs["marker"]
+
+    if "colors" in kwargs:
+        mark.colors = kwargs["colors"]
+    if "ylim" in kwargs:
+        plt.ylim(*kwargs["ylim"])
+    plt.xlabel(kwargs.get("xlabel", ""))
+    plt.ylabel(kwargs.get("ylabel", ""))
+
+    if "width" in kwargs:
+        fig.layout.width = kwargs["width"]
+    if "height" in kwargs:
+        fig.layout.height = kwargs["height"]
+
+    if show:
+        plt.show()
+    else:
+        return mark
+
+
 def image_byClass(
-    image, classBand, region, reducer, scale, classLabels, xLabels, **kwargs
+    image,
+    classBand,
+    region,
+    reducer=None,
+    scale=None,
+    classLabels=None,
+    xLabels=None,
+    **kwargs,
+):
+    """Generates a Chart from an image. Plots the reduced value of each band for each class of a class band.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image#uichartimagebyclass
+
+    Args:
+        image (ee.Image): The image, including the class band.
+        classBand (str): The name of the band holding the class values.
+        region (ee.Geometry | ee.Feature | ee.FeatureCollection): The region to reduce.
+        reducer (ee.Reducer, optional): A single-output reducer. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        classLabels (list | dict, optional): The labels of the classes, in ascending class order, or a dict mapping class values to labels. Defaults to None.
+        xLabels (list | dict, optional): The labels of the bands on the x-axis. Defaults to None.
+    """
+    reducer = (reducer or ee.Reducer.mean()).setOutputs(["value"])
+    region = _to_feature_collection(region).geometry()
+    bands = image.bandNames().remove(classBand)
+
+    # All bands are reduced in the same request, each grouped by class.
+    groups = bands.map(
+        lambda band: image.select([ee.String(band), classBand])
+        .reduceRegion(
+            reducer=reducer.group(groupField=1, groupName="class"),
+            geometry=region,
+            scale=scale,
+            maxPixels=1e13,
+        )
+        .get("groups")
+    )
+    info = ee.Dictionary({"bands": bands, "groups": groups}).getInfo()
+
+    rows = [
+        {"band": band, "class": g["class"], "value": g["value"]}
+        for band, band_groups in zip(info["bands"], info["groups"])
+        for g in band_groups
+    ]
+    df = pd.DataFrame(rows, columns=["band", "class", "value"])
+    df = df.pivot_table(index="class", columns="band", values="value")
+    df = df.reindex(columns=info["bands"])
+
+    return _plot_series(
+        _axis_labels(info["bands"], xLabels),
+        df.values,
+        _axis_labels(df.index.tolist(), classLabels),
+        **kwargs,
+    )
+
+
+def image_byRegion(
+    image, regions, reducer=None, scale=None, xProperty="system:index", **kwargs
+):
+    """Generates a Chart from an image. Plots the reduced value of each band for each region.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image#uichartimagebyregion
+
+    Args:
+        image (ee.Image): The image to reduce.
+        regions (ee.FeatureCollection): The regions to reduce.
+        reducer (ee.Reducer, optional): A single-output reducer. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        xProperty (str, optional): The region property used to label the x-axis. Defaults to "system:index".
+    """
+    reducer = reducer or ee.Reducer.mean()
+    stats = image.reduceRegions(
+        collection=_label_regions(regions, xProperty),
+        reducer=reducer.forEach(image.bandNames()),
+        scale=scale,
+    )
+    df, info = _fetch_chart_data(stats, extra={"bands": image.bandNames()})
+    df = df.reindex(columns=["label"] + info["bands"])
+
+    return _plot_series(
+        df["label"].astype(str).tolist(),
+        df[info["bands"]].values.T,
+        info["bands"],
+        **kwargs,
+    )
+
+
+def image_regions(
+    image,
+    regions,
+    reducer=None,
+    scale=None,
+    seriesProperty="system:index",
+    xLabels=None,
+    **kwargs,
+):
+    """Generates a Chart from an image. Plots the reduced value of each band (x-axis) with one series per region.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image#uichartimageregions
+
+    Args:
+        image (ee.Image): The image to reduce.
+        regions (ee.FeatureCollection): The regions to reduce.
+        reducer (ee.Reducer, optional): A single-output reducer. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        seriesProperty (str, optional): The region property used to label the series. Defaults to "system:index".
+        xLabels (list | dict, optional): The labels of the bands on the x-axis. Defaults to None.
+    """
+    reducer = reducer or ee.Reducer.mean()
+    stats = image.reduceRegions(
+        collection=_label_regions(regions, seriesProperty),
+        reducer=reducer.forEach(image.bandNames()),
+        scale=scale,
+    )
+    df, info = _fetch_chart_data(stats, extra={"bands": image.bandNames()})
+    df = df.reindex(columns=["label"] + info["bands"])
+
+    return _plot_series(
+        _axis_labels(info["bands"], xLabels),
+        df[info["bands"]].values,
+        df["label"].astype(str).tolist(),
+        **kwargs,
+    )
+
+
+def image_series(
+    imageCollection,
+    region,
+    reducer=None,
+    scale=None,
+    xProperty="system:time_start",
+    **kwargs,
+):
+    """Generates a Chart from an image collection. Plots the reduced value of each band over a region for every image.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image_collection#uichartimageseries
+
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        region (ee.Geometry | ee.Feature | ee.FeatureCollection): The region to reduce.
+        reducer (ee.Reducer, optional): A single-output reducer. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        xProperty (str, optional): The image property used for the x-axis. Defaults to "system:time_start".
+    """
+    reducer = reducer or ee.Reducer.mean()
+    region = ee.FeatureCollection([ee.Feature(_to_feature_collection(region).geometry())])
+    stats = _reduce_collection(
+        imageCollection,
+        region,
+        reducer,
+        scale,
+        {xProperty: lambda image: image.get(xProperty)},
+    )
+    df, info = _fetch_chart_data(
+        stats, extra={"bands": imageCollection.first().bandNames()}
+    )
+    df = df.reindex(columns=[xProperty] + info["bands"]).sort_values(xProperty)
+
+    return _plot_series(
+        _x_values(df, xProperty),
+        df[info["bands"]].values.T,
+        info["bands"],
+        **kwargs,
+    )
+
+
+def image_seriesByRegion(
+    imageCollection,
+    regions,
+    reducer=None,
+    band=None,
+    scale=None,
+    xProperty="system:time_start",
+    seriesProperty="system:index",
+    **kwargs,
 ):
-    # TODO
-    pass
+    """Generates a Chart from an image collection. Plots the reduced value of one band for every image with one series per region.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image_collection#uichartimageseriesbyregion
 
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        regions (ee.FeatureCollection): The regions to reduce.
+        reducer (ee.Reducer, optional): A single-output reducer. Defaults to None, which uses ee.Reducer.mean().
+        band (str | int, optional): The band to reduce. Defaults to None, which uses the first band.
+        scale (float, optional): The scale in meters. Defaults to None.
+        xProperty (str, optional): The image property used for the x-axis. Defaults to "system:time_start".
+        seriesProperty (str, optional): The region property used to label the series. Defaults to "system:index".
+    """
+    reducer = (reducer or ee.Reducer.mean()).setOutputs(["value"])
+    band = 0 if band is None else band
+    stats = _reduce_collection(
+        imageCollection.select([band], ["value"]),
+        _label_regions(regions, seriesProperty),
+        reducer,
+        scale,
+        {xProperty: lambda image: image.get(xProperty)},
+    )
+    df, _ = _fetch_chart_data(stats, columns=[xProperty, "label", "value"])
+    df = df.pivot_table(index=xProperty, columns="label", values="value")
+    df = df.reset_index().sort_values(xProperty)
+    series = [c for c in df.columns if c != xProperty]
+
+    return _plot_series(
+        _x_values(df, xProperty),
+        df[series].values.T,
+        [str(s) for s in series],
+        **kwargs,
+    )
 
-def image_byRegion(image, regions, reducer, scale, xProperty, **kwargs):
-    # TODO
-    pass
+
+def _doy_collection(imageCollection, startDay, endDay):
+    return imageCollection.filter(
+        ee.Filter.calendarRange(startDay, endDay, "day_of_year")
+    )
 
 
 def image_doySeries(
     imageCollection,
     region,
-    regionReducer,
-    scale,
-    yearReducer,
-    startDay,
-    endDay,
+    regionReducer=None,
+    scale=None,
+    yearReducer=None,
+    startDay=1,
+    endDay=366,
     **kwargs,
 ):
-    # TODO
-    pass
+    """Generates a Chart from an image collection. Plots the value of each band by day of year,
+    reducing the images over the region and then the values of the same day across years.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image_collection#uichartimagedoyseries
+
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        region (ee.Geometry | ee.Feature | ee.FeatureCollection): The region to reduce.
+        regionReducer (ee.Reducer, optional): A single-output reducer over the region. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        yearReducer (ee.Reducer, optional): A single-output reducer across years. Defaults to None, which uses ee.Reducer.mean().
+        startDay (int, optional): The first day of year. Defaults to 1.
+        endDay (int, optional): The last day of year. Defaults to 366.
+    """
+    regionReducer = regionReducer or ee.Reducer.mean()
+    yearReducer = (yearReducer or ee.Reducer.mean()).setOutputs(["value"])
+    imageCollection = _doy_collection(imageCollection, startDay, endDay)
+    region = ee.FeatureCollection([ee.Feature(_to_feature_collection(region).geometry())])
+    stats = _reduce_collection(
+        imageCollection, region, regionReducer, scale, {"doy": _day_of_year}
+    )
+
+    # The values are grouped by day of year on the server, one group list per band.
+    bands = imageCollection.first().bandNames()
+    groups = bands.map(
+        lambda band: stats.filter(ee.Filter.notNull([band]))
+        .reduceColumns(yearReducer.group(groupField=1, groupName="doy"), [band, "doy"])
+        .get("groups")
+    )
+    info = ee.Dictionary({"bands": bands, "groups": groups}).getInfo()
+
+    rows = [
+        {"band": band, "doy": g["doy"], "value": g["value"]}
+        for band, band_groups in zip(info["bands"], info["groups"])
+        for g in band_groups
+    ]
+    df = pd.DataFrame(rows, columns=["band", "doy", "value"])
+    df = df.pivot_table(index="doy", columns="band", values="value")
+    df = df.reindex(columns=info["bands"])
+
+    return _plot_series(df.index.tolist(), df.values.T, info["bands"], **kwargs)
 
 
 def image_doySeriesByRegion(
     imageCollection,
     bandName,
     regions,
-    regionReducer,
-    scale,
-    yearReducer,
-    seriesProperty,
-    startDay,
-    endDay,
+    regionReducer=None,
+    scale=None,
+    yearReducer=None,
+    seriesProperty="system:index",
+    startDay=1,
+    endDay=366,
     **kwargs,
 ):
-    # TODO
-    pass
+    """Generates a Chart from an image collection. Plots the value of one band by day of year with one series per region.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image_collection#uichartimagedoyseriesbyregion
+
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        bandName (str): The band to reduce.
+        regions (ee.FeatureCollection): The regions to reduce.
+        regionReducer (ee.Reducer, optional): A single-output reducer over each region. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        yearReducer (ee.Reducer, optional): A single-output reducer across years. Defaults to None, which uses ee.Reducer.mean().
+        seriesProperty (str, optional): The region property used to label the series. Defaults to "system:index".
+        startDay (int, optional): The first day of year. Defaults to 1.
+        endDay (int, optional): The last day of year. Defaults to 366.
+    """
+    regionReducer = regionReducer or ee.Reducer.mean()
+    yearReducer = (yearReducer or ee.Reducer.mean()).setOutputs(["value"])
+    imageCollection = _doy_collection(imageCollection, startDay, endDay).select(
+        [bandName], ["value"]
+    )
+    stats = _reduce_collection(
+        imageCollection,
+        _label_regions(regions, seriesProperty),
+        regionReducer,
+        scale,
+        {"doy": _day_of_year},
+    )
+    reducer = yearReducer.group(groupField=1, groupName="doy").group(
+        groupField=2, groupName="series"
+    )
+    groups = (
+        stats.filter(ee.Filter.notNull(["value"]))
+        .reduceColumns(reducer, ["value", "doy", "label"])
+        .get("groups")
+        .getInfo()
+    )
+
+    rows = [
+        {"series": str(s["series"]), "doy": g["doy"], "value": g["value"]}
+        for s in groups
+        for g in s["groups"]
+    ]
+    df = pd.DataFrame(rows, columns=["series", "doy", "value"])
+    df = df.pivot_table(index="doy", columns="series", values="value")
+
+    return _plot_series(
+        df.index.tolist(), df.values.T, df.columns.tolist(), **kwargs
+    )
 
 
 def image_doySeriesByYear(
     imageCollection,
     bandName,
     region,
-    regionReducer,
-    scale,
-    sameDayReducer,
-    startDay,
-    endDay,
+    regionReducer=None,
+    scale=None,
+    sameDayReducer=None,
+    startDay=1,
+    endDay=366,
     **kwargs,
 ):
-    # TODO
-    pass
+    """Generates a Chart from an image collection. Plots the value of one band by day of year with one series per year.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image_collection#uichartimagedoyseriesbyyear
 
+    Args:
+        imageCollection (ee.ImageCollection): The images to reduce.
+        bandName (str): The band to reduce.
+        region (ee.Geometry | ee.Feature | ee.FeatureCollection): The region to reduce.
+        regionReducer (ee.Reducer, optional): A single-output reducer over the region. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None.
+        sameDayReducer (ee.Reducer, optional): A single-output reducer for images of the same day. Defaults to None, which uses ee.Reducer.mean().
+        startDay (int, optional): The first day of year. Defaults to 1.
+        endDay (int, optional): The last day of year. Defaults to 366.
+    """
+    regionReducer = regionReducer or ee.Reducer.mean()
+    sameDayReducer = (sameDayReducer or ee.Reducer.mean()).setOutputs(["value"])
+    imageCollection = _doy_collection(imageCollection, startDay, endDay).select(
+        [bandName], ["value"]
+    )
+    region = ee.FeatureCollection([ee.Feature(_to_feature_collection(region).geometry())])
+    stats = _reduce_collection(
+        imageCollection,
+        region,
+        regionReducer,
+        scale,
+        {"doy": _day_of_year, "year": _year},
+    )
+    reducer = sameDayReducer.group(groupField=1, groupName="doy").group(
+        groupField=2, groupName="year"
+    )
+    groups = (
+        stats.filter(ee.Filter.notNull(["value"]))
+        .reduceColumns(reducer, ["value", "doy", "year"])
+        .get("groups")
+        .getInfo()
+    )
 
-def image_histogram(
-    image, region, scale, maxBuckets, minBucketWidth, maxRaw, maxPixels, **kwargs
-):
-    # TODO
-    pass
+    rows = [
+        {"year": str(y["year"]), "doy": g["doy"], "value": g["value"]}
+        for y in groups
+        for g in y["groups"]
+    ]
+    df = pd.DataFrame(rows, columns=["year", "doy", "value"])
+    df = df.pivot_table(index="doy", columns="year", values="value")
 
+    return _plot_series(
+        df.index.tolist(), df.values.T, df.columns.tolist(), **kwargs
+    )
 
-def image_regions(image, regions, reducer, scale, seriesProperty, xLabels, **kwargs):
-    # TODO
-    pass
 
+def image_histogram(
+    image,
+    region,
+    scale=None,
+    maxBuckets=None,
+    minBucketWidth=None,
+    maxRaw=None,
+    maxPixels=None,
+    **kwargs,
+):
+    """Generates a Chart from an image. Computes and plots a histogram of each band over a region.
+    Reference: https://developers.google.com/earth-engine/guides/charts_image#uichartimagehistogram
 
-def image_series(imageCollection, region, reducer, scale, xProperty, **kwargs):
-    # TODO
-    pass
+    Args:
+        image (ee.Image): The image to compute the histograms for.
+        region (ee.Geometry | ee.Feature | ee.FeatureCollection): The region to reduce.
+        scale (float, optional): The scale in meters. Defaults to None.
+        maxBuckets (int, optional): The maximum number of buckets; will be rounded up to a power of 2. Defaults to None.
+        minBucketWidth (float, optional): The minimum bucket width. Defaults to None.
+        maxRaw (int, optional): The number of values to accumulate before building the initial histogram. Defaults to None.
+        maxPixels (int, optional): The maximum number of pixels to reduce. Defaults to None.
+    """
+    hist = image.reduceRegion(
+        reducer=ee.Reducer.histogram(maxBuckets, minBucketWidth, maxRaw),
+        geometry=_to_feature_collection(region).geometry(),
+        scale=scale,
+        maxPixels=maxPixels,
+    )
+    info = ee.Dictionary({"bands": image.bandNames(), "hist": hist}).getInfo()
 
+    bands = [b for b in info["bands"] if info["hist"].get(b)]
+    x_data = [info["hist"][b]["bucketMeans"] for b in bands]
+    y_data = [info["hist"][b]["histogram"] for b in bands]
 
-def image_seriesByRegion(
-    imageCollection, regions, reducer, band, scale, xProperty, seriesProperty, **kwargs
-):
-    # TODO
-    pass
+    if len(bands) == 1:
+        return _plot_series(
+            x_data[0], y_data[0], bands, chart_type="bar", padding=0, **kwargs
+        )
+    return _plot_series(x_data, y_data, bands, **kwargs)
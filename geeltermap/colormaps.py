@@ -1,7 +1,9 @@
 """Module for commonly used colormaps and palettes for visualizing Earth Engine data.
+Palettes and RGBA lookup tables are computed once per (colormap, number of colors) and cached.
+The built-in palettes can be saved to a compact file, so later sessions load them without importing matplotlib.
 """
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+import os
+
 import numpy as np
 from box import Box
 
@@ -64,6 +66,93 @@ _palette_dict = {
 }
 
 
+# (colormap name, number of colors) -> (n, 4) uint8 RGBA array
+_lut_cache = {}
+
+# (colormap name, number of colors) -> list of hex colors without "#"
+_palette_cache = {}
+
+_builtin_loaded = False
+
+# Names of the colormaps read from the saved built-in palettes file.
+_builtin_names = []
+
+# Number of colors of the built-in palettes besides the default one.
+_builtin_classes = range(3, 13)
+
+
+def _builtin_path():
+    """Returns the path of the saved built-in palettes. The file name includes the matplotlib version,
+    so the palettes are rebuilt whenever matplotlib changes.
+    """
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        mpl_version = version("matplotlib")
+    except PackageNotFoundError:
+        mpl_version = "unknown"
+
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "geeltermap")
+    return os.path.join(cache_dir, f"colormaps-{mpl_version}.npz")
+
+
+def _load_builtin():
+    """Loads the saved built-in palettes into the caches, if the file exists."""
+    global _builtin_loaded
+
+    if _builtin_loaded:
+        return
+    _builtin_loaded = True
+
+    path = _builtin_path()
+    if not os.path.exists(path):
+        return
+    try:
+        with np.load(path) as data:
+            luts = {}
+            for key in data.files:
+                name, n_class = key.rsplit(":", 1)
+                n_class = None if n_class == "default" else int(n_class)
+                luts[(name, n_class)] = data[key]
+    except (OSError, ValueError):
+        return
+    for key, lut in luts.items():
+        _lut_cache.setdefault(key, lut)
+    _builtin_names[:] = sorted({name for name, n_class in luts if n_class is None})
+
+
+def _hex_colors(rgba):
+    """Converts an (n, 4) uint8 RGBA array to hex colors without "#"."""
+    packed = (
+        (rgba[:, 0].astype("uint32") << 16)
+        | (rgba[:, 1].astype("uint32") << 8)
+        | rgba[:, 2].astype("uint32")
+    )
+    return [f"{v:06x}" for v in packed.tolist()]
+
+
+def get_palette_lut(cmap_name, n_class=None):
+    """Get the RGBA lookup table of a matplotlib colormap. Tables are cached per (cmap_name, n_class).
+
+    Args:
+        cmap_name (str): The name of the matplotlib colormap.
+        n_class (int, optional): The number of colors. Defaults to None, which uses the colors of the colormap (usually 256).
+
+    Returns:
+        np.ndarray: An (n, 4) uint8 array.
+    """
+    key = (cmap_name, n_class)
+    if key not in _lut_cache:
+        _load_builtin()
+    if key not in _lut_cache:
+        import matplotlib.pyplot as plt
+
+        cmap = plt.get_cmap(cmap_name, n_class)
+        rgba = cmap(np.arange(cmap.N))
+        _lut_cache[key] = np.round(rgba * 255).astype("uint8")
+    return _lut_cache[key]
+
+
 def get_palette(cmap_name=None, n_class=None, hashtag=False):
     """Get a palette from a matplotlib colormap. See the list of colormaps at https://matplotlib.org/stable/tutorials/colors/colormaps.html.
 
@@ -79,12 +168,40 @@ def get_palette(cmap_name=None, n_class=None, hashtag=False):
     if cmap_name in ["ndvi", "ndwi", "dem", "dw", "esri_lulc"]:
         colors = _palette_dict[cmap_name]
     else:
-        cmap = plt.cm.get_cmap(cmap_name, n_class)
-        colors = [mpl.colors.rgb2hex(cmap(i))[1:] for i in range(cmap.N)]
+        key = (cmap_name, n_class)
+        if key not in _palette_cache:
+            _palette_cache[key] = _hex_colors(get_palette_lut(cmap_name, n_class))
+        colors = _palette_cache[key]
     if hashtag:
         colors = ["#" + i for i in colors]
 
-    return colors
+    return list(colors)
+
+
+def save_palettes(path=None):
+    """Computes the palettes of all matplotlib colormaps and saves their lookup tables to a compressed file,
+    which is loaded instead of matplotlib the next time a built-in palette is requested.
+
+    Args:
+        path (str, optional): The output file. Defaults to None, which uses the cache directory of geeltermap.
+
+    Returns:
+        str: The path of the saved file.
+    """
+    if path is None:
+        path = _builtin_path()
+
+    luts = {}
+    for cmap_name in list_colormaps():
+        luts[f"{cmap_name}:default"] = get_palette_lut(cmap_name)
+        for n_class in _builtin_classes:
+            luts[f"{cmap_name}:{n_class}"] = get_palette_lut(cmap_name, n_class)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + f".{os.getpid()}.npz"
+    np.savez_compressed(tmp_path, **luts)
+    os.replace(tmp_path, path)
+    return path
 
 
 def get_colorbar(
@@ -109,6 +226,9 @@ def get_colorbar(
         discrete (bool, optional): Whether to create a discrete colormap.
         return_fig (bool, optional): Whether to return the figure. Defaults to False.
     """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     hexcodes = [i if i[0] == "#" else "#" + i for i in colors]
     fig, ax = plt.subplots(figsize=(width, height))
     if discrete:
@@ -131,6 +251,8 @@ def list_colormaps(add_extra=False, lowercase=False):
     Returns:
         list: The list of colormap names.
     """
+    import matplotlib.pyplot as plt
+
     result = plt.colormaps()
     if add_extra:
         result += ["dem", "ndvi", "ndwi"]
@@ -166,6 +288,9 @@ def plot_colormap(
         font_size (int, optional): Font size of the text. Defaults to 12.
         return_fig (bool, optional): Whether to return the figure. Defaults to False.
     """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(width, height))
     col_map = plt.get_cmap(cmap)
 
@@ -194,6 +319,8 @@ def plot_colormaps(width=8.0, height=0.4):
         width (float, optional): Width of the colormap. Defaults to 8.0.
         height (float, optional): Height of the colormap. Defaults to 0.4.
     """
+    import matplotlib.pyplot as plt
+
     cmap_list = list_colormaps()
     nrows = len(cmap_list)
     fig, axes = plt.subplots(nrows=nrows, figsize=(width, height * nrows))
@@ -217,15 +344,42 @@ def plot_colormaps(width=8.0, height=0.4):
     plt.show()
 
 
-for index, cmap_name in enumerate(list_colormaps()):
-    if index < len(list_colormaps()):
-        color_dict = {}
-        color_dict["default"] = get_palette(cmap_name)
-        for i in range(3, 13):
-            name = "n" + str(i).zfill(2)
-            colors = get_palette(cmap_name, i)
-            color_dict[name] = colors
-        _palette_dict[cmap_name] = color_dict
+_palettes = None
 
 
-palettes = Box(_palette_dict, frozen_box=True)
+def _build_palettes():
+    """Builds the Box of all palettes, with the default palette and 3 to 12 colors for each colormap.
+    Matplotlib is only imported when the palettes have not been saved with save_palettes().
+    """
+    global _palettes
+
+    if _palettes is None:
+        _load_builtin()
+        # The cache may already hold colormaps computed with matplotlib, so only the saved file
+        # tells whether every colormap is available without it.
+        names = list(_builtin_names)
+        if not names:
+            names = list_colormaps()
+            try:
+                save_palettes()
+            except OSError:
+                pass
+
+        palette_dict = dict(_palette_dict)
+        for cmap_name in names:
+            color_dict = {}
+            color_dict["default"] = get_palette(cmap_name)
+            for i in _builtin_classes:
+                name = "n" + str(i).zfill(2)
+                color_dict[name] = get_palette(cmap_name, i)
+            palette_dict[cmap_name] = color_dict
+        _palettes = Box(palette_dict, frozen_box=True)
+
+    return _palettes
+
+
+def __getattr__(name):
+    # The palettes are built the first time they are used instead of when the module is imported.
+    if name == "palettes":
+        return _build_palettes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1211,10 +1211,11 @@ def csv_to_ee(
         ee_object: An ee.Geometry object
     """
 
-    geojson = csv_to_geojson(
-        in_csv, latitude=latitude, longitude=longitude, encoding=encoding
-    )
-    fc = geojson_to_ee(geojson, geodesic=geodesic)
+    import pandas as pd
+
+    in_csv = github_raw_url(in_csv)
+    df = pd.read_csv(in_csv, encoding=encoding)
+    fc = df_to_ee(df, latitude=latitude, longitude=longitude, geodesic=geodesic)
     return fc
 
 
@@ -1452,7 +1453,8 @@ def shp_to_geojson(in_shp, filename=None, **kwargs):
 
 
 def shp_to_ee(in_shp, **kwargs):
-    """Converts a shapefile to Earth Engine objects. Note that the CRS of the shapefile must be EPSG:4326
+    """Converts a shapefile to Earth Engine objects. If geopandas is installed, the shapefile is reprojected
+        to EPSG:4326 and converted in memory with gdf_to_ee(). Otherwise the CRS of the shapefile must be EPSG:4326.
 
     Args:
         in_shp (str): File path to a shapefile.
@@ -1461,6 +1463,17 @@ def shp_to_ee(in_shp, **kwargs):
         object: Earth Engine objects representing the shapefile.
     """
     # ee_initialize()
+    try:
+        import geopandas as gpd
+
+        gdf = gpd.read_file(in_shp, **kwargs)
+        return gdf_to_ee(gdf)
+    except ImportError:
+        pass
+    except Exception as e:
+        print(e)
+        return
+
     try:
         if "encoding" in kwargs:
             json_data = shp_to_geojson(in_shp, encoding=kwargs.pop("encoding"))
@@ -3109,7 +3122,7 @@ def get_image_collection_thumbnails(
         print(e)
 
 
-def netcdf_to_ee(nc_file, var_names, band_names=None, lon="lon", lat="lat"):
+def netcdf_to_ee(nc_file, var_names, band_names=None, lon="lon", lat="lat", **kwargs):
     """
     Creates an ee.Image from netCDF variables band_names that are read from nc_file. Currently only supports variables in a regular longitude/latitude grid (EPSG:4326).
 
@@ -3119,9 +3132,13 @@ def netcdf_to_ee(nc_file, var_names, band_names=None, lon="lon", lat="lat"):
         band_names (list, optional): if given, the bands are renamed to band_names. Defaults to the original var_names
         lon (str, optional): the name of the longitude variable in the netCDF file. Defaults to "lon"
         lat (str, optional): the name of the latitude variable in the netCDF file. Defaults to "lat"
+        **kwargs: Additional keyword arguments passed to numpy_to_ee(), such as decimals and strategy.
+
+    Raises:
+        ValueError: If the grid is too large to embed in a request, see numpy_to_ee().
 
     Returns:
-        image: An ee.Image
+        image: An ee.Image, or the path to a COG file if strategy="cog" is passed.
 
     """
     try:
@@ -3193,18 +3210,84 @@ def netcdf_to_ee(nc_file, var_names, band_names=None, lon="lon", lat="lat"):
             band_names = var_names
 
         image = numpy_to_ee(
-            data_np, "EPSG:4326", transform=transform, band_names=band_names
+            data_np, "EPSG:4326", transform=transform, band_names=band_names, **kwargs
         )
 
         return image
 
+    except ValueError:
+        raise
     except Exception as e:
         print(e)
 
 
-def numpy_to_ee(np_array, crs=None, transform=None, transformWkt=None, band_names=None):
+def estimate_ee_payload(np_array, decimals=None, nodata=-9999):
+    """Estimates the number of bytes a numpy array adds to an Earth Engine request when embedded with numpy_to_ee().
+
+    Args:
+        np_array (np.array): The 2D or 3D numpy array.
+        decimals (int, optional): The number of decimals the values are rounded to. Defaults to None.
+        nodata (float, optional): The value NaNs are replaced with. Defaults to -9999.
+
+    Returns:
+        int: The estimated payload size in bytes.
+    """
+    import numpy as np
+
+    flat = np.asarray(np_array).ravel()
+    if flat.size == 0:
+        return 0
+    # encode an evenly spaced sample and extrapolate
+    step = max(1, flat.size // 10000)
+    sample = _compact_values(flat[::step], decimals, nodata)[0]
+    per_value = len(json.dumps(sample)) / len(sample)
+    return int(per_value * flat.size)
+
+
+def _compact_values(np_array, decimals=None, nodata=-9999):
+    """Converts an array to nested lists with the shortest JSON representation.
+        Values are rounded to the given decimals, integral floats are written as integers
+        and NaNs are replaced with the nodata value.
+
+    Args:
+        np_array (np.array): The input array.
+        decimals (int, optional): The number of decimals to keep. Defaults to None.
+        nodata (float, optional): The value NaNs are replaced with. Defaults to -9999.
+
+    Returns:
+        tuple: The nested list and whether any NaN was replaced.
+    """
+    import numpy as np
+
+    has_nodata = False
+    if np.issubdtype(np_array.dtype, np.floating):
+        invalid = ~np.isfinite(np_array)
+        has_nodata = bool(invalid.any())
+        if has_nodata:
+            np_array = np.where(invalid, nodata, np_array)
+        if decimals is not None:
+            np_array = np.round(np_array, decimals)
+        if np.all(np.mod(np_array, 1) == 0):
+            np_array = np_array.astype("int64")
+    return np_array.tolist(), has_nodata
+
+
+def numpy_to_ee(
+    np_array,
+    crs=None,
+    transform=None,
+    transformWkt=None,
+    band_names=None,
+    decimals=None,
+    nodata=-9999,
+    strategy="auto",
+    max_payload=8e6,
+    out_cog=None,
+):
     """
     Creates an ee.Image from a 3D numpy array where each 2D numpy slice is added to a band, and a geospatial transform that indicates where to put the data. If the np_array is already 2D only, then it is only a one-band image.
+    The array is embedded in the request graph as one compact constant per band. With the "auto" strategy, arrays whose
+    estimated payload exceeds max_payload raise a ValueError; write them to a COG with strategy="cog" and upload it as an asset.
 
     Args:
         np_array (np.array): the 3D (or 2D) numpy array to add to an image
@@ -3212,9 +3295,18 @@ def numpy_to_ee(np_array, crs=None, transform=None, transformWkt=None, band_name
         transform (list): The transform between projected coordinates and the base coordinate system, specified as a 2x3 affine transform matrix in row-major order: [xScale, xShearing, xTranslation, yShearing, yScale, yTranslation]. May not specify both this and 'transformWkt'.
         transformWkt (str): The transform between projected coordinates and the base coordinate system, specified as a WKT string. May not specify both this and 'transform'.
         band_names (str or list, optional): The list of names for the bands. The default names are 'constant', and 'constant_1', 'constant_2', etc.
+        decimals (int, optional): Round the values to this number of decimals to shrink the payload. Defaults to None.
+        nodata (float, optional): The value NaNs are replaced with before they are masked. Defaults to -9999.
+        strategy (str, optional): One of "auto", "inline" or "cog". "inline" embeds the array whatever its size. "cog" writes
+            the array to a COG file instead of creating an ee.Image and is only used when requested explicitly. Defaults to "auto".
+        max_payload (float, optional): The largest payload size in bytes the "auto" strategy embeds in a request. Defaults to 8e6.
+        out_cog (str, optional): The COG file path used by the "cog" strategy. Defaults to a temporary file.
+
+    Raises:
+        ValueError: If the strategy is "auto" and the estimated payload exceeds max_payload.
 
     Returns:
-        image: An ee.Image
+        image: An ee.Image, or the path to the COG file if the "cog" strategy is used.
 
     """
     import numpy as np
@@ -3228,6 +3320,47 @@ def numpy_to_ee(np_array, crs=None, transform=None, transformWkt=None, band_name
     if band_names and not isinstance(band_names, (list, str)):
         print("Band names must be a str or list")
         return
+    if strategy not in ["auto", "inline", "cog"]:
+        print("The strategy must be one of auto, inline or cog.")
+        return
+
+    if len(np_array.shape) < 3:
+        np_array = np_array[np.newaxis, :, :]
+    dimz, dimx, dimy = np_array.shape
+
+    if strategy == "auto":
+        payload = estimate_ee_payload(np_array, decimals, nodata)
+        if payload <= max_payload:
+            strategy = "inline"
+        else:
+            raise ValueError(
+                f"The array adds about {payload / 1e6:.1f} MB to the request, more than max_payload "
+                f"({max_payload / 1e6:.1f} MB). Use decimals to shrink it, or strategy='cog' to write "
+                "it to a COG file that can be uploaded as an Earth Engine asset."
+            )
+
+    if strategy == "cog":
+        import rasterio
+
+        if transform is None:
+            print("The cog strategy requires a transform.")
+            return
+        if out_cog is None:
+            out_cog = temp_file_path(".tif")
+        profile = dict(
+            driver="GTiff",
+            dtype=str(np_array.dtype),
+            count=dimz,
+            height=dimy,
+            width=dimx,
+            crs=crs,
+            transform=rasterio.Affine(*transform),
+        )
+        numpy_to_cog(np.transpose(np_array, (0, 2, 1)), out_cog, profile=profile)
+        print(
+            f"The array was saved to {out_cog}, which can be uploaded as an Earth Engine asset."
+        )
+        return out_cog
 
     try:
 
@@ -3235,29 +3368,18 @@ def numpy_to_ee(np_array, crs=None, transform=None, transformWkt=None, band_name
         coords = ee.Image.pixelCoordinates(projection).floor().int32()
         x = coords.select("x")
         y = coords.select("y")
-        s = np_array.shape
-        if len(s) < 3:
-            dimx = s[0]
-            dimy = s[1]
-        else:
-            dimx = s[1]
-            dimy = s[2]
-            dimz = s[0]
 
         coord_mask = x.gte(0).And(y.gte(0)).And(x.lt(dimx)).And(y.lt(dimy))
         coords = coords.updateMask(coord_mask)
 
-        def list_to_ee(a_list):
-            ee_data = ee.Array(a_list)
-            image = ee.Image(ee_data).arrayGet(coords)
-            return image
-
-        if len(s) < 3:
-            image = list_to_ee(np_array.tolist())
-        else:
-            image = list_to_ee(np_array[0].tolist())
-            for z in np.arange(1, dimz):
-                image = image.addBands(list_to_ee(np_array[z].tolist()))
+        bands = []
+        for z in range(dimz):
+            values, has_nodata = _compact_values(np_array[z], decimals, nodata)
+            band = ee.Image(ee.Array(values)).arrayGet(coords)
+            if has_nodata:
+                band = band.updateMask(band.neq(nodata))
+            bands.append(band)
+        image = ee.Image.cat(bands)
 
         if band_names:
             image = image.rename(band_names)
@@ -5360,6 +5482,9 @@ def cog_tile(
         tuple: Returns the COG Tile layer URL and bounds.
     """
 
+    if _is_local_raster(url):
+        return _local_cog_tile(url, bands, **kwargs)
+
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
     url = get_direct_url(url)
 
@@ -5403,6 +5528,58 @@ def cog_tile(
     return r["tiles"][0]
 
 
+def _local_cog_tile(path, bands=None, **kwargs):
+    """Serves a local raster with the in-process tile server, accepting the TiTiler arguments of cog_tile.
+
+    Args:
+        path (str): The path to the local raster file.
+        bands (list, optional): A list of band indexes (1-based) or band names. Defaults to None.
+
+    Returns:
+        str: The XYZ tile URL template.
+    """
+    from .local_tiles import local_tile_url
+
+    client = _local_tile_client(path)
+    band_names = client.band_names
+
+    if bands is None:
+        bands = kwargs.get("bidx")
+    if bands is None:
+        band = [1, 2, 3] if len(band_names) >= 3 else [1]
+    elif all(isinstance(x, int) for x in bands):
+        band = list(bands)
+    elif all(isinstance(x, str) for x in bands):
+        band = [band_names.index(x) + 1 for x in bands]
+    else:
+        raise ValueError("Bands must be a list of integers or strings.")
+    if len(band) == 1:
+        band = band[0]
+
+    palette = kwargs.get("palette", kwargs.get("colormap_name"))
+    if isinstance(palette, str):
+        palette = get_palette_colors(palette, hashtag=True)
+
+    if "rescale" in kwargs:
+        vmin, vmax = [float(v) for v in str(kwargs["rescale"]).split(",")[:2]]
+    else:
+        stats = cog_stats(path)
+        indexes = band if isinstance(band, list) else [band]
+        names = [band_names[b - 1] for b in indexes]
+        vmin = min([stats[s]["percentile_2"] for s in names])
+        vmax = max([stats[s]["percentile_98"] for s in names])
+
+    url, _ = local_tile_url(
+        client,
+        band=band,
+        palette=palette,
+        vmin=vmin,
+        vmax=vmax,
+        nodata=kwargs.get("nodata"),
+    )
+    return url
+
+
 def cog_mosaic(
     links,
     titiler_endpoint=None,
@@ -5528,6 +5705,10 @@ def cog_bounds(url, titiler_endpoint=None, timeout=300):
         list: A list of values representing [left, bottom, right, top]
     """
 
+    if _is_local_raster(url):
+        bottom, top, left, right = _local_tile_client(url).bounds()
+        return [left, bottom, right, top]
+
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
     url = get_direct_url(url)
 
@@ -5572,6 +5753,9 @@ def cog_bands(url, titiler_endpoint=None, timeout=300):
         list: A list of band names
     """
 
+    if _is_local_raster(url):
+        return _local_tile_client(url).band_names
+
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
     url = get_direct_url(url)
     r = requests.get(
@@ -5595,9 +5779,13 @@ def cog_stats(url, titiler_endpoint=None, timeout=300):
         timeout (int, optional): Timeout in seconds. Defaults to 300.
 
     Returns:
-        list: A dictionary of band statistics.
+        list: A dictionary of band statistics. Local files return the same keys as TiTiler
+            (min, max, mean, std, percentile_2 and percentile_98) for each band.
     """
 
+    if _is_local_raster(url):
+        return _local_tile_client(url).metadata()["bands"]
+
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
     url = get_direct_url(url)
     r = requests.get(
@@ -5663,6 +5851,9 @@ def cog_pixel_value(
         list: A dictionary of band info.
     """
 
+    if _is_local_raster(url):
+        return local_tile_pixel_value(lon, lat, _local_tile_client(url))
+
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
     url = get_direct_url(url)
     titiler_endpoint = check_titiler_endpoint(titiler_endpoint)
@@ -6224,6 +6415,35 @@ def stac_pixel_value(
         return result
 
 
+def _is_local_raster(source):
+    """Checks whether a source is an existing local raster file rather than a URL."""
+    return isinstance(source, str) and os.path.isfile(os.path.expanduser(source))
+
+
+def _local_tile_client(source):
+    """Returns a tile client for a local raster path, a LocalTileClient or a localtileserver TileClient.
+
+    Args:
+        source (str | TileClient | LocalTileClient): A local raster file path or tile client object.
+
+    Raises:
+        ValueError: If source is not a tile client object or a local raster file path.
+
+    Returns:
+        LocalTileClient | TileClient: The tile client.
+    """
+    from .local_tiles import LocalTileClient, get_tile_client
+
+    if isinstance(source, str):
+        return get_tile_client(source)
+    elif isinstance(source, LocalTileClient):
+        return source
+    elif type(source).__name__ == "TileClient":
+        return source
+    else:
+        raise ValueError("source must be a string or TileClient object.")
+
+
 def local_tile_pixel_value(
     lon,
     lat,
@@ -6262,7 +6482,7 @@ def local_tile_vmin_vmax(
     """Get vmin and vmax from COG.
 
     Args:
-        source (str | TileClient): A local COG file path or TileClient object.
+        source (str | TileClient | LocalTileClient): A local COG file path or tile client object.
         bands (str | list, optional): A list of band names. Defaults to None.
 
     Raises:
@@ -6271,15 +6491,7 @@ def local_tile_vmin_vmax(
     Returns:
         tuple: A tuple of vmin and vmax.
     """
-    check_package("localtileserver", "https://github.com/banesullivan/localtileserver")
-    from localtileserver import TileClient
-
-    if isinstance(source, str):
-        tile_client = TileClient(source)
-    elif isinstance(source, TileClient):
-        tile_client = source
-    else:
-        raise ValueError("source must be a string or TileClient object.")
+    tile_client = _local_tile_client(source)
 
     stats = tile_client.metadata()["bands"]
     bandnames = list(stats.keys())
@@ -6304,20 +6516,12 @@ def local_tile_bands(source):
     """Get band names from COG.
 
     Args:
-        source (str | TileClient): A local COG file path or TileClient
+        source (str | TileClient | LocalTileClient): A local COG file path or tile client object.
 
     Returns:
         list: A list of band names.
     """
-    check_package("localtileserver", "https://github.com/banesullivan/localtileserver")
-    from localtileserver import TileClient
-
-    if isinstance(source, str):
-        tile_client = TileClient(source)
-    elif isinstance(source, TileClient):
-        tile_client = source
-    else:
-        raise ValueError("source must be a string or TileClient object.")
+    tile_client = _local_tile_client(source)
 
     bandnames = list(tile_client.metadata()["bands"].keys())
     return bandnames
@@ -6996,6 +7200,406 @@ def zonal_stats_by_group(
 zonal_statistics_by_group = zonal_stats_by_group
 
 
+class _ParquetStreamWriter:
+    """Writes tables to a Parquet file as they arrive, with a fixed list of columns.
+    The schema is inferred before the writer is opened: tables are buffered until every column has a non-null type,
+    integer columns are promoted to float64 (Earth Engine numbers are doubles), and columns that are still empty after
+    max_buffered tables are written as strings. A column with no values counts as empty whatever its type, so the
+    float64 NaN placeholders pandas creates for missing properties do not fix the type. Tables are cast safely, so a
+    value that does not fit the schema raises a TypeError instead of being truncated.
+    """
+
+    def __init__(self, filename, columns, metadata=None, max_buffered=10):
+        """Initialize the _ParquetStreamWriter object.
+
+        Args:
+            filename (str): The output parquet file path.
+            columns (list): The column names, in output order.
+            metadata (dict, optional): The schema metadata. Defaults to None.
+            max_buffered (int, optional): The maximum number of tables buffered to infer the schema. Defaults to 10.
+        """
+        self.filename = filename
+        self.columns = list(columns)
+        self.metadata = metadata
+        self.max_buffered = max_buffered
+        self.buffer = []
+        self.schema = None
+        self.writer = None
+
+    def _types(self):
+        import pyarrow as pa
+
+        types = {name: pa.null() for name in self.columns}
+        for table in self.buffer:
+            for field, column in zip(table.schema, table.columns):
+                dtype = field.type
+                if column.null_count == len(column):
+                    dtype = pa.null()
+                elif pa.types.is_integer(dtype):
+                    dtype = pa.float64()
+                elif pa.types.is_large_string(dtype):
+                    dtype = pa.string()
+                current = types[field.name]
+                if pa.types.is_null(current):
+                    types[field.name] = dtype
+                elif not pa.types.is_null(dtype) and dtype != current:
+                    raise TypeError(
+                        f"Column {field.name!r} has conflicting types {current} and {dtype}."
+                    )
+        return types
+
+    def _open(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = self._types()
+        fields = [
+            pa.field(name, pa.string() if pa.types.is_null(dtype) else dtype)
+            for name, dtype in types.items()
+        ]
+        self.schema = pa.schema(fields, metadata=self.metadata)
+        self.writer = pq.ParquetWriter(self.filename, self.schema)
+        buffer, self.buffer = self.buffer, []
+        for table in buffer:
+            self._write(table)
+
+    def _write(self, table):
+        import pyarrow as pa
+
+        try:
+            table = table.select(self.schema.names).cast(self.schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+            raise TypeError(
+                f"The data does not match the schema inferred for {self.filename}: {e}"
+            ) from e
+        self.writer.write_table(table)
+
+    def write(self, table):
+        """Writes a pyarrow.Table that contains all the columns."""
+        import pyarrow as pa
+
+        if self.writer is not None:
+            self._write(table)
+            return
+
+        self.buffer.append(table)
+        resolved = not any(pa.types.is_null(t) for t in self._types().values())
+        if resolved or len(self.buffer) >= self.max_buffered:
+            self._open()
+
+    def close(self):
+        """Writes the buffered tables and closes the file."""
+        if self.writer is None and self.buffer:
+            self._open()
+        if self.writer is not None:
+            self.writer.close()
+
+    def abort(self):
+        """Closes the file without writing the buffered tables and removes it."""
+        self.buffer = []
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+
+def _morton_order(x, y, bits=16):
+    """Sort points along a Z-order (Morton) curve so that neighbouring points end up close in the ordering.
+
+    Args:
+        x (array-like): The x coordinates.
+        y (array-like): The y coordinates.
+        bits (int, optional): The number of bits used to quantize each coordinate. Defaults to 16.
+
+    Returns:
+        np.ndarray: The indices that sort the points along the curve.
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    if x.size == 0:
+        return np.array([], dtype="int64")
+
+    def quantize(values):
+        span = values.max() - values.min()
+        if span == 0:
+            return np.zeros(values.shape, dtype="uint64")
+        scaled = (values - values.min()) / span * (2**bits - 1)
+        return scaled.astype("uint64")
+
+    qx, qy = quantize(x), quantize(y)
+    codes = np.zeros(x.shape, dtype="uint64")
+    for bit in range(bits):
+        codes |= ((qx >> np.uint64(bit)) & np.uint64(1)) << np.uint64(2 * bit)
+        codes |= ((qy >> np.uint64(bit)) & np.uint64(1)) << np.uint64(2 * bit + 1)
+
+    return np.argsort(codes, kind="stable")
+
+
+def zonal_stats_batch(
+    in_value_raster,
+    in_zone_vector,
+    out_file_path=None,
+    statistics_type="MEAN",
+    scale=None,
+    crs=None,
+    tile_scale=1.0,
+    batch_size=500,
+    max_workers=4,
+    max_retries=3,
+    by_group=False,
+    decimal_places=0,
+    denominator=1.0,
+    verbose=True,
+    **kwargs,
+):
+    """Computes zonal statistics for large feature collections in spatially coherent batches.
+        The zones are ordered along a Z-order curve of their centroids and split into batches that
+        are reduced concurrently. A batch that fails is retried with a doubled tileScale. Results are
+        streamed to a csv or parquet file as batches complete, so the full table is never held in memory.
+
+    Args:
+        in_value_raster (object): An ee.Image or ee.ImageCollection that contains the values on which to calculate a statistic.
+        in_zone_vector (object): An ee.FeatureCollection that defines the zones.
+        out_file_path (str, optional): Output file path. The file type can be csv or parquet. Defaults to zonal_stats.csv in the current working directory.
+        statistics_type (str | ee.Reducer, optional): Statistic type to be calculated, see zonal_stats(). If by_group is True, it can be either 'SUM' or 'PERCENTAGE'. Defaults to 'MEAN'.
+        scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
+        crs (str, optional): The projection to work in. Defaults to None.
+        tile_scale (float, optional): The initial tileScale used for each batch. Defaults to 1.0.
+        batch_size (int, optional): The number of zones per batch. Must not exceed 5000. Defaults to 500.
+        max_workers (int, optional): The number of batches sent to Earth Engine concurrently. Keep it well below the
+            concurrent request quota of your account. Defaults to 4.
+        max_retries (int, optional): The number of times a failed batch is retried with a higher tileScale. Defaults to 3.
+        by_group (bool, optional): Whether to summarize the area of each class of an integer image, as in zonal_stats_by_group(). Defaults to False.
+        decimal_places (int, optional): The number of decimal places used when by_group is True. Defaults to 0.
+        denominator (float, optional): To convert area units when by_group is True. Defaults to 1.0.
+        verbose (bool, optional): Whether to print the progress. Defaults to True.
+
+    Raises:
+        ValueError: If a batch returns columns other than the zone properties and the reducer outputs.
+        TypeError: If a column has values of incompatible types in different batches of a parquet output.
+
+    Returns:
+        str: The path to the output file. Integer columns of a parquet output are written as float64.
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(in_value_raster, ee.ImageCollection):
+        in_value_raster = in_value_raster.toBands()
+
+    if not isinstance(in_value_raster, ee.Image):
+        raise TypeError("The input raster must be an ee.Image.")
+
+    if not isinstance(in_zone_vector, ee.FeatureCollection):
+        raise TypeError("The input zone data must be an ee.FeatureCollection.")
+
+    if batch_size > 5000:
+        raise ValueError("batch_size must not exceed 5000.")
+
+    if out_file_path is None:
+        out_file_path = os.path.join(os.getcwd(), "zonal_stats.csv")
+
+    filename = check_file_path(out_file_path)
+    filetype = os.path.splitext(filename)[1][1:].lower()
+    if filetype not in ["csv", "parquet"]:
+        raise ValueError("The file type must be either csv or parquet.")
+
+    if scale is None:
+        scale = in_value_raster.projection().nominalScale().multiply(10)
+
+    if by_group:
+        if statistics_type.upper() not in ["SUM", "PERCENTAGE"]:
+            raise ValueError("statistics_type must be either SUM or PERCENTAGE.")
+        band_name = in_value_raster.bandNames().get(0)
+        image = ee.Image.pixelArea().divide(denominator).addBands(in_value_raster)
+        reducer = ee.Reducer.sum().group(groupField=1, groupName="group")
+        hist = in_value_raster.reduceRegion(
+            ee.Reducer.frequencyHistogram(),
+            geometry=in_zone_vector.geometry(),
+            bestEffort=True,
+            crs=crs,
+            scale=scale,
+        )
+        class_values = ee.Dictionary(hist.get(band_name)).keys()
+    else:
+        image = in_value_raster
+        if isinstance(statistics_type, ee.Reducer):
+            reducer = statistics_type
+        else:
+            allowed_statistics = {
+                "COUNT": ee.Reducer.count(),
+                "MEAN": ee.Reducer.mean(),
+                "MEAN_UNWEIGHTED": ee.Reducer.mean().unweighted(),
+                "MAXIMUM": ee.Reducer.max(),
+                "MEDIAN": ee.Reducer.median(),
+                "MINIMUM": ee.Reducer.min(),
+                "MODE": ee.Reducer.mode(),
+                "STD": ee.Reducer.stdDev(),
+                "MIN_MAX": ee.Reducer.minMax(),
+                "SUM": ee.Reducer.sum(),
+                "VARIANCE": ee.Reducer.variance(),
+            }
+            if statistics_type.upper() not in allowed_statistics:
+                raise ValueError(
+                    "The statistics type must be one of the following: {}".format(
+                        ", ".join(allowed_statistics.keys())
+                    )
+                )
+            reducer = allowed_statistics[statistics_type.upper()]
+        class_values = ee.List([])
+
+    # Zone ids, centroids, property names, band names and reducer outputs are fetched in one request.
+    centroids = in_zone_vector.map(
+        lambda f: ee.Feature(
+            None,
+            {
+                "xy": f.geometry().centroid(1).coordinates(),
+                "props": f.propertyNames(),
+            },
+        )
+    )
+    info = ee.Dictionary(
+        {
+            "ids": in_zone_vector.aggregate_array("system:index"),
+            "xy": centroids.aggregate_array("xy"),
+            "props": centroids.aggregate_array("props").flatten().distinct(),
+            "classes": class_values,
+            "bands": image.bandNames(),
+            "outputs": reducer.getOutputs(),
+        }
+    ).getInfo()
+
+    ids = np.array(info["ids"])
+    xy = np.array(info["xy"], dtype="float64").reshape(-1, 2)
+    order = _morton_order(xy[:, 0], xy[:, 1])
+    batches = [
+        ids[order[i : i + batch_size]].tolist() for i in range(0, len(ids), batch_size)
+    ]
+    class_names = [f"Class_{c}" for c in sorted(info["classes"], key=float)]
+
+    # The output columns are known before any batch completes, so they do not depend on batch order.
+    columns = ["system:index"] + [c for c in info["props"] if c != "system:index"]
+    if by_group:
+        stat_columns = class_names + ["Class_sum"]
+    elif len(info["bands"]) == 1:
+        stat_columns = info["outputs"]
+    elif len(info["outputs"]) == 1:
+        stat_columns = info["bands"]
+    else:
+        stat_columns = [f"{b}_{o}" for b in info["bands"] for o in info["outputs"]]
+    columns += [c for c in stat_columns if c not in columns]
+
+    def to_rows(features):
+        rows = []
+        for feature in features:
+            row = {"system:index": feature["id"], **feature["properties"]}
+            if by_group:
+                groups = row.pop("groups", None) or []
+                values = {
+                    f"Class_{int(g['group'])}": round(g["sum"], decimal_places)
+                    for g in groups
+                }
+                total = sum(values.values())
+                for name in class_names:
+                    value = values.get(name, 0)
+                    if statistics_type.upper() == "PERCENTAGE" and total:
+                        value = value / total
+                    row[name] = value
+                row["Class_sum"] = total
+            rows.append(row)
+        return rows
+
+    def run_batch(batch_ids):
+        zones = in_zone_vector.filter(ee.Filter.inList("system:index", batch_ids))
+        batch_tile_scale = tile_scale
+        for attempt in range(max_retries + 1):
+            try:
+                result = image.reduceRegions(
+                    collection=zones,
+                    reducer=reducer,
+                    scale=scale,
+                    crs=crs,
+                    tileScale=batch_tile_scale,
+                )
+                result = result.select([".*"], None, False)
+                return to_rows(result.getInfo()["features"])
+            except Exception as e:
+                if attempt == max_retries:
+                    raise e
+                batch_tile_scale = min(batch_tile_scale * 2, 16)
+                time.sleep(2**attempt)
+
+    writer = None
+    if filetype == "parquet":
+        writer = _ParquetStreamWriter(filename, columns)
+    failed = []
+    done = 0
+    start = time.time()
+
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(run_batch, batch_ids): index
+                for index, batch_ids in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as e:
+                    failed.append(index)
+                    if verbose:
+                        print(f"Batch {index + 1} failed: {e}")
+                    continue
+
+                df = pd.DataFrame(rows)
+                unknown = [c for c in df.columns if c not in columns]
+                if unknown:
+                    raise ValueError(
+                        f"Batch {index + 1} returned unexpected columns: {unknown}"
+                    )
+                df = df.reindex(columns=columns)
+
+                if filetype == "csv":
+                    df.to_csv(filename, mode="a", header=(done == 0), index=False)
+                else:
+                    import pyarrow as pa
+
+                    writer.write(pa.Table.from_pandas(df, preserve_index=False))
+
+                done += 1
+                if verbose:
+                    elapsed = time.time() - start
+                    print(
+                        f"Processed batch {done}/{len(batches)} ({len(rows)} zones, {elapsed:.1f}s elapsed)"
+                    )
+        if writer is not None:
+            writer.close()
+    except BaseException:
+        # Do not leave a truncated file behind.
+        if writer is not None:
+            writer.abort()
+        elif os.path.exists(filename):
+            os.remove(filename)
+        raise
+
+    if failed:
+        warnings.warn(
+            f"{len(failed)} of {len(batches)} batches failed after {max_retries} retries."
+        )
+
+    return filename
+
+
 def vec_area(fc):
     """Calculate the area (m2) of each each feature in a feature collection.
 
@@ -7102,42 +7706,268 @@ def image_band_names(img):
     return img.bandNames()
 
 
-def image_date(img, date_format="YYYY-MM-dd"):
-    """Retrieves the image acquisition date.
+_ee_info_cache = {}
+_ee_info_cache_size = 256
+
+
+def ee_object_info(ee_object, keys=None, cache=True):
+    """Retrieves metadata about an Earth Engine object in a single request.
+        The requested facts are combined into one ee.Dictionary and fetched with one getInfo() call.
+        Results are memoized per serialized object, so repeated calls for the same object
+        only request the keys that have not been fetched yet.
 
     Args:
-        img (object): ee.Image
-        date_format (str, optional): The date format to use. Defaults to 'YYYY-MM-dd'.
+        ee_object (ee.Image | ee.ImageCollection | ee.Geometry | ee.Feature | ee.FeatureCollection): The Earth Engine object.
+        keys (list, optional): The facts to retrieve. It can be any of "band_names", "band_types", "band_scales",
+            "bounds", "property_names", and "size".
+            Defaults to None, which retrieves "band_names" and "bounds" for images and image collections, and
+            "property_names" and "bounds" for vector objects.
+        cache (bool, optional): Whether to use the in-memory cache. Defaults to True.
 
     Returns:
-        str: A string representing the acquisition of the image.
+        dict: The requested metadata. "bounds" is returned as the coordinates of the bounding polygon.
     """
-    return ee.Date(img.get("system:time_start")).format(date_format)
 
+    is_image = isinstance(ee_object, (ee.Image, ee.ImageCollection))
+    is_vector = isinstance(ee_object, (ee.Geometry, ee.Feature, ee.FeatureCollection))
 
-def image_dates(img_col, date_format="YYYY-MM-dd"):
-    """Get image dates of all images in an ImageCollection.
+    if not (is_image or is_vector):
+        raise TypeError(
+            "The ee_object must be an ee.Image, ee.ImageCollection, ee.Geometry, ee.Feature or ee.FeatureCollection."
+        )
 
-    Args:
-        img_col (object): ee.ImageCollection
-        date_format (str, optional): A pattern, as described at http://joda-time.sourceforge.net/apidocs/org/joda/time/format/DateTimeFormat.html; if omitted will use ISO standard date formatting. Defaults to 'YYYY-MM-dd'.
+    if keys is None:
+        keys = ["band_names", "bounds"] if is_image else ["property_names", "bounds"]
+    elif isinstance(keys, str):
+        keys = [keys]
+
+    allowed_keys = [
+        "band_names",
+        "band_types",
+        "band_scales",
+        "bounds",
+        "property_names",
+        "size",
+    ]
+    for key in keys:
+        if key not in allowed_keys:
+            raise ValueError(f"The key must be one of {allowed_keys}.")
+
+    if is_vector:
+        ee_object = ee.FeatureCollection(ee_object)
+
+    cache_key = ee_object.serialize() if cache else None
+    info = dict(_ee_info_cache.get(cache_key, {})) if cache else {}
+    missing = [key for key in keys if key not in info]
+
+    if missing:
+        if isinstance(ee_object, ee.ImageCollection):
+            first = ee_object.first()
+        elif isinstance(ee_object, ee.FeatureCollection):
+            first = ee.Feature(ee_object.first())
+        else:
+            first = ee_object
+
+        request = {}
+        for key in missing:
+            if key == "band_names":
+                if not is_image:
+                    raise ValueError("band_names is only available for images.")
+                request[key] = ee.Image(first).bandNames()
+            elif key in ["band_types", "band_scales"]:
+                if not is_image:
+                    raise ValueError(f"{key} is only available for images.")
+                image = ee.Image(first)
+                if key == "band_types":
+                    request[key] = image.bandTypes()
+                else:
+                    request[key] = image.bandNames().map(
+                        lambda b: image.select([b]).projection().nominalScale()
+                    )
+            elif key == "property_names":
+                request[key] = first.propertyNames()
+            elif key == "bounds":
+                request[key] = ee_object.geometry(100).bounds(1).coordinates()
+            elif key == "size":
+                if isinstance(ee_object, ee.Image):
+                    request[key] = ee.Number(1)
+                else:
+                    request[key] = ee_object.size()
 
-    Returns:
-        object: ee.List
-    """
-    dates = img_col.aggregate_array("system:time_start")
-    new_dates = dates.map(lambda d: ee.Date(d).format(date_format))
-    return new_dates
+        info.update(ee.Dictionary(request).getInfo())
 
+        if cache:
+            if len(_ee_info_cache) >= _ee_info_cache_size:
+                _ee_info_cache.pop(next(iter(_ee_info_cache)))
+            _ee_info_cache[cache_key] = info
 
-def image_area(img, region=None, scale=None, denominator=1.0):
-    """Calculates the area of an image.
+    return {key: info[key] for key in keys}
 
-    Args:
-        img (object): ee.Image
-        region (object, optional): The region over which to reduce data. Defaults to the footprint of the image's first band.
-        scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
-        denominator (float, optional): The denominator to use for converting size from square meters to other units. Defaults to 1.0.
+
+def prefetch_image_metadata(ee_object):
+    """Fetches the band names, types and scales of an image in a background thread, so they are cached by
+        ee_object_info before they are needed, e.g., when a map layer is clicked.
+
+    Args:
+        ee_object (ee.Image | ee.ImageCollection): The image or image collection.
+    """
+    import threading
+
+    def fetch():
+        try:
+            ee_object_info(ee_object, ["band_names", "band_types", "band_scales"])
+        except Exception:
+            pass
+
+    threading.Thread(target=fetch, daemon=True).start()
+
+
+def sample_location(
+    ee_object, latlon=None, region=None, reducer=None, scale=None, band_names=None
+):
+    """Retrieves the band values of an image at a point, or reduced over a region, in a single request.
+        Band names come from the ee_object_info cache, so once they are cached each call costs one round trip.
+
+    Args:
+        ee_object (ee.Image | ee.ImageCollection): The image to sample. Image collections are mosaicked.
+        latlon (list, optional): The [lat, lon] of the point to sample. Defaults to None.
+        region (ee.Geometry, optional): The region to reduce instead of sampling a point. Defaults to None.
+        reducer (ee.Reducer, optional): The reducer used over the region. Defaults to None, which uses ee.Reducer.mean().
+        scale (float, optional): The scale in meters. Defaults to None, which uses the scale of the first band for regions.
+        band_names (list, optional): The band names, if already known. Defaults to None.
+
+    Raises:
+        ValueError: If there is no data at the location.
+
+    Returns:
+        dict: The band names, the band values and the [lon, lat] coordinates of the point or of the region centroid.
+    """
+    if band_names is None:
+        band_names = ee_object_info(ee_object, ["band_names"])["band_names"]
+
+    if isinstance(ee_object, ee.ImageCollection):
+        image = ee_object.mosaic()
+    else:
+        image = ee_object
+
+    if region is not None:
+        if scale is None:
+            scale = ee_object_info(ee_object, ["band_scales"])["band_scales"][0]
+        if reducer is None:
+            reducer = ee.Reducer.mean()
+        info = ee.Dictionary(
+            {
+                "values": image.reduceRegion(
+                    reducer=reducer, geometry=region, scale=scale, bestEffort=True
+                ),
+                "centroid": region.centroid(1).coordinates(),
+            }
+        ).getInfo()
+        values = info["values"]
+        coordinates = info["centroid"]
+    else:
+        coordinates = [latlon[1], latlon[0]]
+        values = image.reduceRegion(
+            reducer=ee.Reducer.first(),
+            geometry=ee.Geometry.Point(coordinates),
+            scale=scale,
+        ).getInfo()
+
+    band_values = [values.get(b) for b in band_names]
+    if all(v is None for v in band_values):
+        raise ValueError("No data for the location.")
+
+    return {
+        "band_names": band_names,
+        "values": band_values,
+        "coordinates": coordinates,
+    }
+
+
+_time_series_cache = {}
+_time_series_cache_size = 256
+
+
+def pixel_time_series(
+    collection, latlon, bands=None, scale=None, precision=5, cache=True
+):
+    """Retrieves the time series of all bands of an image collection at a point with a single getRegion request.
+        Results are memoized per collection and point rounded to the given precision, so clicking the same
+        pixel again does not contact Earth Engine.
+
+    Args:
+        collection (ee.ImageCollection): The image collection.
+        latlon (list): The [lat, lon] of the point.
+        bands (list, optional): The bands to retrieve. Defaults to None, which retrieves all bands.
+        scale (float, optional): The scale in meters. Defaults to None, which uses the scale of the first band of each image.
+        precision (int, optional): The number of decimals the coordinates are rounded to. Defaults to 5.
+        cache (bool, optional): Whether to use the in-memory cache. Defaults to True.
+
+    Returns:
+        pd.DataFrame: One row per image, indexed by acquisition time, with the image id and one column per band.
+    """
+    import pandas as pd
+
+    if not isinstance(collection, ee.ImageCollection):
+        raise TypeError("collection must be an ee.ImageCollection.")
+
+    if bands is not None:
+        collection = collection.select(bands)
+
+    lat, lon = round(latlon[0], precision), round(latlon[1], precision)
+    cache_key = (collection.serialize(), lat, lon, scale) if cache else None
+    if cache and cache_key in _time_series_cache:
+        return _time_series_cache[cache_key].copy()
+
+    rows = collection.getRegion(ee.Geometry.Point([lon, lat]), scale).getInfo()
+    df = pd.DataFrame(rows[1:], columns=rows[0])
+    df["time"] = pd.to_datetime(df["time"], unit="ms")
+    df = df.drop(columns=["longitude", "latitude"]).set_index("time").sort_index()
+
+    if cache:
+        if len(_time_series_cache) >= _time_series_cache_size:
+            _time_series_cache.pop(next(iter(_time_series_cache)))
+        _time_series_cache[cache_key] = df
+
+    return df.copy()
+
+
+def image_date(img, date_format="YYYY-MM-dd"):
+    """Retrieves the image acquisition date.
+
+    Args:
+        img (object): ee.Image
+        date_format (str, optional): The date format to use. Defaults to 'YYYY-MM-dd'.
+
+    Returns:
+        str: A string representing the acquisition of the image.
+    """
+    return ee.Date(img.get("system:time_start")).format(date_format)
+
+
+def image_dates(img_col, date_format="YYYY-MM-dd"):
+    """Get image dates of all images in an ImageCollection.
+
+    Args:
+        img_col (object): ee.ImageCollection
+        date_format (str, optional): A pattern, as described at http://joda-time.sourceforge.net/apidocs/org/joda/time/format/DateTimeFormat.html; if omitted will use ISO standard date formatting. Defaults to 'YYYY-MM-dd'.
+
+    Returns:
+        object: ee.List
+    """
+    dates = img_col.aggregate_array("system:time_start")
+    new_dates = dates.map(lambda d: ee.Date(d).format(date_format))
+    return new_dates
+
+
+def image_area(img, region=None, scale=None, denominator=1.0):
+    """Calculates the area of an image.
+
+    Args:
+        img (object): ee.Image
+        region (object, optional): The region over which to reduce data. Defaults to the footprint of the image's first band.
+        scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
+        denominator (float, optional): The denominator to use for converting size from square meters to other units. Defaults to 1.0.
 
     Returns:
         object: ee.Dictionary
@@ -7486,22 +8316,33 @@ def image_stats_by_zone(
     scale=None,
     reducer="MEAN",
     bestEffort=True,
+    bands=None,
+    tile_size=None,
     **kwargs,
 ):
     """Calculate statistics for an image by zone.
+        All zones, bands and reducers are computed with a single grouped reduction
+        (reducer.repeat().group() over image.addBands(zones)) and fetched in one request.
 
     Args:
         image (ee.Image): The image to calculate statistics for.
-        zones (ee.Image): The zones to calculate statistics for.
+        zones (ee.Image): The zones to calculate statistics for. Only the first band is used.
         out_csv (str, optional): The path to the output CSV file. Defaults to None.
-        labels (list, optional): The list of zone labels to use for the output CSV. Defaults to None.
+        labels (list | dict, optional): The zone labels to use for the output. A list is matched to the sorted zone values, a dict maps zone values to labels. Defaults to None.
         region (ee.Geometry, optional): The region over which to reduce data. Defaults to the footprint of zone image.
         scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
-        reducer (str | ee.Reducer, optional): The reducer to use. It can be one of MEAN, MAXIMUM, MINIMUM, MODE, STD, MIN_MAX, SUM, VARIANCE. Defaults to MEAN.
+        reducer (str | ee.Reducer | list, optional): The reducer to use. It can be one of MEAN, MAXIMUM, MINIMUM, MODE, STD, MIN_MAX, SUM, VARIANCE, COUNT,
+            an ee.Reducer, or a list of them to compute several statistics at once. Defaults to MEAN.
         bestEffort (bool, optional): If the polygon would contain too many pixels at the given scale, compute and use a larger scale which would allow the operation to succeed. Defaults to True.
+        bands (list, optional): The bands of the image to calculate statistics for. Defaults to None, which uses all bands.
+        tile_size (float, optional): If set, the region is split into square tiles of this size (in meters) that are reduced in parallel
+            with reduceRegions and merged client-side. Only MEAN, SUM, MINIMUM, MAXIMUM, MIN_MAX and COUNT can be merged. Defaults to None.
 
     Returns:
-        str | pd.DataFrame: The path to the output CSV file or a pandas DataFrame.
+        str | pd.DataFrame: The path to the output CSV file or a pandas DataFrame. For a single reducer
+            and a single band it has one row per zone with the columns zone[, label], stat. Otherwise it has
+            one row per zone and band, with the columns zone[, label], band and one column per statistic
+            (e.g. mean, max).
     """
     import pandas as pd
 
@@ -7526,46 +8367,138 @@ def image_stats_by_zone(
         "MIN_MAX": ee.Reducer.minMax(),
         "SUM": ee.Reducer.sum(),
         "VARIANCE": ee.Reducer.variance(),
+        "COUNT": ee.Reducer.count(),
+    }
+    # statistics that can be merged across tiles, with the pandas aggregation to use.
+    # Tile means are multiplied by the tile pixel count before summing.
+    mergeable_stats = {
+        "MEAN": {"mean": "sum"},
+        "MAXIMUM": {"max": "max"},
+        "MINIMUM": {"min": "min"},
+        "MIN_MAX": {"min": "min", "max": "max"},
+        "SUM": {"sum": "sum"},
+        "COUNT": {"count": "sum"},
     }
 
-    if isinstance(reducer, str):
-        if reducer.upper() not in allowed_stats:
+    single_reducer = not isinstance(reducer, list)
+    if single_reducer:
+        reducer = [reducer]
+
+    reducers = []
+    for item in reducer:
+        if isinstance(item, str):
+            if item.upper() not in allowed_stats:
+                raise ValueError(
+                    "reducer must be one of: {}".format(", ".join(allowed_stats.keys()))
+                )
+            if tile_size is not None and item.upper() not in mergeable_stats:
+                raise ValueError(
+                    "tile_size only supports the reducers: {}".format(
+                        ", ".join(mergeable_stats.keys())
+                    )
+                )
+            reducers.append(item.upper())
+        elif isinstance(item, ee.Reducer):
+            if tile_size is not None:
+                raise ValueError("tile_size only supports reducers given by name.")
+            reducers.append(item)
+        else:
             raise ValueError(
                 "reducer must be one of: {}".format(", ".join(allowed_stats.keys()))
             )
-        else:
-            reducer = allowed_stats[reducer.upper()]
-    elif isinstance(reducer, ee.Reducer):
-        pass
+
+    # the mean of the tiles is weighted by the pixel count of each tile
+    if tile_size is not None and "MEAN" in reducers and "COUNT" not in reducers:
+        reducers.append("COUNT")
+        drop_count = True
     else:
-        raise ValueError(
-            "reducer must be one of: {}".format(", ".join(allowed_stats.keys()))
-        )
+        drop_count = False
+
+    combined = None
+    for item in reducers:
+        item = allowed_stats[item] if isinstance(item, str) else item
+        combined = item if combined is None else combined.combine(item, "", True)
+
+    if bands is None:
+        bands = ee_object_info(image, "band_names")["band_names"]
+    elif isinstance(bands, str):
+        bands = [bands]
 
-    values = image_value_list(zones, region=region)
-    values = values.map(lambda x: ee.Number.parse(x))
+    grouped = combined.repeat(len(bands)).group(
+        groupField=len(bands), groupName="zone"
+    )
+    stack = image.select(bands).addBands(zones.select(0).rename("zones"))
 
-    def get_stats(value):
-        img = image.updateMask(zones.eq(ee.Number(value)))
-        kwargs["reducer"] = reducer
+    if tile_size is None:
+        kwargs["reducer"] = grouped
         kwargs["scale"] = scale
         kwargs["geometry"] = region
         kwargs["bestEffort"] = bestEffort
-        stat = img.reduceRegion(**kwargs)
-        return ee.Image().set({"zone": value}).set({"stat": stat.values().get(0)})
-
-    collection = ee.ImageCollection(values.map(lambda x: get_stats(x)))
-    keys = collection.aggregate_array("zone").getInfo()
-    values = collection.aggregate_array("stat").getInfo()
+        groups = [stack.reduceRegion(**kwargs).get("groups")]
+    else:
+        if region is None:
+            region = zones.geometry()
+        tiles = (
+            region.coveringGrid(ee.Projection("EPSG:3857"), tile_size)
+            .filterBounds(region)
+            .map(lambda f: f.intersection(region, 1))
+        )
+        for key in ["bestEffort", "maxPixels", "geometry"]:
+            kwargs.pop(key, None)
+        kwargs["reducer"] = grouped
+        kwargs["scale"] = scale
+        kwargs["collection"] = tiles
+        groups = stack.reduceRegions(**kwargs).aggregate_array("groups")
+
+    groups = ee.List(groups).getInfo()
+
+    rows = []
+    for tile_groups in groups:
+        for group in tile_groups or []:
+            for index, band in enumerate(bands):
+                row = {"zone": group["zone"], "band": band}
+                for key, value in group.items():
+                    if key == "zone":
+                        continue
+                    row[key] = value[index] if isinstance(value, list) else value
+                rows.append(row)
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        df = pd.DataFrame(columns=["zone", "band"])
+
+    if tile_size is not None and len(groups) > 1 and not df.empty:
+        if "mean" in df.columns:
+            df["mean"] = df["mean"] * df["count"]
+        aggregations = {}
+        for item in reducers:
+            aggregations.update(mergeable_stats[item])
+        aggregations = {k: v for k, v in aggregations.items() if k in df.columns}
+        df = df.groupby(["zone", "band"], as_index=False).agg(aggregations)
+        if "mean" in df.columns:
+            df["mean"] = df["mean"] / df["count"]
+
+    if drop_count and "count" in df.columns:
+        df = df.drop(columns=["count"])
+
+    df = df.sort_values(["zone", "band"], kind="stable").reset_index(drop=True)
+
+    # keep the original zone[, label], stat schema for a single reducer and band
+    stat_columns = [c for c in df.columns if c not in ("zone", "band")]
+    if single_reducer and len(bands) == 1 and len(stat_columns) <= 1:
+        df = df.drop(columns=["band"])
+        df = df.rename(columns={c: "stat" for c in stat_columns})
+        if "stat" not in df.columns:
+            df["stat"] = pd.Series(dtype=float)
 
-    if labels is not None and isinstance(labels, list):
-        if len(labels) != len(keys):
-            warnings.warn("labels are not the same length as keys, ignoring labels.")
-            df = pd.DataFrame({"zone": keys, "stat": values})
+    if labels is not None:
+        zone_values = sorted(df["zone"].unique())
+        if isinstance(labels, dict):
+            df.insert(1, "label", df["zone"].map(labels))
+        elif isinstance(labels, list) and len(labels) == len(zone_values):
+            df.insert(1, "label", df["zone"].map(dict(zip(zone_values, labels))))
         else:
-            df = pd.DataFrame({"zone": keys, "label": labels, "stat": values})
-    else:
-        df = pd.DataFrame({"zone": keys, "stat": values})
+            warnings.warn("labels are not the same length as keys, ignoring labels.")
 
     if out_csv is not None:
         check_file_path(out_csv)
@@ -7743,6 +8676,148 @@ def fishnet(
         return grids
 
 
+def tile_cell_size(
+    scale, bands=1, dtype="float32", max_tile_size=32, max_tile_dim=10000
+):
+    """Computes the largest square cell size (in meters) that can be downloaded from Earth Engine as a single tile.
+
+    Args:
+        scale (float): The pixel size of the download in meters.
+        bands (int, optional): The number of bands of the image. Defaults to 1.
+        dtype (str, optional): The data type of the download, e.g., uint8, int16, float32. Defaults to "float32".
+        max_tile_size (float, optional): The maximum tile size in MB. Defaults to the Earth Engine download limit (32 MB).
+        max_tile_dim (int, optional): The maximum tile width/height in pixels. Defaults to the Earth Engine download limit (10000).
+
+    Returns:
+        float: The cell size in meters.
+    """
+    import numpy as np
+
+    bytes_per_pixel = np.dtype(dtype).itemsize * bands
+    pixels = int(math.sqrt(max_tile_size * 1024 * 1024 / bytes_per_pixel))
+    # keep a safety margin for the GeoTIFF headers and the edge pixels
+    pixels = min(int(pixels * 0.95), max_tile_dim)
+    return pixels * scale
+
+
+def create_grid(
+    data,
+    cell_size=None,
+    shape="square",
+    equal_area=False,
+    intersect=True,
+    scale=None,
+    bands=1,
+    dtype="float32",
+    max_tile_size=32,
+    max_tile_dim=10000,
+    return_ee=False,
+    **kwargs,
+):
+    """Creates a square or hexagonal grid covering a site boundary. The grid is generated locally
+        with vectorized NumPy/shapely operations, so no Earth Engine requests are needed to build it.
+
+    Args:
+        data (str | gpd.GeoDataFrame | shapely.Geometry | ee.Geometry | ee.Feature | ee.FeatureCollection): The site boundary.
+            It can be a file path, HTTP URL, GeoDataFrame, shapely geometry (EPSG:4326) or Earth Engine object.
+        cell_size (float, optional): The cell size, in degrees, or in meters if equal_area is True. For hexagons it is the
+            distance between two opposite edges. Defaults to None, which derives it from the tile limits.
+        shape (str, optional): The cell shape, either "square" or "hexagon". Defaults to "square".
+        equal_area (bool, optional): If True, the cells are built in meters in a Lambert azimuthal equal-area projection
+            centered on the site, so all cells have the same area. Defaults to False.
+        intersect (bool, optional): If True, only the cells intersecting the boundary are kept. Defaults to True.
+        scale (float, optional): The pixel size in meters of the download the grid is used for. If cell_size is None,
+            the cell size is derived from scale and the tile limits with tile_cell_size(), and equal_area is set to True.
+        bands (int, optional): The number of bands of the image to download. Defaults to 1.
+        dtype (str, optional): The data type of the download. Defaults to "float32".
+        max_tile_size (float, optional): The maximum tile size in MB. Defaults to 32.
+        max_tile_dim (int, optional): The maximum tile width/height in pixels. Defaults to 10000.
+        return_ee (bool, optional): If True, return an ee.FeatureCollection instead of a GeoDataFrame. Defaults to False.
+
+    Returns:
+        gpd.GeoDataFrame | ee.FeatureCollection: The grid cells in EPSG:4326, with id, west, south, east and north columns.
+    """
+    import geopandas as gpd
+    import numpy as np
+    import shapely
+    from shapely.geometry import shape as to_shape
+
+    if shape not in ["square", "hexagon"]:
+        raise ValueError("shape must be either square or hexagon.")
+
+    if cell_size is None:
+        if scale is None:
+            raise ValueError("Either cell_size or scale must be specified.")
+        cell_size = tile_cell_size(scale, bands, dtype, max_tile_size, max_tile_dim)
+        equal_area = True
+
+    if isinstance(data, str):
+        boundary = gpd.read_file(data, **kwargs)
+    elif isinstance(data, gpd.GeoDataFrame):
+        boundary = data
+    elif isinstance(data, shapely.Geometry):
+        boundary = gpd.GeoDataFrame(geometry=[data], crs="EPSG:4326")
+    elif isinstance(data, (ee.Geometry, ee.Feature, ee.FeatureCollection)):
+        geometry = ee.FeatureCollection(data).geometry().getInfo()
+        boundary = gpd.GeoDataFrame(
+            geometry=[to_shape(geometry)], crs="EPSG:4326"
+        )
+    else:
+        raise ValueError(
+            "data must be a file path, GeoDataFrame, shapely geometry, ee.Geometry, ee.Feature, or ee.FeatureCollection."
+        )
+
+    if boundary.crs is None:
+        boundary = boundary.set_crs("EPSG:4326")
+    boundary = boundary.to_crs("EPSG:4326")
+
+    if equal_area:
+        centroid = shapely.union_all(boundary.geometry.values).centroid
+        lon, lat = centroid.x, centroid.y
+        crs = f"+proj=laea +lat_0={lat} +lon_0={lon} +datum=WGS84 +units=m +no_defs"
+        boundary = boundary.to_crs(crs)
+    else:
+        crs = "EPSG:4326"
+
+    site = shapely.union_all(boundary.geometry.values)
+    xmin, ymin, xmax, ymax = site.bounds
+
+    if shape == "square":
+        xs = np.arange(xmin, xmax, cell_size)
+        ys = np.arange(ymin, ymax, cell_size)
+        x0, y0 = (a.ravel() for a in np.meshgrid(xs, ys))
+        cells = shapely.box(x0, y0, x0 + cell_size, y0 + cell_size)
+    else:
+        # pointy-top hexagons, cell_size is the flat-to-flat width
+        radius = cell_size / math.sqrt(3)
+        xs = np.arange(xmin, xmax + cell_size, cell_size)
+        ys = np.arange(ymin, ymax + 1.5 * radius, 1.5 * radius)
+        cx, cy = np.meshgrid(xs, ys)
+        cx = cx + (np.arange(len(ys)) % 2)[:, None] * cell_size / 2
+        angles = np.radians(np.arange(30, 390, 60) % 360)
+        ring = np.stack([np.cos(angles), np.sin(angles)], axis=1) * radius
+        ring = np.vstack([ring, ring[:1]])
+        centers = np.stack([cx.ravel(), cy.ravel()], axis=1)
+        cells = shapely.polygons(centers[:, None, :] + ring[None, :, :])
+
+    if intersect:
+        shapely.prepare(site)
+        cells = cells[shapely.intersects(site, cells)]
+
+    grid = gpd.GeoDataFrame(geometry=cells, crs=crs).to_crs("EPSG:4326")
+    bounds = shapely.bounds(grid.geometry.values)
+    grid.insert(0, "id", np.arange(len(grid)))
+    grid.insert(1, "west", bounds[:, 0])
+    grid.insert(2, "south", bounds[:, 1])
+    grid.insert(3, "east", bounds[:, 2])
+    grid.insert(4, "north", bounds[:, 3])
+
+    if return_ee:
+        return gdf_to_ee(grid, geodesic=False)
+    else:
+        return grid
+
+
 def extract_values_to_points(
     in_fc,
     image,
@@ -7822,6 +8897,145 @@ def extract_values_to_points(
         return result
 
 
+def sample_points(
+    image,
+    points,
+    x="longitude",
+    y="latitude",
+    id_column=None,
+    scale=None,
+    crs=None,
+    tile_scale=1,
+    batch_size=1000,
+    max_workers=4,
+    max_retries=3,
+    verbose=False,
+):
+    """Samples image values at many points with batched, concurrent sampleRegions requests.
+        Only the coordinates and the row position of each point are sent to Earth Engine. The sampled
+        values are joined back to the input table locally, so the input order, index and id columns are kept.
+
+    Args:
+        image (ee.Image | ee.ImageCollection): The image to sample. An ee.ImageCollection is converted with toBands().
+        points (pd.DataFrame | gpd.GeoDataFrame | str): The points to sample. A DataFrame must contain the x and y columns
+            in EPSG:4326; a GeoDataFrame is reprojected to EPSG:4326. A file path is read with geopandas.
+        x (str, optional): The column containing the longitude when points is a DataFrame. Defaults to "longitude".
+        y (str, optional): The column containing the latitude when points is a DataFrame. Defaults to "latitude".
+        id_column (str, optional): A column that uniquely identifies the points. It is checked for duplicates. Defaults to None.
+        scale (float, optional): A nominal scale in meters of the projection to sample in. Defaults to None.
+        crs (str, optional): The projection to sample in. Defaults to None.
+        tile_scale (float, optional): The initial tileScale used for each batch. Defaults to 1.
+        batch_size (int, optional): The number of points per request. Defaults to 1000.
+        max_workers (int, optional): The number of requests sent to Earth Engine concurrently. Defaults to 4.
+        max_retries (int, optional): The number of times a failed batch is retried with a doubled tileScale. Defaults to 3.
+        verbose (bool, optional): Whether to print the progress. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The input table with one float64 column per band, a "sampled" column that is False for points
+            that fall on masked pixels or in failed batches, and a "batch" column with the batch number of each point.
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(image, ee.ImageCollection):
+        image = image.toBands()
+
+    if not isinstance(image, ee.Image):
+        raise TypeError("The image must be an instance of ee.Image.")
+
+    if isinstance(points, str):
+        import geopandas as gpd
+
+        points = gpd.read_file(points)
+
+    if hasattr(points, "geometry") and hasattr(points, "to_crs"):
+        geometry = points.geometry
+        if points.crs is not None:
+            geometry = geometry.to_crs("EPSG:4326")
+        if not (geometry.geom_type == "Point").all():
+            geometry = geometry.representative_point()
+        xy = np.column_stack([geometry.x.to_numpy(), geometry.y.to_numpy()])
+    elif isinstance(points, pd.DataFrame):
+        if x not in points.columns or y not in points.columns:
+            raise ValueError(f"The columns {x} and {y} must be in the DataFrame.")
+        xy = points[[x, y]].to_numpy(dtype="float64")
+    else:
+        raise TypeError("points must be a DataFrame, a GeoDataFrame or a file path.")
+
+    if id_column is not None and points[id_column].duplicated().any():
+        raise ValueError(f"The values of {id_column} must be unique.")
+
+    band_names = ee_object_info(image, ["band_names"])["band_names"]
+    n = len(xy)
+    batches = [np.arange(i, min(i + batch_size, n)) for i in range(0, n, batch_size)]
+
+    def run_batch(rows):
+        coords = ee.List(xy[rows].tolist())
+        collection = ee.FeatureCollection(
+            coords.zip(ee.List(rows.tolist())).map(
+                lambda item: ee.Feature(
+                    ee.Geometry.Point(ee.List(item).get(0)),
+                    {"_row": ee.List(item).get(1)},
+                )
+            )
+        )
+        batch_tile_scale = tile_scale
+        for attempt in range(max_retries + 1):
+            try:
+                samples = image.sampleRegions(
+                    collection=collection,
+                    properties=["_row"],
+                    scale=scale,
+                    projection=crs,
+                    tileScale=batch_tile_scale,
+                    geometries=False,
+                )
+                return samples.reduceColumns(
+                    ee.Reducer.toList(len(band_names) + 1), ["_row"] + band_names
+                ).get("list").getInfo()
+            except Exception as e:
+                if attempt == max_retries:
+                    raise e
+                batch_tile_scale = min(batch_tile_scale * 2, 16)
+                time.sleep(2**attempt)
+
+    values = np.full((n, len(band_names)), np.nan)
+    sampled = np.zeros(n, dtype="bool")
+    batch_numbers = np.zeros(n, dtype="int64")
+    for index, rows in enumerate(batches):
+        batch_numbers[rows] = index + 1
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(run_batch, rows): index
+            for index, rows in enumerate(batches)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Batch {index + 1} failed: {e}")
+                continue
+            if result:
+                result = np.array(result, dtype="float64")
+                rows = result[:, 0].astype("int64")
+                values[rows] = result[:, 1:]
+                sampled[rows] = True
+            if verbose:
+                print(f"Sampled batch {done}/{len(batches)}")
+
+    df = points.copy()
+    for i, name in enumerate(band_names):
+        df[name] = values[:, i]
+    df["sampled"] = sampled
+    df["batch"] = batch_numbers
+    return df
+
+
 def image_reclassify(img, in_list, out_list):
     """Reclassify an image.
 
@@ -8834,13 +10048,58 @@ def csv_to_df(in_csv, **kwargs):
         raise Exception(e)
 
 
-def ee_to_df(ee_object, col_names=None, sort_columns=False, **kwargs):
-    """Converts an ee.FeatureCollection to pandas dataframe.
+def ee_feature_pages(ee_object, page_size=2000, max_workers=4, count=None):
+    """Fetches an ee.FeatureCollection page by page with toList(count, offset), keeping a bounded number of pages in flight.
+        Pages are yielded in collection order, so the whole collection is never held in memory and the
+        Earth Engine limit of 5000 elements per request does not apply to the collection as a whole.
+
+    Args:
+        ee_object (ee.FeatureCollection): The input feature collection.
+        page_size (int, optional): The number of features per request. Must not exceed 5000. Defaults to 2000.
+        max_workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
+        count (int, optional): The size of the collection if already known. Defaults to None.
+
+    Yields:
+        list: A list of GeoJSON-like feature dictionaries.
+    """
+    import collections
+    from concurrent.futures import ThreadPoolExecutor
+
+    if page_size > 5000:
+        raise ValueError("page_size must not exceed 5000.")
+
+    if count is None:
+        count = ee_object.size().getInfo()
+
+    def fetch(offset):
+        return ee_object.toList(page_size, offset).getInfo()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending = collections.deque()
+        for offset in range(0, count, page_size):
+            pending.append(executor.submit(fetch, offset))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def ee_to_df(
+    ee_object,
+    col_names=None,
+    sort_columns=False,
+    page_size=2000,
+    max_workers=4,
+    **kwargs,
+):
+    """Converts an ee.FeatureCollection to pandas dataframe. Large collections are fetched in concurrent pages.
 
     Args:
         ee_object (ee.FeatureCollection): ee.FeatureCollection.
         col_names (list): List of column names. Defaults to None.
         sort_columns (bool): Whether to sort the column names. Defaults to False.
+        page_size (int, optional): The number of features per request. Defaults to 2000.
+        max_workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
 
     Raises:
         TypeError: ee_object must be an ee.FeatureCollection
@@ -8857,17 +10116,23 @@ def ee_to_df(ee_object, col_names=None, sort_columns=False, **kwargs):
         raise TypeError("ee_object must be an ee.FeatureCollection")
 
     try:
-        data = ee_object.map(lambda f: ee.Feature(None, f.toDictionary()))
-        data = [x["properties"] for x in data.getInfo()["features"]]
-        df = pd.DataFrame(data)
-
+        # size and column names are fetched in one request
+        info = ee_object_info(ee_object, ["size", "property_names"], cache=False)
         if col_names is None:
-            col_names = ee_object.first().propertyNames().getInfo()
-            col_names.remove("system:index")
+            col_names = [c for c in info["property_names"] if c != "system:index"]
         elif not isinstance(col_names, list):
             raise TypeError("col_names must be a list")
 
-        df = df[col_names]
+        data = ee_object.select(col_names, None, False)
+        pages = ee_feature_pages(data, page_size, max_workers, count=info["size"])
+        frames = [
+            pd.DataFrame([f["properties"] for f in page], columns=col_names)
+            for page in pages
+        ]
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=col_names)
 
         if sort_columns:
             df = df.reindex(sorted(df.columns), axis=1)
@@ -8912,13 +10177,15 @@ def shp_to_gdf(in_shp, **kwargs):
 shp_to_geopandas = shp_to_gdf
 
 
-def ee_to_gdf(ee_object, selectors=None, verbose=False):
-    """Converts an ee.FeatureCollection to Geopandas dataframe.
+def ee_to_gdf(ee_object, selectors=None, verbose=False, page_size=2000, max_workers=4):
+    """Converts an ee.FeatureCollection to Geopandas dataframe. Large collections are fetched in concurrent pages.
 
     Args:
         ee_object (ee.FeatureCollection): ee.FeatureCollection.
         selectors (list, optional): A list of attributes to export. Defaults to None.
         verbose (bool, optional): Whether to print out descriptive text. Defaults to False.
+        page_size (int, optional): The number of features per request. Defaults to 2000.
+        max_workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
 
     Raises:
         TypeError: ee_object must be an ee.FeatureCollection.
@@ -8930,16 +10197,105 @@ def ee_to_gdf(ee_object, selectors=None, verbose=False):
     check_package(name="geopandas", URL="https://geopandas.org")
 
     import geopandas as gpd
+    import pandas as pd
 
     if not isinstance(ee_object, ee.FeatureCollection):
         raise TypeError("ee_object must be an ee.FeatureCollection")
 
-    collection = ee_to_geojson(ee_object)
-    gdf = gpd.GeoDataFrame.from_features(collection["features"])
+    if selectors is not None:
+        ee_object = ee_object.select(selectors)
+
+    frames = []
+    for index, page in enumerate(ee_feature_pages(ee_object, page_size, max_workers)):
+        if verbose:
+            print(f"Processing page {index + 1} ...")
+        frames.append(gpd.GeoDataFrame.from_features(page, crs="EPSG:4326"))
+
+    if not frames:
+        return gpd.GeoDataFrame(geometry=[], crs="EPSG:4326")
+
+    gdf = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), crs="EPSG:4326")
 
     return gdf
 
 
+def ee_to_parquet(
+    ee_object,
+    filename,
+    selectors=None,
+    geometry=True,
+    page_size=2000,
+    max_workers=4,
+    verbose=False,
+):
+    """Streams an ee.FeatureCollection to a (Geo)Parquet file page by page, without holding the whole table in memory.
+
+    Args:
+        ee_object (ee.FeatureCollection): The input feature collection.
+        filename (str): The output parquet file path.
+        selectors (list, optional): A list of attributes to export. Defaults to None.
+        geometry (bool, optional): Whether to write the geometries as a WKB column with GeoParquet metadata. Defaults to True.
+        page_size (int, optional): The number of features per request. Defaults to 2000.
+        max_workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
+        verbose (bool, optional): Whether to print out descriptive text. Defaults to False.
+
+    Raises:
+        TypeError: If a property has values of incompatible types, e.g., numbers on one page and strings on another.
+
+    Returns:
+        str: The path to the output file. Integer properties are written as float64.
+    """
+    import pyarrow as pa
+
+    if not isinstance(ee_object, ee.FeatureCollection):
+        raise TypeError("ee_object must be an ee.FeatureCollection")
+
+    filename = check_file_path(filename)
+
+    info = ee_object_info(ee_object, ["size", "property_names"], cache=False)
+    if selectors is None:
+        selectors = [c for c in info["property_names"] if c != "system:index"]
+
+    data = ee_object.select(selectors, None, geometry)
+
+    if geometry:
+        import shapely
+
+    metadata = None
+    if geometry:
+        metadata = {
+            "geo": json.dumps(
+                {
+                    "version": "1.0.0",
+                    "primary_column": "geometry",
+                    "columns": {
+                        "geometry": {"encoding": "WKB", "geometry_types": []}
+                    },
+                }
+            )
+        }
+    columns = list(selectors) + (["geometry"] if geometry else [])
+    writer = _ParquetStreamWriter(filename, columns, metadata=metadata)
+    try:
+        pages = ee_feature_pages(data, page_size, max_workers, count=info["size"])
+        for index, page in enumerate(pages):
+            values = {
+                name: [f["properties"].get(name) for f in page] for name in selectors
+            }
+            if geometry:
+                geoms = shapely.from_geojson(
+                    [json.dumps(f["geometry"]) if f["geometry"] else None for f in page]
+                )
+                values["geometry"] = shapely.to_wkb(geoms).tolist()
+            writer.write(pa.table(values))
+            if verbose:
+                print(f"Fetched page {index + 1} ({len(page)} features)")
+    finally:
+        writer.close()
+
+    return filename
+
+
 ee_to_geopandas = ee_to_gdf
 
 
@@ -8976,6 +10332,7 @@ def df_to_ee(df, latitude="latitude", longitude="longitude", **kwargs):
         df (pandas.DataFrame): An input pandas.DataFrame.
         latitude (str, optional): Column name for the latitude column. Defaults to 'latitude'.
         longitude (str, optional): Column name for the longitude column. Defaults to 'longitude'.
+        **kwargs: Additional keyword arguments. geodesic (bool) controls how line segments are interpreted. Defaults to True.
 
     Raises:
         TypeError: The input data type must be pandas.DataFrame.
@@ -8988,8 +10345,12 @@ def df_to_ee(df, latitude="latitude", longitude="longitude", **kwargs):
     if not isinstance(df, pd.DataFrame):
         raise TypeError("The input data type must be pandas.DataFrame.")
 
-    geojson = df_to_geojson(df, latitude=latitude, longitude=longitude)
-    fc = geojson_to_ee(geojson)
+    xs = df[longitude].astype(float).tolist()
+    ys = df[latitude].astype(float).tolist()
+    geometries = [{"type": "Point", "coordinates": [x, y]} for x, y in zip(xs, ys)]
+    fc = _features_to_ee(
+        geometries, _records(df), geodesic=kwargs.get("geodesic", True)
+    )
 
     return fc
 
@@ -8997,14 +10358,60 @@ def df_to_ee(df, latitude="latitude", longitude="longitude", **kwargs):
 pandas_to_ee = df_to_ee
 
 
-def gdf_to_ee(gdf, geodesic=True, date=None, date_format="YYYY-MM-dd"):
+def _features_to_ee(geometries, properties, geodesic=True):
+    """Assembles GeoJSON geometry and property dictionaries into an ee.FeatureCollection in memory.
+
+    Args:
+        geometries (list): A list of GeoJSON geometry dictionaries.
+        properties (list): A list of property dictionaries, one per geometry.
+        geodesic (bool, optional): Whether line segments should be interpreted as spherical geodesics. Defaults to True.
+
+    Returns:
+        ee.FeatureCollection: The output ee.FeatureCollection.
+    """
+    features = []
+    for geometry, props in zip(geometries, properties):
+        if geometry is not None and geometry["type"] != "Point":
+            geometry["geodesic"] = geodesic
+        features.append({"type": "Feature", "geometry": geometry, "properties": props})
+
+    return ee.FeatureCollection({"type": "FeatureCollection", "features": features})
+
+
+def _records(df):
+    """Converts the attribute table of a DataFrame to JSON-safe dictionaries.
+        NaN becomes None and numpy/datetime values become plain Python values.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+
+    Returns:
+        list: A list of dictionaries, one per row.
+    """
+    if len(df.columns) == 0:
+        return [{} for _ in range(len(df))]
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+def gdf_to_ee(
+    gdf,
+    geodesic=True,
+    date=None,
+    date_format="YYYY-MM-dd",
+    precision=None,
+    simplify=None,
+):
     """Converts a GeoPandas GeoDataFrame to ee.FeatureCollection.
+        The geometries are encoded to GeoJSON in memory with vectorized shapely functions,
+        so no temporary files are written and the function is safe for concurrent use.
 
     Args:
         gdf (geopandas.GeoDataFrame): The input geopandas.GeoDataFrame to be converted ee.FeatureCollection.
         geodesic (bool, optional): Whether line segments should be interpreted as spherical geodesics. If false, indicates that line segments should be interpreted as planar lines in the specified CRS. If absent, defaults to true if the CRS is geographic (including the default EPSG:4326), or to false if the CRS is projected. Defaults to True.
         date (str, optional): Column name for the date column. Defaults to None.
         date_format (str, optional): Date format. A pattern, as described at http://joda-time.sourceforge.net/apidocs/org/joda/time/format/DateTimeFormat.html. Defaults to 'YYYY-MM-dd'.
+        precision (int, optional): The number of decimal places to keep in the coordinates, e.g., 6 for ~0.1 m. Defaults to None (full precision).
+        simplify (float, optional): The tolerance in degrees used to simplify the geometries (topology preserving). Defaults to None.
 
     Raises:
         TypeError: The input data type must be geopandas.GeoDataFrame.
@@ -9015,15 +10422,29 @@ def gdf_to_ee(gdf, geodesic=True, date=None, date_format="YYYY-MM-dd"):
     check_package(name="geopandas", URL="https://geopandas.org")
 
     import geopandas as gpd
+    import numpy as np
+    import shapely
 
     if not isinstance(gdf, gpd.GeoDataFrame):
         raise TypeError("The input data type must be geopandas.GeoDataFrame.")
 
-    out_json = os.path.join(os.getcwd(), random_string(6) + ".geojson")
-    gdf = gdf.to_crs(4326)
-    gdf.to_file(out_json, driver="GeoJSON")
+    if gdf.crs is not None:
+        gdf = gdf.to_crs(4326)
+
+    geoms = gdf.geometry.values
+    if simplify is not None:
+        geoms = shapely.simplify(geoms, simplify, preserve_topology=True)
+    if precision is not None:
+        geoms = shapely.transform(geoms, lambda coords: np.round(coords, precision))
+
+    # encode all geometries in C and decode them with a single json.loads call
+    strings = shapely.to_geojson(geoms)
+    geometries = json.loads(
+        "[" + ",".join("null" if g is None else g for g in strings) + "]"
+    )
+    properties = _records(gdf.drop(columns=gdf.geometry.name))
 
-    fc = geojson_to_ee(out_json, geodesic=geodesic)
+    fc = _features_to_ee(geometries, properties, geodesic=geodesic)
 
     if date is not None:
         try:
@@ -9036,8 +10457,6 @@ def gdf_to_ee(gdf, geodesic=True, date=None, date_format="YYYY-MM-dd"):
         except Exception as e:
             raise Exception(e)
 
-    os.remove(out_json)
-
     return fc
 
 
@@ -9162,9 +10581,11 @@ def extract_pixel_values(
     )
 
     if getInfo:
-        band_names = ee_object.bandNames().getInfo()
-        values_tmp = dict_values.getInfo()
-        values = [values_tmp[i] for i in band_names]
+        info = ee.Dictionary(
+            {"band_names": ee_object.bandNames(), "values": dict_values}
+        ).getInfo()
+        band_names = info["band_names"]
+        values = [info["values"][i] for i in band_names]
         return dict(zip(band_names, values))
     else:
         return dict_values
@@ -9287,6 +10708,144 @@ def extract_transect(
         raise Exception(e)
 
 
+def extract_transects(
+    image,
+    lines,
+    n_points=100,
+    dist_interval=None,
+    id_column=None,
+    scale=None,
+    crs=None,
+    interpolate=True,
+    batch_size=1000,
+    max_workers=4,
+    verbose=False,
+):
+    """Extracts profiles of an image along many lines at once. The lines are densified locally, all points are
+        sampled with batched requests (see sample_points()), and the result is returned as a long-format DataFrame
+        with one row per point.
+
+    Args:
+        image (ee.Image | ee.ImageCollection): The image to extract transects from, e.g., a DEM.
+        lines (gpd.GeoDataFrame | list | ee.Geometry): The lines. It can be a GeoDataFrame of LineStrings, a list of
+            shapely LineStrings or of coordinate lists in EPSG:4326, or an ee.Geometry.LineString.
+        n_points (int, optional): The number of points sampled along each line. Defaults to 100.
+        dist_interval (float, optional): The geodesic distance in meters between sampled points. If specified, n_points is ignored. Defaults to None.
+        id_column (str, optional): The column of the GeoDataFrame used as transect id. Defaults to None, which uses the row position.
+        scale (float, optional): A nominal scale in meters of the projection to sample in. Defaults to None.
+        crs (str, optional): The projection to sample in. Defaults to None.
+        interpolate (bool, optional): Whether to fill points on masked pixels by linear interpolation along the distance of each transect. Defaults to True.
+        batch_size (int, optional): The number of points per request. Defaults to 1000.
+        max_workers (int, optional): The number of requests sent to Earth Engine concurrently. Defaults to 4.
+        verbose (bool, optional): Whether to print the progress. Defaults to False.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the columns transect, distance (meters), longitude, latitude, one column per band
+            and an "interpolated" flag.
+    """
+    import numpy as np
+    import pandas as pd
+    import geopandas as gpd
+    import shapely
+    from pyproj import Geod
+
+    if isinstance(lines, ee.Geometry):
+        lines = [shapely.geometry.shape(lines.getInfo())]
+
+    if isinstance(lines, gpd.GeoDataFrame):
+        gdf = lines.to_crs("EPSG:4326") if lines.crs is not None else lines
+        ids = gdf[id_column].to_numpy() if id_column is not None else np.arange(len(gdf))
+        geoms = gdf.geometry.to_numpy()
+    elif isinstance(lines, (list, tuple)):
+        geoms = np.array(
+            [
+                g if isinstance(g, shapely.Geometry) else shapely.LineString(g)
+                for g in lines
+            ],
+            dtype=object,
+        )
+        ids = np.arange(len(geoms))
+    else:
+        raise TypeError("lines must be a GeoDataFrame, a list or an ee.Geometry.")
+
+    if not (shapely.get_type_id(geoms) == 1).all():
+        raise TypeError("The geometry type must be LineString.")
+
+    geod = Geod(ellps="WGS84")
+
+    # Points are placed along the geodesic of each segment, so they are evenly spaced in meters
+    # whatever the orientation and latitude of the line.
+    lon, lat, distance = [], [], []
+    for geom in geoms:
+        coords = shapely.get_coordinates(geom)
+        x, y = coords[:, 0], coords[:, 1]
+        azimuth, _, segment = geod.inv(x[:-1], y[:-1], x[1:], y[1:])
+        azimuth, segment = np.atleast_1d(azimuth), np.atleast_1d(segment)
+        vertex_distance = np.concatenate([[0], np.cumsum(segment)])
+        length = vertex_distance[-1]
+        if dist_interval is None:
+            d = np.linspace(0, length, n_points)
+        elif length:
+            d = np.append(np.arange(0, length, dist_interval), length)
+        else:
+            d = np.zeros(1)
+        index = np.searchsorted(vertex_distance, d, side="right") - 1
+        index = np.clip(index, 0, len(segment) - 1)
+        px, py, _ = geod.fwd(
+            x[index], y[index], azimuth[index], d - vertex_distance[index]
+        )
+        lon.append(np.atleast_1d(px))
+        lat.append(np.atleast_1d(py))
+        distance.append(d)
+
+    counts = np.array([len(d) for d in distance])
+    line_index = np.repeat(np.arange(len(geoms)), counts)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    lon = np.concatenate(lon)
+    lat = np.concatenate(lat)
+    distance = np.concatenate(distance)
+
+    df = pd.DataFrame(
+        {
+            "transect": ids[line_index],
+            "distance": distance,
+            "longitude": lon,
+            "latitude": lat,
+        }
+    )
+    df = sample_points(
+        image,
+        df,
+        scale=scale,
+        crs=crs,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        verbose=verbose,
+    )
+
+    band_names = [
+        c
+        for c in df.columns
+        if c not in ["transect", "distance", "longitude", "latitude", "sampled", "batch"]
+    ]
+    df["interpolated"] = False
+
+    if interpolate and not df["sampled"].all():
+        for start, count in zip(starts, counts):
+            rows = slice(start, start + count)
+            valid = df["sampled"].to_numpy()[rows]
+            if valid.all() or not valid.any():
+                continue
+            d = distance[rows]
+            for name in band_names:
+                column = df[name].to_numpy(copy=True)
+                column[rows] = np.interp(d, d[valid], column[rows][valid])
+                df[name] = column
+            df.iloc[rows, df.columns.get_loc("interpolated")] = ~valid
+
+    return df.drop(columns=["sampled", "batch"])
+
+
 def random_sampling(
     image,
     region=None,
@@ -10401,6 +11960,94 @@ def gdf_to_geojson(gdf, out_geojson=None, epsg=None):
         raise Exception(e)
 
 
+def geojson_lod(data, zoom_bands=None, pixel_tolerance=1.0):
+    """Pre-simplifies a GeoJSON FeatureCollection for a set of zoom bands.
+        For each band the geometries are simplified to the ground size of a pixel at the band's
+        highest zoom and the coordinates are rounded to the matching number of decimals, so a map
+        only needs to transfer the detail that can be seen at the current zoom.
+
+    Args:
+        data (dict): A GeoJSON FeatureCollection in EPSG:4326.
+        zoom_bands (list, optional): A list of (min_zoom, max_zoom) tuples. Defaults to
+            [(0, 4), (5, 7), (8, 10), (11, 13), (14, 24)].
+        pixel_tolerance (float, optional): The simplification tolerance in screen pixels. Defaults to 1.0.
+
+    Returns:
+        list: One dictionary per zoom band with the keys min_zoom, max_zoom, features, tree (a shapely STRtree) and bytes (the GeoJSON payload size).
+    """
+    import numpy as np
+    import shapely
+
+    if zoom_bands is None:
+        zoom_bands = [(0, 4), (5, 7), (8, 10), (11, 13), (14, 24)]
+
+    features = data["features"]
+    geoms = shapely.from_geojson(
+        [json.dumps(f["geometry"]) if f["geometry"] else None for f in features]
+    )
+
+    levels = []
+    for min_zoom, max_zoom in zoom_bands:
+        # ground size of one pixel in degrees at the band's highest zoom
+        tolerance = pixel_tolerance * 360.0 / (256 * 2 ** min(max_zoom, 13))
+        decimals = max(0, math.ceil(-math.log10(tolerance)))
+        if max_zoom >= 14:
+            simplified = geoms
+            decimals = max(decimals, 7)
+        else:
+            simplified = shapely.simplify(geoms, tolerance, preserve_topology=True)
+        simplified = shapely.transform(
+            simplified, lambda coords: np.round(coords, decimals)
+        )
+        strings = shapely.to_geojson(simplified)
+        geometries = json.loads(
+            "[" + ",".join("null" if g is None else g for g in strings) + "]"
+        )
+        level_features = [
+            {**feature, "geometry": geometry}
+            for feature, geometry in zip(features, geometries)
+        ]
+        levels.append(
+            {
+                "min_zoom": min_zoom,
+                "max_zoom": max_zoom,
+                "features": level_features,
+                "tree": shapely.STRtree(simplified),
+                "bytes": len(json.dumps(level_features)),
+            }
+        )
+
+    return levels
+
+
+def geojson_lod_view(levels, zoom, bounds=None):
+    """Selects the pre-simplified features for a zoom level and, optionally, a view extent.
+
+    Args:
+        levels (list): The output of geojson_lod().
+        zoom (float): The current map zoom.
+        bounds (tuple, optional): The view extent as (west, south, east, north). Defaults to None, which returns all features.
+
+    Returns:
+        dict: A GeoJSON FeatureCollection.
+    """
+    import shapely
+
+    level = levels[-1]
+    for item in levels:
+        if item["min_zoom"] <= zoom <= item["max_zoom"]:
+            level = item
+            break
+
+    if bounds is None:
+        features = level["features"]
+    else:
+        index = sorted(level["tree"].query(shapely.box(*bounds)))
+        features = [level["features"][i] for i in index]
+
+    return {"type": "FeatureCollection", "features": features}
+
+
 def temp_file_path(extension):
     """Returns a temporary file path.
 
@@ -10499,6 +12146,7 @@ def get_local_tile_layer(
     tile_format="ipyleaflet",
     layer_name="Local COG",
     return_client=False,
+    local_server=True,
     **kwargs,
 ):
     """Generate an ipyleaflet/folium TileLayer from a local raster dataset or remote Cloud Optimized GeoTIFF (COG).
@@ -10522,6 +12170,8 @@ def get_local_tile_layer(
         tile_format (str, optional): The tile layer format. Can be either ipyleaflet or folium. Defaults to "ipyleaflet".
         layer_name (str, optional): The layer name to use. Defaults to None.
         return_client (bool, optional): If True, the tile client will be returned. Defaults to False.
+        local_server (bool, optional): If True, local files are rendered by the in-process tile server in
+            geeltermap.local_tiles instead of localtileserver. Remote COGs always use localtileserver. Defaults to True.
 
     Returns:
         ipyleaflet.TileLayer | folium.TileLayer: An ipyleaflet.TileLayer or folium.TileLayer.
@@ -10529,6 +12179,51 @@ def get_local_tile_layer(
 
     warnings.filterwarnings("ignore")
 
+    if tile_format not in ["ipyleaflet", "folium"]:
+        raise ValueError("The tile format must be either ipyleaflet or folium.")
+
+    if local_server and _is_local_raster(source):
+        from .local_tiles import local_tile_url
+
+        if isinstance(palette, str):
+            palette = get_palette_colors(palette, hashtag=True)
+        if layer_name is None:
+            layer_name = "LocalTile_" + random_string(3)
+        if attribution is None:
+            attribution = "Raster file served locally"
+
+        url, tile_client = local_tile_url(
+            source, band=band, palette=palette, vmin=vmin, vmax=vmax, nodata=nodata
+        )
+        if tile_format == "ipyleaflet":
+            import ipyleaflet
+
+            tile_layer = ipyleaflet.TileLayer(
+                url=url,
+                name=layer_name,
+                attribution=attribution,
+                max_zoom=30,
+                max_native_zoom=30,
+                **kwargs,
+            )
+        else:
+            import folium
+
+            tile_layer = folium.TileLayer(
+                tiles=url,
+                attr=attribution,
+                name=layer_name,
+                overlay=True,
+                max_zoom=30,
+                max_native_zoom=30,
+                **kwargs,
+            )
+
+        if return_client:
+            return tile_layer, tile_client
+        else:
+            return tile_layer
+
     output = widgets.Output()
 
     check_package(
@@ -11806,6 +13501,44 @@ def clip_image(image, mask, output):
         dest.write(out_image)
 
 
+_netcdf_cache = {}
+
+
+def _shift_netcdf_lon(xds, lon="lon"):
+    """Shift longitude values from [0, 360] to [-180, 180] without loading the data.
+    When the shift is a rotation of the longitude axis, the two halves are concatenated so that
+    dask-backed variables stay lazy and are reordered chunk by chunk.
+
+    Args:
+        xds (xarray.Dataset): The dataset.
+        lon (str, optional): Name of the longitude variable. Defaults to 'lon'.
+
+    Returns:
+        xarray.Dataset: The shifted dataset.
+    """
+    import numpy as np
+    import xarray as xr
+
+    shifted = (xds.coords[lon].values + 180) % 360 - 180
+    order = np.argsort(shifted, kind="stable")
+    split = int(order[0])
+    rotation = np.roll(np.arange(len(shifted)), -split)
+
+    xds = xds.assign_coords({lon: shifted})
+    if split == 0:
+        return xds
+    elif np.array_equal(order, rotation):
+        return xr.concat(
+            [xds.isel({lon: slice(split, None)}), xds.isel({lon: slice(0, split)})],
+            dim=lon,
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+        )
+    else:
+        return xds.isel({lon: order})
+
+
 def netcdf_to_tif(
     filename,
     output=None,
@@ -11814,9 +13547,16 @@ def netcdf_to_tif(
     lat="lat",
     lon="lon",
     return_vars=False,
+    chunks="auto",
+    time_index=None,
+    time_dim="time",
+    cache=True,
     **kwargs,
 ):
     """Convert a netcdf file to a GeoTIFF file.
+    The dataset is opened lazily with dask and written tile by tile, so files larger than memory can be converted.
+    Conversions are keyed on the source modification time and the selected options. The key is recorded in a
+    cache folder in the temporary directory, so repeated calls return the existing GeoTIFF immediately.
 
     Args:
         filename (str): Path to the netcdf file.
@@ -11826,14 +13566,25 @@ def netcdf_to_tif(
         lat (str, optional): Name of the latitude variable. Defaults to 'lat'.
         lon (str, optional): Name of the longitude variable. Defaults to 'lon'.
         return_vars (bool, optional): Flag to return all variables. Defaults to False.
+        chunks (str | dict, optional): The dask chunks used to open the dataset. Set to None to load the data eagerly. Defaults to "auto".
+        time_index (int, optional): The index along the time dimension to extract. Defaults to None, which keeps all time steps.
+        time_dim (str, optional): Name of the time dimension. Defaults to 'time'.
+        cache (bool, optional): Flag to reuse a previously converted file. Defaults to True.
 
     Raises:
         ImportError: If the xarray or rioxarray package is not installed.
         FileNotFoundError: If the netcdf file is not found.
         ValueError: If the variable is not found in the netcdf file.
     """
+    import hashlib
+    import tempfile
+    import threading
+
     try:
         import xarray as xr
+
+        # Registers the .rio accessor used below.
+        import rioxarray  # noqa: F401
     except ImportError as e:
         raise ImportError(e)
 
@@ -11843,30 +13594,116 @@ def netcdf_to_tif(
     if not os.path.exists(filename):
         raise FileNotFoundError(f"{filename} does not exist.")
 
+    filename = os.path.abspath(filename)
+    if isinstance(variables, str):
+        variables = [variables]
+
+    stat = os.stat(filename)
+    key = json.dumps(
+        [
+            filename,
+            stat.st_mtime_ns,
+            stat.st_size,
+            variables,
+            shift_lon,
+            time_index,
+            lat,
+            lon,
+        ]
+    )
+
     if output is None:
         output = filename.replace(".nc", ".tif")
     else:
         output = check_file_path(output)
 
-    xds = xr.open_dataset(filename, **kwargs)
+    # Only the cache record lives in the temporary directory. It stores the stat of the GeoTIFF
+    # written for this key, so the file is reused across sessions until either file changes.
+    cache_dir = os.path.join(tempfile.gettempdir(), "geeltermap_netcdf")
+    digest = hashlib.sha1(json.dumps([key, output]).encode()).hexdigest()[:16]
+    basename = os.path.splitext(os.path.basename(filename))[0]
+    record_file = os.path.join(cache_dir, f"{basename}_{digest}.json")
+
+    reuse = False
+    if cache and os.path.exists(output) and os.path.exists(record_file):
+        try:
+            with open(record_file) as f:
+                record = json.load(f)
+            out_stat = os.stat(output)
+            reuse = record.get("output") == output and record.get("stat") == [
+                out_stat.st_mtime_ns,
+                out_stat.st_size,
+            ]
+        except (OSError, ValueError):
+            reuse = False
+
+    if cache and key in _netcdf_cache:
+        cached_output, allowed_vars = _netcdf_cache[key]
+        if cached_output == output and os.path.exists(output):
+            if return_vars:
+                return output, allowed_vars
+            else:
+                return output
 
-    if shift_lon:
-        xds.coords[lon] = (xds.coords[lon] + 180) % 360 - 180
-        xds = xds.sortby(xds.lon)
+    source = xr.open_dataset(filename, chunks=chunks, **kwargs)
+    try:
+        allowed_vars = list(source.data_vars.keys())
+        if variables is not None and (not set(variables).issubset(allowed_vars)):
+            raise ValueError(f"{variables} must be a subset of {allowed_vars}.")
+
+        if not reuse:
+            xds = source
+            if variables is not None:
+                xds = xds[variables]
+
+            if time_index is not None and time_dim in xds.dims:
+                xds = xds.isel({time_dim: time_index})
+
+            if shift_lon:
+                xds = _shift_netcdf_lon(xds, lon)
+
+            xds = xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat)
+            if xds.rio.crs is None:
+                xds = xds.rio.write_crs("EPSG:4326")
+
+            tmp_output = output + ".part"
+            xds.rio.to_raster(
+                tmp_output,
+                driver="GTiff",
+                tiled=True,
+                blockxsize=256,
+                blockysize=256,
+                compress="deflate",
+                windowed=True,
+                lock=threading.Lock(),
+            )
+    finally:
+        source.close()
 
-    allowed_vars = list(xds.data_vars.keys())
-    if isinstance(variables, str):
-        if variables not in allowed_vars:
-            raise ValueError(f"{variables} is not a valid variable.")
-        variables = [variables]
+    if not reuse:
+        from .local_tiles import evict
 
-    if variables is not None and (not set(variables).issubset(allowed_vars)):
-        raise ValueError(f"{variables} must be a subset of {allowed_vars}.")
+        _add_overviews(tmp_output)
+        # Close the tile server handle of the previous file, so layers show the new one.
+        evict(output)
+        os.replace(tmp_output, output)
 
-    if variables is None:
-        xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.to_raster(output)
-    else:
-        xds[variables].rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.to_raster(output)
+        if cache:
+            out_stat = os.stat(output)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(record_file, "w") as f:
+                    json.dump(
+                        {
+                            "output": output,
+                            "stat": [out_stat.st_mtime_ns, out_stat.st_size],
+                        },
+                        f,
+                    )
+            except OSError:
+                pass
+
+    _netcdf_cache[key] = (output, allowed_vars)
 
     if return_vars:
         return output, allowed_vars
@@ -11874,11 +13711,28 @@ def netcdf_to_tif(
         return output
 
 
-def read_netcdf(filename, **kwargs):
+def _add_overviews(filename):
+    """Build internal overviews for a tiled GeoTIFF so that it can be rendered like a COG."""
+    import rasterio
+    from rasterio.enums import Resampling
+
+    with rasterio.open(filename, "r+") as dst:
+        factors = []
+        factor = 2
+        while max(dst.width, dst.height) // factor >= 256:
+            factors.append(factor)
+            factor *= 2
+        if factors:
+            dst.build_overviews(factors, Resampling.average)
+            dst.update_tags(ns="rio_overview", resampling="average")
+
+
+def read_netcdf(filename, chunks=None, **kwargs):
     """Read a netcdf file.
 
     Args:
         filename (str): File path or HTTP URL to the netcdf file.
+        chunks (str | dict, optional): The dask chunks used to open the dataset lazily, e.g., "auto". Defaults to None, which loads the data eagerly.
 
     Raises:
         ImportError: If the xarray or rioxarray package is not installed.
@@ -11898,7 +13752,7 @@ def read_netcdf(filename, **kwargs):
     if not os.path.exists(filename):
         raise FileNotFoundError(f"{filename} does not exist.")
 
-    xds = xr.open_dataset(filename, **kwargs)
+    xds = xr.open_dataset(filename, chunks=chunks, **kwargs)
     return xds
 
 
@@ -11950,42 +13804,24 @@ def netcdf_tile_layer(
         ipyleaflet.TileLayer | folium.TileLayer: An ipyleaflet.TileLayer or folium.TileLayer.
     """
 
-    check_package(
-        "localtileserver", URL="https://github.com/banesullivan/localtileserver"
-    )
-
-    try:
-        import xarray as xr
-    except ImportError as e:
-        raise ImportError(e)
-
-    if filename.startswith("http"):
-        filename = download_file(filename)
-
-    if not os.path.exists(filename):
-        raise FileNotFoundError(f"{filename} does not exist.")
-
-    output = filename.replace(".nc", ".tif")
-
-    xds = xr.open_dataset(filename, **kwargs)
-
-    if shift_lon:
-        xds.coords[lon] = (xds.coords[lon] + 180) % 360 - 180
-        xds = xds.sortby(xds.lon)
-
-    allowed_vars = list(xds.data_vars.keys())
     if isinstance(variables, str):
-        if variables not in allowed_vars:
-            raise ValueError(f"{variables} is not a subset of {allowed_vars}.")
         variables = [variables]
 
     if variables is not None and len(variables) > 3:
         raise ValueError("Only 3 variables can be plotted at a time.")
 
+    output, allowed_vars = netcdf_to_tif(
+        filename,
+        shift_lon=shift_lon,
+        lat=lat,
+        lon=lon,
+        return_vars=True,
+        **kwargs,
+    )
+
     if variables is not None and (not set(variables).issubset(allowed_vars)):
         raise ValueError(f"{variables} must be a subset of {allowed_vars}.")
 
-    xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.to_raster(output)
     if variables is None:
         if len(allowed_vars) >= 3:
             band_idx = [1, 2, 3]
@@ -12012,6 +13848,22 @@ def netcdf_tile_layer(
     return tile_layer
 
 
+def color_table(cmap="Blues", k=5):
+    """Get the hex colors and the RGBA array of a matplotlib colormap resampled to k classes.
+    Tables come from the colormap cache, so repeated classifications do not query matplotlib again.
+
+    Args:
+        cmap (str, optional): The name of a colormap recognized by matplotlib. Defaults to "Blues".
+        k (int, optional): The number of classes. Defaults to 5.
+
+    Returns:
+        tuple: A list of hex colors and an (k, 4) uint8 RGBA array.
+    """
+    from .colormaps import get_palette, get_palette_lut
+
+    return get_palette(cmap, k, hashtag=True), get_palette_lut(cmap, k)
+
+
 def classify(
     data,
     column,
@@ -12022,6 +13874,7 @@ def classify(
     k=5,
     legend_kwds=None,
     classification_kwds=None,
+    color_format="hex",
 ):
     """Classify a dataframe column using a variety of classification schemes.
 
@@ -12055,6 +13908,9 @@ def classify(
                 An option to control brackets from mapclassify legend.
                 If True, open/closed interval brackets are shown in the legend.
         classification_kwds (dict, optional): Keyword arguments to pass to mapclassify. Defaults to None.
+        color_format (str, optional): The type of the "color" column. "hex" stores hex strings, "categorical" stores
+            them as a pandas Categorical (dictionary-encoded when written to Arrow/Parquet), and "rgba" stores
+            colors packed as uint32 0xRRGGBBAA values. Defaults to "hex".
 
     Returns:
         pd.DataFrame, dict: A pandas dataframe with the classification applied and a legend dictionary.
@@ -12064,7 +13920,6 @@ def classify(
     import pandas as pd
     import geopandas as gpd
     import matplotlib as mpl
-    import matplotlib.pyplot as plt
 
     try:
         import mapclassify
@@ -12097,13 +13952,16 @@ def classify(
             f"{column} is not a column in the GeoDataFrame. It must be one of {columns}."
         )
 
+    if color_format not in ["hex", "categorical", "rgba"]:
+        raise ValueError("color_format must be one of 'hex', 'categorical' or 'rgba'.")
+
     # Convert categorical data to numeric
     init_column = None
     value_list = None
-    if np.issubdtype(df[column].dtype, np.object0):
-        value_list = df[column].unique().tolist()
-        value_list.sort()
-        df["category"] = df[column].replace(value_list, range(0, len(value_list)))
+    if np.issubdtype(df[column].dtype, np.object_):
+        codes, uniques = pd.factorize(df[column], sort=True)
+        value_list = uniques.tolist()
+        df["category"] = np.where(codes < 0, np.nan, codes)
         init_column = column
         column = "category"
         k = len(value_list)
@@ -12131,14 +13989,14 @@ def classify(
 
     if cmap is None:
         cmap = "Blues"
-    cmap = plt.cm.get_cmap(cmap, k)
     if colors is None:
-        colors = [mpl.colors.rgb2hex(cmap(i))[1:] for i in range(cmap.N)]
-        colors = ["#" + i for i in colors]
-    elif isinstance(colors, list):
-        colors = [check_color(i) for i in colors]
-    elif isinstance(colors, str):
-        colors = [check_color(colors)] * k
+        colors, rgba = color_table(cmap, k)
+    else:
+        if isinstance(colors, list):
+            colors = [check_color(i) for i in colors]
+        elif isinstance(colors, str):
+            colors = [check_color(colors)] * k
+        rgba = np.round(mpl.colors.to_rgba_array(colors) * 255).astype("uint8")
 
     allowed_schemes = [
         "BoxPlot",
@@ -12171,8 +14029,24 @@ def classify(
     binning = mapclassify.classify(
         np.asarray(values[~nan_idx]), scheme, **classification_kwds
     )
-    df["category"] = binning.yb
-    df["color"] = [colors[i] for i in df["category"]]
+
+    # Missing values get the code -1, which points at an empty entry appended to the color tables.
+    category = np.full(len(df), -1, dtype="int64")
+    category[~nan_idx] = binning.yb
+    df["category"] = category
+
+    if color_format == "rgba":
+        packed = rgba.astype("uint32")
+        packed = (packed[:, 0] << 24) | (packed[:, 1] << 16) | (packed[:, 2] << 8)
+        packed = packed | rgba[:, 3].astype("uint32")
+        df["color"] = np.take(np.append(packed, np.uint32(0)), category)
+    elif color_format == "categorical":
+        unique_colors, inverse = np.unique(colors, return_inverse=True)
+        df["color"] = pd.Categorical.from_codes(
+            np.take(np.append(inverse, -1), category), categories=unique_colors
+        )
+    else:
+        df["color"] = np.take(np.array(colors + [None], dtype=object), category)
 
     if legend_kwds is None:
         legend_kwds = {}
@@ -12220,7 +14094,9 @@ def classify(
         raise ValueError("labels must be a list or None.")
 
     legend_dict = dict(zip(labels, colors))
-    df["category"] = df["category"] + 1
+    df["category"] = np.where(category < 0, np.nan, category + 1)
+    if not nan_idx.any():
+        df["category"] = df["category"].astype("int64")
     return df, legend_dict
 
 
@@ -12798,14 +14674,9 @@ def get_palette_colors(cmap_name=None, n_class=None, hashtag=False):
     Returns:
         list: A list of hex colors.
     """
-    import matplotlib as mpl
-    import matplotlib.pyplot as plt
+    from .colormaps import get_palette
 
-    cmap = plt.cm.get_cmap(cmap_name, n_class)
-    colors = [mpl.colors.rgb2hex(cmap(i))[1:] for i in range(cmap.N)]
-    if hashtag:
-        colors = ["#" + i for i in colors]
-    return colors
+    return get_palette(cmap_name, n_class, hashtag)
 
 
 def plot_raster(
@@ -844,9 +844,12 @@ class Map(ipyleaflet.Map, MapInterface):
     def _get_available_basemaps(self) -> Dict[str, Any]:
         """Convert xyz tile services to a dictionary of basemaps."""
         ret_dict = {}
-        for tile_info in basemaps.get_xyz_dict().values():
-            tile_info["url"] = tile_info.build_url()
-            ret_dict[tile_info["name"]] = tile_info
+        for tile_info in basemaps.get_basemap_descriptors().values():
+            if tile_info["source"] == "xyzservices":
+                # Providers without max_zoom fall back to the default of _replace_basemap.
+                ret_dict[tile_info["name"]] = {
+                    k: v for k, v in tile_info.items() if v is not None
+                }
         extra_dict = {k: ret_dict[v] for k, v in self._BASEMAP_ALIASES.items()}
         return {**extra_dict, **ret_dict}
 
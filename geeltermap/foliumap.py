@@ -12,7 +12,7 @@ from folium.elements import JSCSSMixin
 from folium.map import Layer
 from jinja2 import Template
 
-from .basemaps import xyz_to_folium
+from .basemaps import basemap_registry
 from .common import *
 from .conversion import *
 from .legends import builtin_legends
@@ -26,7 +26,7 @@ if not in_colab_shell():
     from .plot import *
 
 
-basemaps = Box(xyz_to_folium(), frozen_box=True)
+basemaps = basemap_registry("folium")
 
 
 class Map(folium.Map):
@@ -2460,6 +2460,7 @@ class Map(folium.Map):
         shift_lon=True,
         lat="lat",
         lon="lon",
+        time_index=None,
         **kwargs,
     ):
         """Generate an ipyleaflet/folium TileLayer from a netCDF file.
@@ -2482,6 +2483,7 @@ class Map(folium.Map):
             shift_lon (bool, optional): Flag to shift longitude values from [0, 360] to the range [-180, 180]. Defaults to True.
             lat (str, optional): Name of the latitude variable. Defaults to 'lat'.
             lon (str, optional): Name of the longitude variable. Defaults to 'lon'.
+            time_index (int, optional): The index along the time dimension to display. Defaults to None.
         """
 
         if in_colab_shell():
@@ -2489,7 +2491,12 @@ class Map(folium.Map):
             return
 
         tif, vars = netcdf_to_tif(
-            filename, shift_lon=shift_lon, lat=lat, lon=lon, return_vars=True
+            filename,
+            shift_lon=shift_lon,
+            lat=lat,
+            lon=lon,
+            return_vars=True,
+            time_index=time_index,
         )
 
         if variables is None:
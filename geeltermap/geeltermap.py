@@ -18,7 +18,7 @@ from bqplot import pyplot as plt
 from ipyfilechooser import FileChooser
 from IPython.display import display
 from ipytree import Node, Tree
-from .basemaps import xyz_to_leaflet
+from .basemaps import basemap_registry
 from .common import *
 from .legends import builtin_legends
 from .osm import *
@@ -27,7 +27,7 @@ from . import map_widgets
 
 
 
-basemaps = Box(xyz_to_leaflet(), frozen_box=True)
+basemaps = basemap_registry("ipyleaflet")
 
 class Map(ipyleaflet.Map):
     """The Map class inherits from ipyleaflet.Map. The arguments you can pass to the Map can be found at https://ipyleaflet.readthedocs.io/en/latest/map_and_basemaps/map.html. By default, the Map will add Google Maps as the basemap. Set add_google_map = False to use OpenStreetMap as the basemap.
@@ -1196,9 +1196,6 @@ class Map(ipyleaflet.Map):
                 index = layer_names.index(plot_layer_name)
                 ee_object = layers[index]
 
-                if isinstance(ee_object, ee.ImageCollection):
-                    ee_object = ee_object.mosaic()
-
                 try:
                     self.default_style = {"cursor": "wait"}
                     plot_options = self.plot_options
@@ -1222,44 +1219,26 @@ class Map(ipyleaflet.Map):
                         marker_cluster.markers = markers
                         self.plot_marker_cluster = marker_cluster
 
-                    band_names = ee_object.bandNames().getInfo()
-                    if any(len(name) > 3 for name in band_names):
-                        band_names = list(range(1, len(band_names) + 1))
-
-                    self.chart_labels = band_names
-
+                    # Band names are cached when the layer is added, so this is one request.
                     if self.roi_end:
-                        if self.roi_reducer_scale is None:
-                            scale = ee_object.select(0).projection().nominalScale()
-                        else:
-                            scale = self.roi_reducer_scale
-                        dict_values_tmp = ee_object.reduceRegion(
+                        sample = sample_location(
+                            ee_object,
+                            region=self.user_roi,
                             reducer=self.roi_reducer,
-                            geometry=self.user_roi,
-                            scale=scale,
-                            bestEffort=True,
-                        ).getInfo()
-                        b_names = ee_object.bandNames().getInfo()
-                        dict_values = dict(
-                            zip(b_names, [dict_values_tmp[b] for b in b_names])
-                        )
-                        self.chart_points.append(
-                            self.user_roi.centroid(1).coordinates().getInfo()
+                            scale=self.roi_reducer_scale,
                         )
                     else:
-                        xy = ee.Geometry.Point(latlon[::-1])
-                        dict_values_tmp = (
-                            ee_object.sample(xy, scale=sample_scale)
-                            .first()
-                            .toDictionary()
-                            .getInfo()
+                        sample = sample_location(
+                            ee_object, latlon=latlon, scale=sample_scale
                         )
-                        b_names = ee_object.bandNames().getInfo()
-                        dict_values = dict(
-                            zip(b_names, [dict_values_tmp[b] for b in b_names])
-                        )
-                        self.chart_points.append(xy.coordinates().getInfo())
-                    band_values = list(dict_values.values())
+
+                    band_names = sample["band_names"]
+                    if any(len(name) > 3 for name in band_names):
+                        band_names = list(range(1, len(band_names) + 1))
+
+                    self.chart_labels = band_names
+                    self.chart_points.append(sample["coordinates"])
+                    band_values = sample["values"]
                     self.chart_values.append(band_values)
                     self.plot(band_names, band_values, **plot_options)
                     if plot_options["title"] == plot_layer_name:
@@ -1438,6 +1417,7 @@ class Map(ipyleaflet.Map):
         self.last_ee_data = self.ee_layer_dict[name]["ee_object"]
 
         if isinstance(ee_object, ee.Image) or isinstance(ee_object, ee.ImageCollection):
+            prefetch_image_metadata(ee_object)
             self.ee_raster_layers.append(ee_object)
             self.ee_raster_layer_names.append(name)
             if self.plot_dropdown_widget is not None:
@@ -1454,6 +1434,18 @@ class Map(ipyleaflet.Map):
 
     addLayer = add_ee_layer
 
+    def remove_layer(self, layer):
+        """Removes a layer from the map. The level of detail updates of a GeoJSON layer added with lod=True are stopped.
+
+        Args:
+            layer (ipyleaflet.Layer): The layer to remove.
+        """
+        handler = getattr(layer, "_lod_handler", None)
+        if handler is not None:
+            self.unobserve(handler, "bounds")
+            layer._lod_handler = None
+        super().remove_layer(layer)
+
     def remove_ee_layer(self, name):
         """Removes an Earth Engine layer.
 
@@ -2202,11 +2194,7 @@ class Map(ipyleaflet.Map):
         msg = "The plot function can only be used on ee.Image or ee.ImageCollection with more than one band."
         if (ee_object is None) and len(self.ee_raster_layers) > 0:
             ee_object = self.ee_raster_layers[-1]
-            if isinstance(ee_object, ee.ImageCollection):
-                ee_object = ee_object.mosaic()
-        elif isinstance(ee_object, ee.ImageCollection):
-            ee_object = ee_object.mosaic()
-        elif not isinstance(ee_object, ee.Image):
+        elif not isinstance(ee_object, (ee.Image, ee.ImageCollection)):
             print(msg)
             return
 
@@ -2216,7 +2204,7 @@ class Map(ipyleaflet.Map):
         if max_width is None:
             max_width = 500
 
-        band_names = ee_object.bandNames().getInfo()
+        band_names = ee_object_info(ee_object, ["band_names"])["band_names"]
 
         coordinates = []
         markers = []
@@ -2236,14 +2224,12 @@ class Map(ipyleaflet.Map):
                     markers.append(ipyleaflet.Marker(location=latlon))
                     marker_cluster.markers = markers
                     self.default_style = {"cursor": "wait"}
-                    xy = ee.Geometry.Point(latlon[::-1])
-                    dict_values = (
-                        ee_object.sample(xy, scale=sample_scale)
-                        .first()
-                        .toDictionary()
-                        .getInfo()
-                    )
-                    band_values = list(dict_values.values())
+                    band_values = sample_location(
+                        ee_object,
+                        latlon=latlon,
+                        scale=sample_scale,
+                        band_names=band_names,
+                    )["values"]
                     self.plot(
                         band_names,
                         band_values,
@@ -2267,6 +2253,155 @@ class Map(ipyleaflet.Map):
 
         self.on_interaction(handle_interaction)
 
+    def add_time_series_inspector(
+        self,
+        ee_object=None,
+        bands=None,
+        scale=None,
+        position="bottomright",
+        max_width=500,
+        max_height=300,
+        add_marker=True,
+    ):
+        """Plots the time series of an ee.ImageCollection at the clicked locations. Each click fetches the
+            time series of all bands for the point with a single getRegion request; clicked points are kept
+            so their series can be compared in the same chart. The eLTER product collections, e.g.,
+            products.water_index_collection(), can be inspected this way. The close button, or a new call,
+            removes the inspector, its click handler and its markers.
+
+        Args:
+            ee_object (ee.ImageCollection, optional): The image collection to inspect. Defaults to None, which uses the last image collection added to the map.
+            bands (list, optional): The bands to retrieve. Defaults to None, which retrieves all bands.
+            scale (float, optional): The scale in meters. Defaults to None, which uses the scale of the first band of each image.
+            position (str, optional): Position of the control, can be ‘bottomleft’, ‘bottomright’, ‘topleft’, or ‘topright’. Defaults to 'bottomright'.
+            max_width (int, optional): The width of the chart in pixels. Defaults to 500.
+            max_height (int, optional): The height of the chart in pixels. Defaults to 300.
+            add_marker (bool, optional): Whether to add a marker at each clicked location. Defaults to True.
+        """
+        # only one inspector listens to the map clicks at a time
+        if getattr(self, "_ts_inspector_close", None) is not None:
+            self._ts_inspector_close()
+
+        if ee_object is None:
+            collections = [
+                layer
+                for layer in self.ee_raster_layers
+                if isinstance(layer, ee.ImageCollection)
+            ]
+            if len(collections) == 0:
+                print("Please add an ee.ImageCollection to the map first.")
+                return
+            ee_object = collections[-1]
+        elif not isinstance(ee_object, ee.ImageCollection):
+            print("The time series inspector can only be used on ee.ImageCollection.")
+            return
+
+        if bands is None:
+            bands = ee_object_info(ee_object, ["band_names"])["band_names"]
+        elif isinstance(bands, str):
+            bands = [bands]
+
+        points = []
+        markers = []
+        marker_cluster = ipyleaflet.MarkerCluster(name="Time series points")
+        if add_marker:
+            self.add_layer(marker_cluster)
+
+        band_dropdown = widgets.Dropdown(
+            options=bands,
+            value=bands[0],
+            layout=widgets.Layout(width="150px"),
+        )
+        clear_button = widgets.Button(
+            description="Clear",
+            tooltip="Remove the clicked points",
+            layout=widgets.Layout(width="70px"),
+        )
+        close_button = widgets.ToggleButton(
+            value=False,
+            tooltip="Close the tool",
+            icon="times",
+            layout=widgets.Layout(
+                height="28px", width="28px", padding="0px 0px 0px 4px"
+            ),
+        )
+        output = widgets.Output()
+        ts_widget = widgets.VBox(
+            [widgets.HBox([band_dropdown, clear_button, close_button]), output]
+        )
+        ts_control = ipyleaflet.WidgetControl(widget=ts_widget, position=position)
+        self.add_control(ts_control)
+        self.ts_inspector_points = points
+
+        def update_chart(change=None):
+            band = band_dropdown.value
+            with output:
+                output.clear_output(wait=True)
+                if len(points) == 0:
+                    print("Click on the map to plot the time series.")
+                    return
+                fig = plt.figure(title=band, legend_location="top-left")
+                fig.layout.width = str(max_width) + "px"
+                fig.layout.height = str(max_height) + "px"
+                for latlon, df in points:
+                    series = df[band].dropna()
+                    plt.plot(
+                        series.index.values,
+                        series.values,
+                        labels=[f"{latlon[0]:.4f}, {latlon[1]:.4f}"],
+                        display_legend=True,
+                        marker="circle",
+                    )
+                plt.show()
+
+        def clear_click(b):
+            points.clear()
+            markers.clear()
+            marker_cluster.markers = []
+            update_chart()
+
+        band_dropdown.observe(update_chart, names="value")
+        clear_button.on_click(clear_click)
+
+        def handle_interaction(**kwargs):
+            latlon = kwargs.get("coordinates")
+            if kwargs.get("type") == "click":
+                self.default_style = {"cursor": "wait"}
+                try:
+                    df = pixel_time_series(ee_object, latlon, bands=bands, scale=scale)
+                    points.append((latlon, df))
+                    if add_marker:
+                        markers.append(ipyleaflet.Marker(location=latlon))
+                        marker_cluster.markers = markers
+                    update_chart()
+                except Exception as e:
+                    with output:
+                        output.clear_output()
+                        print("No data for the clicked location.")
+                        print(e)
+                self.default_style = {"cursor": "crosshair"}
+
+        def close():
+            self.on_interaction(handle_interaction, remove=True)
+            if ts_control in self.controls:
+                self.remove_control(ts_control)
+            if marker_cluster in self.layers:
+                self.remove_layer(marker_cluster)
+            ts_widget.close()
+            self.default_style = {"cursor": "default"}
+            self._ts_inspector_close = None
+
+        def close_btn_click(change):
+            if change["new"]:
+                close()
+
+        close_button.observe(close_btn_click, "value")
+
+        update_chart()
+        self.default_style = {"cursor": "crosshair"}
+        self.on_interaction(handle_interaction)
+        self._ts_inspector_close = close
+
     def add_marker_cluster(self, event="click", add_marker=True):
         """Captures user inputs and add markers to the map.
 
@@ -2581,14 +2716,19 @@ class Map(ipyleaflet.Map):
         self.add_control(ipyleaflet.ScaleControl(position="bottomleft"))
         self.add_control(ipyleaflet.FullScreenControl())
 
+        # Tile URLs are requested once per image and reused when the image is selected again.
+        left_urls = {}
+        right_urls = {}
+
         def left_dropdown_change(change):
             left_dropdown_index = left_dropdown.index
             if left_dropdown_index is not None and left_dropdown_index >= 0:
                 try:
+                    if left_dropdown_index in left_urls:
+                        left_layer.url = left_urls[left_dropdown_index]
+                        return
                     if isinstance(left_ts, ee.ImageCollection):
-                        left_image = left_ts.toList(left_ts.size()).get(
-                            left_dropdown_index
-                        )
+                        left_image = left_ts.toList(1, left_dropdown_index).get(0)
                     elif isinstance(left_ts, ee.List):
                         left_image = left_ts.get(left_dropdown_index)
                     else:
@@ -2605,6 +2745,7 @@ class Map(ipyleaflet.Map):
                     left_image = ee_tile_layer(
                         left_image, left_vis, left_names[left_dropdown_index]
                     )
+                    left_urls[left_dropdown_index] = left_image.url
                     left_layer.url = left_image.url
                 except Exception as e:
                     print(e)
@@ -2616,10 +2757,11 @@ class Map(ipyleaflet.Map):
             right_dropdown_index = right_dropdown.index
             if right_dropdown_index is not None and right_dropdown_index >= 0:
                 try:
+                    if right_dropdown_index in right_urls:
+                        right_layer.url = right_urls[right_dropdown_index]
+                        return
                     if isinstance(right_ts, ee.ImageCollection):
-                        right_image = right_ts.toList(left_ts.size()).get(
-                            right_dropdown_index
-                        )
+                        right_image = right_ts.toList(1, right_dropdown_index).get(0)
                     elif isinstance(right_ts, ee.List):
                         right_image = right_ts.get(right_dropdown_index)
                     else:
@@ -2638,6 +2780,7 @@ class Map(ipyleaflet.Map):
                         right_vis,
                         right_names[right_dropdown_index],
                     )
+                    right_urls[right_dropdown_index] = right_image.url
                     right_layer.url = right_image.url
                 except Exception as e:
                     print(e)
@@ -3902,7 +4045,7 @@ class Map(ipyleaflet.Map):
         #     return [x for x in dir(obj) if not x.startswith("_")]
 
         if isinstance(ee_object, ee.Image):
-            band_names = ee_object.bandNames().getInfo()
+            band_names = ee_object_info(ee_object, "band_names")["band_names"]
             band_count = len(band_names)
 
             if "min" in vis_params.keys():
@@ -4967,9 +5110,9 @@ class Map(ipyleaflet.Map):
                     ]
                     compute_label.value = "Computing ..."
 
-                    field.options = (
-                        ee.Feature(ee_object.first()).propertyNames().getInfo()
-                    )
+                    field.options = ee_object_info(ee_object, "property_names")[
+                        "property_names"
+                    ]
                     compute_label.value = ""
                     classes.value = "Any"
                     legend_chk.value = False
@@ -5205,6 +5348,7 @@ class Map(ipyleaflet.Map):
         fill_colors=["black"],
         info_mode="on_hover",
         encoding="utf-8",
+        lod=False,
     ):
         """Adds a shapefile to the map.
 
@@ -5217,6 +5361,7 @@ class Map(ipyleaflet.Map):
             fill_colors (list, optional): The random colors to use for filling polygons. Defaults to ["black"].
             info_mode (str, optional): Displays the attributes by either on_hover or on_click. Any value other than "on_hover" or "on_click" will be treated as None. Defaults to "on_hover".
             encoding (str, optional): The encoding of the shapefile. Defaults to "utf-8".
+            lod (bool, optional): Whether to render the layer with level of detail. See add_geojson(). Defaults to False.
 
         Raises:
             FileNotFoundError: The provided shapefile could not be found.
@@ -5235,6 +5380,7 @@ class Map(ipyleaflet.Map):
             fill_colors,
             info_mode,
             encoding,
+            lod=lod,
         )
 
     add_shapefile = add_shp
@@ -5249,6 +5395,8 @@ class Map(ipyleaflet.Map):
         fill_colors=["black"],
         info_mode="on_hover",
         encoding="utf-8",
+        lod=False,
+        lod_zoom_bands=None,
     ):
         """Adds a GeoJSON file to the map.
 
@@ -5261,6 +5409,10 @@ class Map(ipyleaflet.Map):
             fill_colors (list, optional): The random colors to use for filling polygons. Defaults to ["black"].
             info_mode (str, optional): Displays the attributes by either on_hover or on_click. Any value other than "on_hover" or "on_click" will be treated as None. Defaults to "on_hover".
             encoding (str, optional): The encoding of the GeoJSON file. Defaults to "utf-8".
+            lod (bool, optional): Whether to render the layer with level of detail. The geometries are pre-simplified per zoom band
+                with coordinates quantized to the visible precision, and only the features of the current zoom band that intersect
+                the view are sent to the browser. Defaults to False.
+            lod_zoom_bands (list, optional): A list of (min_zoom, max_zoom) tuples used when lod is True. See geojson_lod(). Defaults to None.
 
         Raises:
             FileNotFoundError: The provided GeoJSON file could not be found.
@@ -5389,7 +5541,24 @@ class Map(ipyleaflet.Map):
             html.value = value
 
         if style_callback is None:
-            style_callback = random_color
+            if lod and len(fill_colors) == 1:
+                # a static style avoids one Python callback per feature
+                style = {"color": "black", "fillColor": fill_colors[0], **style}
+            else:
+                style_callback = random_color
+
+        lod_levels = None
+        if lod:
+            lod_levels = geojson_lod(data, lod_zoom_bands)
+
+            def view_bounds():
+                if not self.bounds:
+                    return None
+                (south, west), (north, east) = self.bounds
+                dx, dy = (east - west) / 2, (north - south) / 2
+                return (west - dx, south - dy, east + dx, north + dy)
+
+            data = geojson_lod_view(lod_levels, self.zoom, view_bounds())
 
         if style_callback_only:
             geojson = ipyleaflet.GeoJSON(
@@ -5398,6 +5567,13 @@ class Map(ipyleaflet.Map):
                 style_callback=style_callback,
                 name=layer_name,
             )
+        elif style_callback is None:
+            geojson = ipyleaflet.GeoJSON(
+                data=data,
+                style=style,
+                hover_style=hover_style,
+                name=layer_name,
+            )
         else:
             geojson = ipyleaflet.GeoJSON(
                 data=data,
@@ -5413,6 +5589,24 @@ class Map(ipyleaflet.Map):
             geojson.on_click(update_html)
 
         self.add_layer(geojson)
+
+        if lod:
+
+            def update_lod(change):
+                if geojson not in self.layers:
+                    # the layer was removed without remove_layer(), e.g. by assigning self.layers
+                    self.unobserve(update_lod, "bounds")
+                    geojson._lod_handler = None
+                    return
+                view = geojson_lod_view(lod_levels, self.zoom, view_bounds())
+                if [id(f) for f in view["features"]] != [
+                    id(f) for f in geojson.data["features"]
+                ]:
+                    geojson.data = view
+
+            # stored with the layer so that remove_layer() can stop the updates
+            geojson._lod_handler = update_lod
+            self.observe(update_lod, "bounds")
         self.geojson_layers.append(geojson)
 
         if not hasattr(self, "json_layer_dict"):
@@ -5424,6 +5618,11 @@ class Map(ipyleaflet.Map):
             "hover_style": hover_style,
             "style_callback": style_callback,
         }
+        if lod:
+            params["lod_bytes"] = {
+                (level["min_zoom"], level["max_zoom"]): level["bytes"]
+                for level in lod_levels
+            }
         self.json_layer_dict[layer_name] = params
 
     def add_kml(
@@ -5482,6 +5681,7 @@ class Map(ipyleaflet.Map):
         fill_colors=["black"],
         info_mode="on_hover",
         encoding="utf-8",
+        lod=False,
         **kwargs,
     ):
         """Adds any geopandas-supported vector dataset to the map.
@@ -5499,6 +5699,7 @@ class Map(ipyleaflet.Map):
             fill_colors (list, optional): The random colors to use for filling polygons. Defaults to ["black"].
             info_mode (str, optional): Displays the attributes by either on_hover or on_click. Any value other than "on_hover" or "on_click" will be treated as None. Defaults to "on_hover".
             encoding (str, optional): The encoding to use to read the file. Defaults to "utf-8".
+            lod (bool, optional): Whether to render the layer with level of detail. See add_geojson(). Defaults to False.
 
         """
         if not filename.startswith("http"):
@@ -5530,6 +5731,7 @@ class Map(ipyleaflet.Map):
                     fill_colors,
                     info_mode,
                     encoding,
+                    lod=lod,
                 )
             elif ext in [".json", ".geojson"]:
                 self.add_geojson(
@@ -5541,6 +5743,7 @@ class Map(ipyleaflet.Map):
                     fill_colors,
                     info_mode,
                     encoding,
+                    lod=lod,
                 )
             else:
                 geojson = vector_to_geojson(
@@ -5561,6 +5764,7 @@ class Map(ipyleaflet.Map):
                     fill_colors,
                     info_mode,
                     encoding,
+                    lod=lod,
                 )
 
     def add_osm(
@@ -5928,6 +6132,7 @@ class Map(ipyleaflet.Map):
         info_mode="on_hover",
         zoom_to_layer=True,
         encoding="utf-8",
+        lod=False,
     ):
         """Adds a GeoDataFrame to the map.
 
@@ -5941,6 +6146,7 @@ class Map(ipyleaflet.Map):
             info_mode (str, optional): Displays the attributes by either on_hover or on_click. Any value other than "on_hover" or "on_click" will be treated as None. Defaults to "on_hover".
             zoom_to_layer (bool, optional): Whether to zoom to the layer.
             encoding (str, optional): The encoding of the GeoDataFrame. Defaults to "utf-8".
+            lod (bool, optional): Whether to render the layer with level of detail. See add_geojson(). Defaults to False.
         """
 
         data = gdf_to_geojson(gdf, epsg="4326")
@@ -5954,6 +6160,7 @@ class Map(ipyleaflet.Map):
             fill_colors,
             info_mode,
             encoding,
+            lod=lod,
         )
 
         if zoom_to_layer:
@@ -6264,9 +6471,16 @@ class Map(ipyleaflet.Map):
         icon_names=["info"],
         spin=False,
         add_legend=True,
+        max_markers=5000,
+        radius=4,
+        missing_color="lightgray",
         **kwargs,
     ):
-        """Adds a marker cluster to the map.
+        """Adds a marker cluster to the map. Tables with more than max_markers rows are rendered as
+            lightweight circle layers (one per category) drawn on a canvas instead of one marker widget per row,
+            and the popup of a point is built on click from the DataFrame. Canvas rendering is enabled through
+            the prefer_canvas option of the map, which only takes effect if the map has not been displayed yet;
+            otherwise create the map with prefer_canvas=True.
 
         Args:
             data (str | pd.DataFrame): A csv or Pandas DataFrame containing x, y, z values.
@@ -6280,8 +6494,12 @@ class Map(ipyleaflet.Map):
             icon_names (list, optional): A list of names to be used for the icons. More icons can be found at https://fontawesome.com/v4/icons. Defaults to ['info'].
             spin (bool, optional): If True, the icon will spin. Defaults to False.
             add_legend (bool, optional): If True, a legend will be added to the map. Defaults to True.
+            max_markers (int, optional): The maximum number of rows rendered as marker widgets. Defaults to 5000.
+            radius (int, optional): The radius in pixels of the circles used above max_markers. Defaults to 4.
+            missing_color (str, optional): The color of the points whose color_column value is missing. Defaults to "lightgray".
 
         """
+        import numpy as np
         import pandas as pd
 
         data = github_raw_url(data)
@@ -6325,7 +6543,7 @@ class Map(ipyleaflet.Map):
             )
 
         if color_column is not None:
-            items = list(set(df[color_column]))
+            items = pd.unique(df[color_column].dropna()).tolist()
 
         else:
             items = None
@@ -6378,88 +6596,92 @@ class Map(ipyleaflet.Map):
 
         df["x"] = df.geometry.x
         df["y"] = df.geometry.y
+        df = df.reset_index(drop=True)
 
-        points = list(zip(df["y"], df["x"]))
+        if items is not None:
+            # one vectorized lookup instead of items.index() per row; missing values get code -1
+            codes = pd.Categorical(df[color_column], categories=items).codes
+        else:
+            codes = np.zeros(len(df), dtype="int64")
+        has_missing = items is not None and bool((codes == -1).any())
 
-        if popup is not None:
-            if isinstance(popup, str):
-                labels = df[popup]
+        def code_style(code):
+            """Returns the marker color, icon color and icon name of a category code."""
+            if code == -1:
+                return missing_color, "white", icon_names[0]
+            return marker_colors[code], icon_colors[code], icon_names[code]
 
-                markers = []
-                for index, point in enumerate(points):
+        def popup_html(rows):
+            if isinstance(popup, str):
+                return rows[popup].astype(str)
+            labels = pd.Series("", index=rows.index)
+            for item in popup:
+                labels = labels + "<b>" + str(item) + "</b>: " + rows[item].astype(str)
+                labels = labels + "<br>"
+            return labels
+
+        if len(df) > max_markers:
+            # Circle markers are drawn on a single canvas instead of one SVG element per point.
+            self.prefer_canvas = True
+            css_colors = {"lightred": "#ff8e7f", "darkpurple": "#5b396b"}
+            layers = []
+            for code in np.unique(codes):
+                subset = np.flatnonzero(codes == code)
+                if items is not None:
+                    color = code_style(code)[0]
+                    color = css_colors.get(color, color)
+                else:
+                    color = "#3388ff"
+                coords = df.loc[subset, ["x", "y"]].to_numpy().round(6).tolist()
+                features = [
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": xy},
+                        "properties": {"index": int(index)},
+                    }
+                    for index, xy in zip(subset, coords)
+                ]
+                layer = ipyleaflet.GeoJSON(
+                    data={"type": "FeatureCollection", "features": features},
+                    point_style={
+                        "radius": radius,
+                        "color": color,
+                        "fillColor": color,
+                        "fillOpacity": 0.8,
+                        "weight": 1,
+                    },
+                )
+                layers.append(layer)
+
+            popup_state = {"layer": None}
+
+            def show_popup(feature, **kwargs):
+                index = feature["properties"]["index"]
+                row = df.iloc[[index]]
+                if popup_state["layer"] is not None:
+                    self.remove_layer(popup_state["layer"])
+                popup_state["layer"] = ipyleaflet.Popup(
+                    location=(row["y"].iloc[0], row["x"].iloc[0]),
+                    child=widgets.HTML(popup_html(row).iloc[0]),
+                    close_button=True,
+                )
+                self.add_layer(popup_state["layer"])
 
-                    if items is not None:
-                        marker_color = marker_colors[
-                            items.index(df[color_column][index])
-                        ]
-                        icon_name = icon_names[items.index(df[color_column][index])]
-                        icon_color = icon_colors[items.index(df[color_column][index])]
-                        marker_icon = ipyleaflet.AwesomeIcon(
-                            name=icon_name,
-                            marker_color=marker_color,
-                            icon_color=icon_color,
-                            spin=spin,
-                        )
-                    else:
-                        marker_icon = None
+            for layer in layers:
+                layer.on_click(show_popup)
 
-                    marker = ipyleaflet.Marker(
-                        location=point,
-                        draggable=False,
-                        popup=widgets.HTML(str(labels[index])),
-                        icon=marker_icon,
-                    )
-                    markers.append(marker)
+            self.add_layer(ipyleaflet.LayerGroup(layers=layers, name=layer_name))
 
-            elif isinstance(popup, list):
-                labels = []
-                for i in range(len(points)):
-                    label = ""
-                    for item in popup:
-                        label = (
-                            label
-                            + "<b>"
-                            + str(item)
-                            + "</b>"
-                            + ": "
-                            + str(df[item][i])
-                            + "<br>"
-                        )
-                    labels.append(label)
+        else:
+            points = list(zip(df["y"], df["x"]))
+            labels = popup_html(df).tolist()
+            if not isinstance(popup, str):
                 df["popup"] = labels
 
-                markers = []
-                for index, point in enumerate(points):
-                    if items is not None:
-                        marker_color = marker_colors[
-                            items.index(df[color_column][index])
-                        ]
-                        icon_name = icon_names[items.index(df[color_column][index])]
-                        icon_color = icon_colors[items.index(df[color_column][index])]
-                        marker_icon = ipyleaflet.AwesomeIcon(
-                            name=icon_name,
-                            marker_color=marker_color,
-                            icon_color=icon_color,
-                            spin=spin,
-                        )
-                    else:
-                        marker_icon = None
-
-                    marker = ipyleaflet.Marker(
-                        location=point,
-                        draggable=False,
-                        popup=widgets.HTML(labels[index]),
-                        icon=marker_icon,
-                    )
-                    markers.append(marker)
-
-        else:
             markers = []
-            for point in points:
+            for index, point in enumerate(points):
                 if items is not None:
-                    marker_color = marker_colors[items.index(df[color_column][index])]
-                    icon_name = icon_names[items.index(df[color_column][index])]
-                    icon_color = icon_colors[items.index(df[color_column][index])]
+                    marker_color, icon_color, icon_name = code_style(codes[index])
                     marker_icon = ipyleaflet.AwesomeIcon(
                         name=icon_name,
                         marker_color=marker_color,
@@ -6470,17 +6692,24 @@ class Map(ipyleaflet.Map):
                     marker_icon = None
 
                 marker = ipyleaflet.Marker(
-                    location=point, draggable=False, icon=marker_icon
+                    location=point,
+                    draggable=False,
+                    popup=widgets.HTML(labels[index]),
+                    icon=marker_icon,
                 )
                 markers.append(marker)
 
-        marker_cluster = ipyleaflet.MarkerCluster(markers=markers, name=layer_name)
-        self.add_layer(marker_cluster)
+            marker_cluster = ipyleaflet.MarkerCluster(markers=markers, name=layer_name)
+            self.add_layer(marker_cluster)
 
         if items is not None and add_legend:
-            marker_colors = [check_color(c) for c in marker_colors]
+            legend_colors = [check_color(c) for c in marker_colors]
+            legend_labels = [str(item) for item in items]
+            if has_missing:
+                legend_colors.append(check_color(missing_color))
+                legend_labels.append("Missing")
             self.add_legend(
-                title=color_column.title(), colors=marker_colors, labels=items
+                title=color_column.title(), colors=legend_colors, labels=legend_labels
             )
 
         self.default_style = {"cursor": "default"}
@@ -6913,6 +7142,7 @@ class Map(ipyleaflet.Map):
         shift_lon=True,
         lat="lat",
         lon="lon",
+        time_index=None,
         **kwargs,
     ):
         """Generate an ipyleaflet/folium TileLayer from a netCDF file.
@@ -6935,6 +7165,7 @@ class Map(ipyleaflet.Map):
             shift_lon (bool, optional): Flag to shift longitude values from [0, 360] to the range [-180, 180]. Defaults to True.
             lat (str, optional): Name of the latitude variable. Defaults to 'lat'.
             lon (str, optional): Name of the longitude variable. Defaults to 'lon'.
+            time_index (int, optional): The index along the time dimension to display. Defaults to None.
         """
 
         if in_colab_shell():
@@ -6942,7 +7173,12 @@ class Map(ipyleaflet.Map):
             return
 
         tif, vars = netcdf_to_tif(
-            filename, shift_lon=shift_lon, lat=lat, lon=lon, return_vars=True
+            filename,
+            shift_lon=shift_lon,
+            lat=lat,
+            lon=lon,
+            return_vars=True,
+            time_index=time_index,
         )
 
         if variables is None:
@@ -7718,15 +7954,15 @@ def ts_inspector(
         add_fullscreen = kwargs["fullscreen_ctrl"]
 
     if layers_dict is None:
-        layers_dict = {}
-        keys = dict(basemaps).keys()
-        for key in keys:
-            if isinstance(basemaps[key], ipyleaflet.WMSLayer):
-                pass
-            else:
-                layers_dict[key] = basemaps[key]
-
-    keys = list(layers_dict.keys())
+        # Only the two selected basemaps are turned into layers.
+        layers_dict = basemaps
+        keys = [
+            key
+            for key in basemaps
+            if (basemaps.descriptor(key) or {}).get("kind") != "wms"
+        ]
+    else:
+        keys = list(layers_dict.keys())
     if left_name is None:
         left_name = keys[0]
     if right_name is None:
@@ -9,8 +9,7 @@ import json
 import random
 import requests
 import ipywidgets as widgets
-from box import Box
-from .basemaps import xyz_to_heremap
+from .basemaps import basemap_registry
 from .common import *
 from . import examples
 
@@ -36,7 +35,7 @@ from here_map_widget import (
 )
 
 
-basemaps = Box(xyz_to_heremap(), frozen_box=True)
+basemaps = basemap_registry("heremap")
 
 
 class Map(here_map_widget.Map):
@@ -0,0 +1,418 @@
+"""Module for rendering XYZ tiles from local rasters in-process, without localtileserver or TiTiler.
+Tiles are read with rasterio windowed reads through a per-tile WarpedVRT, which lets GDAL use the
+overviews of Cloud Optimized GeoTIFFs, and are kept in an LRU cache. Dataset handles are shared by
+all layers showing the same file. Handles, statistics and tiles are keyed on the file modification time
+and size, so a raster rewritten in place is read again.
+"""
+
+import collections
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Web Mercator half extent in meters.
+_WORLD = 20037508.342789244
+
+_datasets = {}
+_datasets_lock = threading.Lock()
+
+
+def _file_version(path):
+    """Returns the modification time, size and inode of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def open_dataset(source):
+    """Returns a shared rasterio dataset handle and the lock that guards reads from it.
+
+    Args:
+        source (str): The path to the raster file.
+
+    Returns:
+        tuple: The rasterio dataset and a threading.Lock.
+    """
+    import rasterio
+
+    source = os.path.abspath(os.path.expanduser(source))
+    version = _file_version(source)
+    with _datasets_lock:
+        entry = _datasets.get(source)
+        if entry is None or entry[0].closed or entry[2] != version:
+            if entry is not None:
+                with entry[1]:
+                    entry[0].close()
+            _datasets[source] = (rasterio.open(source), threading.Lock(), version)
+        dataset, lock, _ = _datasets[source]
+        return dataset, lock
+
+
+def close_datasets():
+    """Closes all shared dataset handles."""
+    with _datasets_lock:
+        for dataset, lock, _ in _datasets.values():
+            with lock:
+                dataset.close()
+        _datasets.clear()
+
+
+def evict(source):
+    """Closes the shared dataset handle of a raster file and drops the cached tiles and statistics of its client.
+    Call it before replacing the file, so the handle does not keep the old file open.
+
+    Args:
+        source (str): The path to the raster file.
+    """
+    source = os.path.abspath(os.path.expanduser(source))
+    with _datasets_lock:
+        entry = _datasets.pop(source, None)
+    if entry is not None:
+        with entry[1]:
+            entry[0].close()
+    client = _clients.get(source)
+    if client is not None:
+        client._version = None
+
+
+def palette_lut(palette=None, n=256):
+    """Interpolates a list of colors into an RGB lookup table.
+
+    Args:
+        palette (str | list, optional): The name of a matplotlib colormap or a list of hex colors. Defaults to None, which returns a greyscale table.
+        n (int, optional): The number of entries of the table. Defaults to 256.
+
+    Returns:
+        np.ndarray: An (n, 3) uint8 array.
+    """
+    import numpy as np
+
+    if not palette:
+        ramp = np.linspace(0, 255, n).astype("uint8")
+        return np.stack([ramp, ramp, ramp], axis=1)
+
+    if isinstance(palette, str):
+        from .colormaps import get_palette_lut
+
+        return get_palette_lut(palette, n)[:, :3]
+
+    colors = np.array(
+        [[int(c.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4)] for c in palette],
+        dtype="float64",
+    )
+    if len(colors) == 1:
+        return np.repeat(colors.astype("uint8"), n, axis=0)
+    stops = np.linspace(0, 1, len(colors))
+    positions = np.linspace(0, 1, n)
+    lut = np.stack(
+        [np.interp(positions, stops, colors[:, i]) for i in range(3)], axis=1
+    )
+    return lut.round().astype("uint8")
+
+
+class LocalTileClient:
+    """Renders XYZ tiles and answers bounds, statistics and pixel value queries for a local raster.
+    The public methods mirror the parts of localtileserver.TileClient used by the map.
+    """
+
+    def __init__(self, source, cache_size=512):
+        """Initialize the LocalTileClient object.
+
+        Args:
+            source (str): The path to the raster file.
+            cache_size (int, optional): The number of rendered tiles kept in the LRU cache. Defaults to 512.
+        """
+        self.source = os.path.abspath(os.path.expanduser(source))
+        if not os.path.exists(self.source):
+            raise ValueError("The source path does not exist.")
+        self.cache_size = cache_size
+        self._tiles = collections.OrderedDict()
+        self._tiles_lock = threading.Lock()
+        self._stats = None
+        self._version = None
+        self._refresh()
+
+    def _refresh(self):
+        """Drops the cached tiles and statistics if the file changed since they were computed."""
+        version = _file_version(self.source)
+        if version is not None and version == self._version:
+            return
+        dataset, _ = open_dataset(self.source)
+        with self._tiles_lock:
+            self._tiles.clear()
+        self._stats = None
+        self.band_names = [
+            description or f"b{index}"
+            for index, description in enumerate(dataset.descriptions, start=1)
+        ]
+        self._version = version
+
+    def bounds(self):
+        """Returns the bounds of the raster in EPSG:4326 as [ymin, ymax, xmin, xmax]."""
+        from rasterio.warp import transform_bounds
+
+        self._refresh()
+        dataset, _ = open_dataset(self.source)
+        west, south, east, north = transform_bounds(
+            dataset.crs, "EPSG:4326", *dataset.bounds
+        )
+        return [south, north, west, east]
+
+    def metadata(self):
+        """Returns the band statistics as {"bands": {name: {"min", "max", "mean", "std", "percentile_2", "percentile_98"}}},
+        using the keys of the TiTiler statistics. The statistics are computed once from the coarsest overview.
+        """
+        import numpy as np
+
+        self._refresh()
+        if self._stats is None:
+            dataset, lock = open_dataset(self.source)
+            factor = max(dataset.overviews(1) or [1])
+            shape = (
+                dataset.count,
+                max(1, dataset.height // factor),
+                max(1, dataset.width // factor),
+            )
+            with lock:
+                data = dataset.read(out_shape=shape, masked=True)
+            stats = {}
+            for name, band in zip(self.band_names, data):
+                values = band.compressed().astype("float64")
+                if values.size == 0:
+                    values = np.array([np.nan])
+                stats[name] = {
+                    "min": float(np.min(values)),
+                    "max": float(np.max(values)),
+                    "mean": float(np.mean(values)),
+                    "std": float(np.std(values)),
+                    "percentile_2": float(np.percentile(values, 2)),
+                    "percentile_98": float(np.percentile(values, 98)),
+                }
+            self._stats = stats
+        return {"bands": self._stats}
+
+    def pixel(self, lat, lon, units="EPSG:4326", **kwargs):
+        """Returns the pixel values at a location as {"bands": {name: value}}.
+
+        Args:
+            lat (float): The latitude (or y coordinate in `units`).
+            lon (float): The longitude (or x coordinate in `units`).
+            units (str, optional): The CRS of the coordinates. Defaults to "EPSG:4326".
+        """
+        import numpy as np
+        from rasterio.warp import transform
+        from rasterio.windows import Window
+
+        self._refresh()
+        dataset, lock = open_dataset(self.source)
+        xs, ys = transform(units, dataset.crs, [lon], [lat])
+        row, col = dataset.index(xs[0], ys[0])
+        if not (0 <= row < dataset.height and 0 <= col < dataset.width):
+            return {}
+        with lock:
+            values = dataset.read(window=Window(col, row, 1, 1), masked=True)
+        pixel = values[:, 0, 0]
+        mask = np.ma.getmaskarray(pixel)
+        result = {
+            name: None if masked else value.item()
+            for name, value, masked in zip(self.band_names, pixel.data, mask)
+        }
+        return {"bands": result}
+
+    def tile(self, z, x, y, band=None, palette=None, vmin=None, vmax=None, nodata=None):
+        """Renders an XYZ tile as PNG bytes.
+
+        Args:
+            z (int): The zoom level.
+            x (int): The tile column.
+            y (int): The tile row.
+            band (int | list, optional): The band (1-based) or list of three bands to render. Defaults to None, which uses
+                the first three bands (or the first band for single-band rasters).
+            palette (str | list, optional): A colormap name or a list of hex colors applied to a single band. Defaults to None.
+            vmin (float, optional): The value mapped to the start of the palette. Defaults to the band minimum.
+            vmax (float, optional): The value mapped to the end of the palette. Defaults to the band maximum.
+            nodata (float, optional): The value rendered as transparent. Defaults to the dataset nodata.
+
+        Returns:
+            bytes: The PNG encoded tile.
+        """
+        self._refresh()
+        if isinstance(band, int):
+            band = [band]
+        key = (
+            z,
+            x,
+            y,
+            tuple(band) if band else None,
+            tuple(palette) if palette else None,
+            vmin,
+            vmax,
+            nodata,
+        )
+        with self._tiles_lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+        content = self._render(z, x, y, band, palette, vmin, vmax, nodata)
+
+        with self._tiles_lock:
+            self._tiles[key] = content
+            if len(self._tiles) > self.cache_size:
+                self._tiles.popitem(last=False)
+        return content
+
+    def _render(self, z, x, y, band, palette, vmin, vmax, nodata):
+        import numpy as np
+        from PIL import Image
+        from rasterio.enums import Resampling
+        from rasterio.transform import from_bounds
+        from rasterio.vrt import WarpedVRT
+
+        dataset, lock = open_dataset(self.source)
+
+        if band is None:
+            band = [1, 2, 3] if dataset.count >= 3 else [1]
+
+        size = 2 * _WORLD / 2**z
+        left = -_WORLD + x * size
+        top = _WORLD - y * size
+        transform = from_bounds(left, top - size, left + size, top, 256, 256)
+
+        vrt_options = {
+            "crs": "EPSG:3857",
+            "transform": transform,
+            "width": 256,
+            "height": 256,
+            "resampling": Resampling.nearest,
+        }
+        if nodata is not None:
+            vrt_options["src_nodata"] = nodata
+            vrt_options["nodata"] = nodata
+
+        with lock:
+            with WarpedVRT(dataset, **vrt_options) as vrt:
+                data = vrt.read(band, masked=True)
+
+        stats = self.metadata()["bands"]
+        names = [self.band_names[b - 1] for b in band]
+        low = vmin if vmin is not None else min(stats[n]["min"] for n in names)
+        high = vmax if vmax is not None else max(stats[n]["max"] for n in names)
+        span = (high - low) or 1
+
+        scaled = (data.astype("float64").filled(low) - low) / span
+        scaled = (np.clip(scaled, 0, 1) * 255).astype("uint8")
+        alpha = np.where(np.ma.getmaskarray(data).any(axis=0), 0, 255).astype("uint8")
+
+        if len(band) == 1:
+            rgb = np.take(palette_lut(palette), scaled[0], axis=0)
+        else:
+            rgb = np.moveaxis(scaled[:3], 0, -1)
+
+        rgba = np.dstack([rgb, alpha])
+        buffer = io.BytesIO()
+        Image.fromarray(rgba, mode="RGBA").save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+class _TileRequestHandler(BaseHTTPRequestHandler):
+    """Serves /<layer_id>/<z>/<x>/<y>.png from the registered layers."""
+
+    def do_GET(self):
+        try:
+            layer_id, z, x, y = self.path.strip("/").split("?")[0].split("/")
+            client, render_args = _TileServer.layers[layer_id]
+            content = client.tile(int(z), int(x), int(y.split(".")[0]), **render_args)
+        except (KeyError, ValueError):
+            self.send_error(404)
+            return
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _TileServer:
+    """A single in-process HTTP server shared by all local tile layers."""
+
+    server = None
+    layers = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def start(cls):
+        with cls.lock:
+            if cls.server is None:
+                cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _TileRequestHandler)
+                cls.server.daemon_threads = True
+                thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+                thread.start()
+        return cls.server.server_address[1]
+
+    @classmethod
+    def register(cls, client, **render_args):
+        port = cls.start()
+        layer_id = f"{id(client):x}{len(cls.layers)}"
+        cls.layers[layer_id] = (client, render_args)
+
+        prefix = os.environ.get("JUPYTERHUB_SERVICE_PREFIX")
+        if prefix is not None:
+            base = f"{prefix.rstrip('/')}/proxy/{port}"
+        else:
+            base = f"http://127.0.0.1:{port}"
+        return f"{base}/{layer_id}/{{z}}/{{x}}/{{y}}.png"
+
+
+_clients = {}
+
+
+def get_tile_client(source, cache_size=512):
+    """Returns the shared LocalTileClient of a raster file, creating it on first use.
+
+    Args:
+        source (str | LocalTileClient): The path to the raster file or an existing client.
+        cache_size (int, optional): The number of rendered tiles kept in the LRU cache. Defaults to 512.
+
+    Returns:
+        LocalTileClient: The tile client.
+    """
+    if isinstance(source, LocalTileClient):
+        return source
+    source = os.path.abspath(os.path.expanduser(source))
+    if source not in _clients:
+        _clients[source] = LocalTileClient(source, cache_size=cache_size)
+    return _clients[source]
+
+
+def local_tile_url(source, band=None, palette=None, vmin=None, vmax=None, nodata=None):
+    """Registers a local raster with the in-process tile server and returns its XYZ URL template.
+
+    Args:
+        source (str | LocalTileClient): The path to the raster file or a tile client.
+        band (int | list, optional): The band (1-based) or list of three bands to render. Defaults to None.
+        palette (str | list, optional): A colormap name or a list of hex colors applied to a single band. Defaults to None.
+        vmin (float, optional): The value mapped to the start of the palette. Defaults to None.
+        vmax (float, optional): The value mapped to the end of the palette. Defaults to None.
+        nodata (float, optional): The value rendered as transparent. Defaults to None.
+
+    Returns:
+        tuple: The URL template and the LocalTileClient.
+    """
+    client = get_tile_client(source)
+    url = _TileServer.register(
+        client, band=band, palette=palette, vmin=vmin, vmax=vmax, nodata=nodata
+    )
+    return url, client
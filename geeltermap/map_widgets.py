@@ -1403,9 +1403,6 @@ class _RasterLayerEditor(ipywidgets.VBox):
             pyplot.show()
 
     def _classes_changed(self, change):
-        import matplotlib  # pylint: disable=import-outside-toplevel
-        from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
-
         if not change["new"]:
             return
 
@@ -1415,10 +1412,9 @@ class _RasterLayerEditor(ipywidgets.VBox):
             if selected != "Any":
                 n_class = int(self._classes_dropdown.value)
 
-            colors = pyplot.cm.get_cmap(self._colormap_dropdown.value, n_class)
-            cmap_colors = [
-                matplotlib.colors.rgb2hex(colors(i))[1:] for i in range(colors.N)
-            ]
+            cmap_colors = common.get_palette_colors(
+                self._colormap_dropdown.value, n_class
+            )
             self._render_colorbar(cmap_colors)
 
             if len(self._palette_label.value) > 0 and "," in self._palette_label.value:
@@ -1468,18 +1464,14 @@ class _RasterLayerEditor(ipywidgets.VBox):
             self._linear_checkbox.value = True
 
     def _colormap_changed(self, change):
-        import matplotlib  # pylint: disable=import-outside-toplevel
-        from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
-
         if change["new"]:
             n_class = None
             if self._classes_dropdown.value != "Any":
                 n_class = int(self._classes_dropdown.value)
 
-            colors = pyplot.cm.get_cmap(self._colormap_dropdown.value, n_class)
-            cmap_colors = [
-                matplotlib.colors.rgb2hex(colors(i))[1:] for i in range(colors.N)
-            ]
+            cmap_colors = common.get_palette_colors(
+                self._colormap_dropdown.value, n_class
+            )
             self._render_colorbar(cmap_colors)
 
             if len(self._palette_label.value) > 0 and "," in self._palette_label.value:
@@ -2058,9 +2050,6 @@ class _VectorLayerEditor(ipywidgets.VBox):
             pyplot.show()
 
     def _classes_changed(self, change):
-        import matplotlib  # pylint: disable=import-outside-toplevel
-        from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
-
         if change["new"]:
             selected = change["owner"].value
             if self._colormap_dropdown.value is not None:
@@ -2068,10 +2057,9 @@ class _VectorLayerEditor(ipywidgets.VBox):
                 if selected != "Any":
                     n_class = int(self._classes_dropdown.value)
 
-                colors = pyplot.cm.get_cmap(self._colormap_dropdown.value, n_class)
-                cmap_colors = [
-                    matplotlib.colors.rgb2hex(colors(i))[1:] for i in range(colors.N)
-                ]
+                cmap_colors = common.get_palette_colors(
+                    self._colormap_dropdown.value, n_class
+                )
                 self._render_colorbar(cmap_colors)
 
                 if (
@@ -2085,18 +2073,14 @@ class _VectorLayerEditor(ipywidgets.VBox):
                     self._legend_labels_label.value = ", ".join(labels)
 
     def _colormap_changed(self, change):
-        import matplotlib  # pylint: disable=import-outside-toplevel
-        from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
-
         if change["new"]:
             n_class = None
             if self._classes_dropdown.value != "Any":
                 n_class = int(self._classes_dropdown.value)
 
-            colors = pyplot.cm.get_cmap(self._colormap_dropdown.value, n_class)
-            cmap_colors = [
-                matplotlib.colors.rgb2hex(colors(i))[1:] for i in range(colors.N)
-            ]
+            cmap_colors = common.get_palette_colors(
+                self._colormap_dropdown.value, n_class
+            )
             self._render_colorbar(cmap_colors)
 
             if len(self._palette_label.value) > 0 and "," in self._palette_label.value:
@@ -2,7 +2,7 @@ import os
 import numpy as np
 import pandas as pd
 import ipywidgets as widgets
-from .basemaps import xyz_to_plotly
+from .basemaps import basemap_registry
 from .common import *
 from .osm import *
 from . import examples
@@ -16,7 +16,7 @@ except ImportError:
         "This module requires the plotly package. Please install it using 'pip install plotly'."
     )
 
-basemaps = xyz_to_plotly()
+basemaps = basemap_registry("plotly")
 
 
 class Canvas:
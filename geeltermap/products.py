@@ -0,0 +1,396 @@
+"""Module for computing the eLTER products (water masks, land surface temperature and phenometrics) without widgets.
+The PhenoApp, WaterDetect and LST tools in toolbar.py build their Earth Engine graphs with the functions in this module,
+so the same products can be computed for many sites from scripts and scheduled jobs.
+"""
+
+import os
+
+import ee
+
+from .common import (
+    download_ee_image,
+    gdf_to_ee,
+    scale_ETM,
+    scale_MODIS_ST,
+    scale_OLI,
+    scale_OLI_ST,
+)
+
+# Reducers offered by the tools to build a composite from a collection.
+COMPOSITES = {
+    "Max": lambda col: col.max(),
+    "Min": lambda col: col.min(),
+    "Mean": lambda col: col.mean(),
+    "Median": lambda col: col.median(),
+    "Percentile 10": lambda col: col.reduce(ee.Reducer.percentile([10])),
+    "Percentile 20": lambda col: col.reduce(ee.Reducer.percentile([20])),
+    "Percentile 90": lambda col: col.reduce(ee.Reducer.percentile([90])),
+    "Percentile 95": lambda col: col.reduce(ee.Reducer.percentile([95])),
+}
+
+WATER_INDICES = ["NDWI_McFeeters", "NDWI_Gao", "AWEI", "MNDWI", "SWIR2"]
+
+LST_BANDS = ["ST_B10", "LST_Day_1km", "LST_Night_1km"]
+
+PHENOMETRICS = {
+    "SOS": "Greenup_1",
+    "MOS": "Peak_1",
+    "EOS": "Senescence_1",
+    "LOS": "EVI_Amplitude_1",
+}
+
+# Names of the sites whose Sentinel 2 phenometrics are stored as assets.
+PHENO_ASSET_NAMES = {
+    "Doñana Long-Term Socio-ecological Research Platform": "Donana",
+    "Braila Islands": "Braila",
+    "LTSER-Sabor": "Baixo",
+    "River Exe": "River_Exe",
+    "Cairngorms National Park LTSER": "Cairngorms",
+    "LTSER Veluwe": "Veluwe",
+    "Gran Paradiso National Park": "Gran_Paradiso",
+    "Schorfheide-Chorin": "Schorfheide",
+    "LTSER Platform Neusiedler See": "Neusiedler",
+}
+
+
+def water_collections():
+    """Returns the optical collections used by the water products, with bands renamed to Blue, Green, Red, Nir, Swir1 and Swir2.
+
+    Returns:
+        dict: A dictionary with the keys 'Landsat' and 'Sentinel 2'.
+    """
+    OLI = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2").merge(
+        ee.ImageCollection("LANDSAT/LC08/C02/T1_L2")
+    )
+    ETM = (
+        ee.ImageCollection("LANDSAT/LE07/C02/T1_L2")
+        .merge(ee.ImageCollection("LANDSAT/LT05/C02/T1_L2"))
+        .merge(ee.ImageCollection("LANDSAT/LT04/C02/T1_L2"))
+    )
+    landsat = OLI.map(scale_OLI).merge(ETM.map(scale_ETM))
+
+    # Sentinel 2 TOA is used instead of surface reflectance because it starts two years earlier.
+    s2 = ee.ImageCollection("COPERNICUS/S2_HARMONIZED").select(
+        ["B2", "B3", "B4", "B8", "B11", "B12"],
+        ["Blue", "Green", "Red", "Nir", "Swir1", "Swir2"],
+    )
+    return {"Landsat": landsat, "Sentinel 2": s2}
+
+
+def lst_collections():
+    """Returns the thermal collections used by the LST product, scaled to degrees Celsius.
+
+    Returns:
+        dict: A dictionary with the keys 'Landsat' and 'MODIS'.
+    """
+    landsat = (
+        ee.ImageCollection("LANDSAT/LC08/C02/T1_L2")
+        .merge(ee.ImageCollection("LANDSAT/LC09/C02/T1_L2"))
+        .map(scale_OLI_ST)
+    )
+    modis = ee.ImageCollection("MODIS/061/MOD11A1").map(scale_MODIS_ST)
+    return {"Landsat": landsat, "MODIS": modis}
+
+
+_site_boundaries = {}
+
+
+def site_geometry(site):
+    """Returns the boundaries of an eLTER site as an ee.FeatureCollection. Boundaries fetched from DEIMS are cached.
+
+    Args:
+        site (str | ee.Geometry | ee.Feature | ee.FeatureCollection): A DEIMS site id or an Earth Engine object.
+
+    Returns:
+        ee.FeatureCollection | ee.Geometry: The site boundaries.
+    """
+    if isinstance(site, str):
+        if site not in _site_boundaries:
+            import deims
+
+            _site_boundaries[site] = gdf_to_ee(deims.getSiteBoundaries(site))
+        return _site_boundaries[site]
+    elif isinstance(site, ee.Feature):
+        return ee.FeatureCollection([site])
+    elif isinstance(site, (ee.Geometry, ee.FeatureCollection)):
+        return site
+    else:
+        raise TypeError(
+            "site must be a DEIMS id, an ee.Geometry, an ee.Feature or an ee.FeatureCollection."
+        )
+
+
+def reduce_composite(collection, reducer="Median"):
+    """Reduces a collection to a composite with one of the reducers offered by the tools.
+
+    Args:
+        collection (ee.ImageCollection): The collection to reduce.
+        reducer (str, optional): One of the keys of COMPOSITES. Defaults to "Median".
+
+    Returns:
+        ee.Image: The composite.
+    """
+    return COMPOSITES.get(reducer, COMPOSITES["Median"])(collection)
+
+
+def filter_site_collection(collection, geom, start_date, end_date, clouds=None, cloud_property=None):
+    """Filters a collection to a site and a date range, optionally by cloud cover, and clips it to the site.
+
+    Args:
+        collection (ee.ImageCollection): The collection to filter.
+        geom (ee.Geometry | ee.FeatureCollection): The site boundaries.
+        start_date (str): The start date, e.g., '2020-01-01'.
+        end_date (str): The end date, e.g., '2020-12-31'.
+        clouds (int, optional): The maximum cloud cover in percent. Defaults to None.
+        cloud_property (str, optional): The cloud cover property of the collection. Defaults to None.
+
+    Returns:
+        ee.ImageCollection: The filtered and clipped collection.
+    """
+    dataset = collection.filterBounds(geom).filterDate(
+        ee.Date(str(start_date)), ee.Date(str(end_date))
+    )
+    if clouds is not None and cloud_property is not None:
+        dataset = dataset.filterMetadata(cloud_property, "less_than", int(clouds))
+    return dataset.map(lambda image: image.clip(geom))
+
+
+def add_water_indices(image, collection="Sentinel 2"):
+    """Adds the NDVI, MNDWI, NDWI_McFeeters, NDWI_Gao, AWEI, BSI and SWIR2 bands to an image.
+
+    Args:
+        image (ee.Image): An image with the bands Blue, Green, Red, Nir, Swir1 and Swir2.
+        collection (str, optional): The collection the image belongs to, 'Sentinel 2' or 'Landsat'. Defaults to "Sentinel 2".
+
+    Returns:
+        ee.Image: The image with the index bands.
+    """
+    bands = {
+        "NIR": image.select("Nir"),
+        "BLUE": image.select("Blue"),
+        "GREEN": image.select("Green"),
+        "RED": image.select("Red"),
+        "SWIR1": image.select("Swir1"),
+        "SWIR2": image.select("Swir2"),
+    }
+    swir2 = image.select("Swir2")
+    if collection == "Sentinel 2":
+        swir2 = swir2.divide(1000)
+
+    return image.addBands(
+        ee.Image.cat(
+            image.normalizedDifference(["Nir", "Red"]).rename("NDVI"),
+            image.normalizedDifference(["Green", "Swir1"]).rename("MNDWI"),
+            image.normalizedDifference(["Green", "Nir"]).rename("NDWI_McFeeters"),
+            image.normalizedDifference(["Nir", "Swir1"]).rename("NDWI_Gao"),
+            image.expression(
+                "BLUE + 2.5 * GREEN - 1.5 * (NIR + SWIR1) - 0.25 * SWIR2", bands
+            ).rename("AWEI"),
+            image.expression(
+                "((SWIR2 + RED)-(NIR + BLUE)) / ((SWIR2 + RED)+(NIR + BLUE))", bands
+            ).rename("BSI"),
+            swir2.rename("SWIR2"),
+        )
+    )
+
+
+def water_index_collection(site, collection="Sentinel 2", dates=None, clouds=20):
+    """Returns the clipped collection of a site with the water index bands added.
+
+    Args:
+        site (str | ee.Geometry | ee.FeatureCollection): A DEIMS site id or the site boundaries.
+        collection (str, optional): 'Sentinel 2' or 'Landsat'. Defaults to "Sentinel 2".
+        dates (tuple, optional): The start and end dates. Defaults to None, which uses the year 2022.
+        clouds (int, optional): The maximum cloud cover in percent. Defaults to 20.
+
+    Returns:
+        ee.ImageCollection: The collection with index bands.
+    """
+    if collection not in ["Sentinel 2", "Landsat"]:
+        raise ValueError("collection must be either 'Sentinel 2' or 'Landsat'.")
+    if dates is None:
+        dates = ("2022-01-01", "2022-12-31")
+
+    geom = site_geometry(site)
+    cloud_property = (
+        "CLOUDY_PIXEL_PERCENTAGE" if collection == "Sentinel 2" else "CLOUD_COVER"
+    )
+    clipped = filter_site_collection(
+        water_collections()[collection], geom, dates[0], dates[1], clouds, cloud_property
+    )
+    return clipped.map(lambda image: add_water_indices(image, collection))
+
+
+def compute_water_mask(
+    site,
+    collection="Sentinel 2",
+    dates=None,
+    index="MNDWI",
+    reducer="Median",
+    threshold=0,
+    mask=True,
+    clouds=20,
+):
+    """Computes a water index composite for a site, optionally masked to water pixels.
+
+    Args:
+        site (str | ee.Geometry | ee.FeatureCollection): A DEIMS site id or the site boundaries.
+        collection (str, optional): 'Sentinel 2' or 'Landsat'. Defaults to "Sentinel 2".
+        dates (tuple, optional): The start and end dates. Defaults to None, which uses the year 2022.
+        index (str, optional): One of WATER_INDICES. Defaults to "MNDWI".
+        reducer (str, optional): One of the keys of COMPOSITES. Defaults to "Median".
+        threshold (float, optional): The index threshold. Pixels below it (above it for SWIR2) are masked. Defaults to 0.
+        mask (bool, optional): Whether to mask the composite with the threshold. Defaults to True.
+        clouds (int, optional): The maximum cloud cover in percent. Defaults to 20.
+
+    Returns:
+        ee.Image: The water index composite.
+    """
+    if index not in WATER_INDICES:
+        raise ValueError(f"index must be one of {WATER_INDICES}.")
+
+    clipped = water_index_collection(site, collection, dates, clouds)
+    image = reduce_composite(clipped.select(index), reducer)
+
+    if mask:
+        if index == "SWIR2":
+            image = image.updateMask(image.lte(threshold))
+        else:
+            image = image.updateMask(image.gte(threshold))
+    return image
+
+
+def compute_lst(site, collection="Landsat", dates=None, band=None, reducer="Median", clouds=20):
+    """Computes a land surface temperature composite in degrees Celsius for a site.
+
+    Args:
+        site (str | ee.Geometry | ee.FeatureCollection): A DEIMS site id or the site boundaries.
+        collection (str, optional): 'Landsat' or 'MODIS'. Defaults to "Landsat".
+        dates (tuple, optional): The start and end dates. Defaults to None, which uses the year 2022.
+        band (str, optional): One of LST_BANDS. Defaults to None, which uses ST_B10 for Landsat and LST_Day_1km for MODIS.
+        reducer (str, optional): One of the keys of COMPOSITES. Defaults to "Median".
+        clouds (int, optional): The maximum cloud cover in percent, applied to Landsat only. Defaults to 20.
+
+    Returns:
+        ee.Image: The LST composite.
+    """
+    if collection not in ["Landsat", "MODIS"]:
+        raise ValueError("collection must be either 'Landsat' or 'MODIS'.")
+    if band is None:
+        band = "ST_B10" if collection == "Landsat" else "LST_Day_1km"
+    if dates is None:
+        dates = ("2022-01-01", "2022-12-31")
+
+    geom = site_geometry(site)
+    cloud_property = "CLOUD_COVER" if collection == "Landsat" else None
+    clipped = filter_site_collection(
+        lst_collections()[collection], geom, dates[0], dates[1], clouds, cloud_property
+    )
+    return reduce_composite(clipped.select(band), reducer)
+
+
+def load_phenometrics(
+    site,
+    year,
+    metric="SOS",
+    value="Doy",
+    collection="MODIS MCD12Q2.006",
+    site_name=None,
+):
+    """Loads a phenometric image for a site.
+
+    Args:
+        site (str | ee.Geometry | ee.FeatureCollection): A DEIMS site id or the site boundaries.
+        year (int): The year.
+        metric (str, optional): 'SOS', 'MOS', 'EOS' or 'LOS'. Defaults to "SOS".
+        value (str, optional): 'Doy' or 'Value'. Only used for the Sentinel 2 phenometrics. Defaults to "Doy".
+        collection (str, optional): 'MODIS MCD12Q2.006' or 'Sentinel 2'. The Sentinel 2 phenometrics are precomputed
+            assets that only exist for a set of eLTER sites. Defaults to "MODIS MCD12Q2.006".
+        site_name (str, optional): The site title used to find the Sentinel 2 asset. Defaults to None, which uses the
+            DEIMS title when site is a DEIMS id.
+
+    Returns:
+        ee.Image: The phenometric image.
+    """
+    if metric not in PHENOMETRICS:
+        raise ValueError(f"metric must be one of {list(PHENOMETRICS.keys())}.")
+
+    if collection == "MODIS MCD12Q2.006":
+        geom = site_geometry(site)
+        dataset = filter_site_collection(
+            ee.ImageCollection("MODIS/061/MCD12Q2"),
+            geom,
+            f"{year}-01-01",
+            f"{year}-12-31",
+        )
+        return dataset.select(PHENOMETRICS[metric]).first()
+
+    if site_name is None:
+        if not isinstance(site, str):
+            raise ValueError("site_name is required when site is not a DEIMS id.")
+        import deims
+
+        site_name = deims.getSiteById(site)["title"].split(" - ")[0]
+
+    key = "MAX" if metric == "MOS" else metric
+    pheno_name = PHENO_ASSET_NAMES.get(site_name, site_name)
+    asset = "projects/ee-digdgeografo/assets/{}_{}_{}{}".format(
+        pheno_name, year, key, str(value)[0]
+    )
+    return ee.Image(asset)
+
+
+def compute_products(product, sites, out_dir=None, scale=30, crs="EPSG:4326", max_workers=4, **kwargs):
+    """Computes a product for many sites concurrently and optionally downloads the results as GeoTIFFs.
+
+    Args:
+        product (str | function): 'water_mask', 'lst', 'phenometrics' or a function taking a site as first argument and returning an ee.Image.
+        sites (dict | list): A list of DEIMS site ids, or a dict mapping output names to DEIMS ids or Earth Engine geometries.
+        out_dir (str, optional): The folder to download the images to, one {name}.tif per site. Defaults to None, which only builds the images.
+        scale (float, optional): The download scale in meters. Defaults to 30.
+        crs (str, optional): The download CRS. Defaults to "EPSG:4326".
+        max_workers (int, optional): The number of sites processed concurrently. Defaults to 4.
+        **kwargs: Keyword arguments passed to the product function.
+
+    Returns:
+        dict: A dictionary mapping site names to ee.Image objects, or to file paths when out_dir is given. Sites that failed map to the exception.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    functions = {
+        "water_mask": compute_water_mask,
+        "lst": compute_lst,
+        "phenometrics": load_phenometrics,
+    }
+    if isinstance(product, str):
+        if product not in functions:
+            raise ValueError(f"product must be one of {list(functions.keys())}.")
+        product = functions[product]
+
+    if not isinstance(sites, dict):
+        sites = {str(site): site for site in sites}
+
+    if out_dir is not None:
+        out_dir = os.path.abspath(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+
+    def run(name, site):
+        image = product(site, **kwargs)
+        if out_dir is None:
+            return image
+        geom = site_geometry(site)
+        filename = os.path.join(out_dir, f"{name}.tif")
+        region = geom.geometry() if isinstance(geom, ee.FeatureCollection) else geom
+        download_ee_image(image, filename, region=region, crs=crs, scale=scale)
+        return filename
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {name: executor.submit(run, name, site) for name, site in sites.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"{name} failed: {e}")
+                results[name] = e
+    return results
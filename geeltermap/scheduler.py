@@ -0,0 +1,421 @@
+"""Module for exporting the eLTER products for many sites and periods as a batch.
+Jobs are stored in a SQLite database, so an interrupted batch resumes where it stopped. The scheduler keeps a bounded
+number of jobs in flight and polls their status with exponential backoff. Jobs are executed by a backend: Earth Engine
+export tasks (EETaskBackend), direct downloads (DownloadBackend) or, for tests, FakeBackend.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+# Job states stored in the database.
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+# Earth Engine task states mapped to job states.
+_EE_STATES = {
+    "UNSUBMITTED": RUNNING,
+    "READY": RUNNING,
+    "RUNNING": RUNNING,
+    "CANCEL_REQUESTED": FAILED,
+    "CANCELLED": FAILED,
+    "COMPLETED": COMPLETED,
+    "SUCCEEDED": COMPLETED,
+    "FAILED": FAILED,
+}
+
+
+def _job_image(job):
+    """Builds the image and export region of a job with the functions of geeltermap.products."""
+    import ee
+    from .products import compute_lst, compute_water_mask, load_phenometrics, site_geometry
+
+    functions = {
+        "water_mask": compute_water_mask,
+        "lst": compute_lst,
+        "phenometrics": load_phenometrics,
+    }
+    if job["product"] not in functions:
+        raise ValueError(f"product must be one of {list(functions.keys())}.")
+
+    params = dict(job["params"])
+    if job["product"] == "phenometrics":
+        image = load_phenometrics(job["site"], job["period"], **params)
+    else:
+        start, end = job["period"].split("/")
+        image = functions[job["product"]](job["site"], dates=(start, end), **params)
+
+    geom = site_geometry(job["site"])
+    region = geom.geometry() if isinstance(geom, ee.FeatureCollection) else geom
+    return image, region
+
+
+def job_name(job):
+    """Returns a file and task name for a job, e.g., 'water_mask_<site>_2020-01-01_2020-12-31'."""
+    period = str(job["period"]).replace("/", "_")
+    return f"{job['product']}_{job['site']}_{period}"
+
+
+class EETaskBackend:
+    """Runs jobs as Earth Engine export tasks to Google Drive. Tasks keep running on the server, so a restarted
+    scheduler resumes polling the tasks that were in flight.
+    """
+
+    resumable = True
+
+    def __init__(self, folder=None, scale=30, crs="EPSG:4326", max_pixels=1e13):
+        """Initialize the EETaskBackend object.
+
+        Args:
+            folder (str, optional): The Google Drive folder to export to. Defaults to None.
+            scale (float, optional): The export scale in meters. Defaults to 30.
+            crs (str, optional): The export CRS. Defaults to "EPSG:4326".
+            max_pixels (int, optional): The maximum number of pixels per export. Defaults to 1e13.
+        """
+        self.folder = folder
+        self.scale = scale
+        self.crs = crs
+        self.max_pixels = max_pixels
+
+    def submit(self, job):
+        """Starts the export task of a job and returns the task id."""
+        import ee
+
+        image, region = _job_image(job)
+        task = ee.batch.Export.image.toDrive(
+            image=image,
+            description=job_name(job)[:100],
+            folder=self.folder,
+            region=region,
+            scale=self.scale,
+            crs=self.crs,
+            maxPixels=self.max_pixels,
+        )
+        task.start()
+        return task.id
+
+    def status(self, task_ids):
+        """Returns the states of many tasks with a single request.
+
+        Args:
+            task_ids (list): The task ids.
+
+        Returns:
+            dict: A dictionary mapping task ids to (state, error message).
+        """
+        import ee
+
+        result = {}
+        for status in ee.data.getTaskStatus(list(task_ids)):
+            state = _EE_STATES.get(status.get("state"), RUNNING)
+            result[status["id"]] = (state, status.get("error_message"))
+        return result
+
+
+class DownloadBackend:
+    """Runs jobs as direct downloads with download_ee_image in a thread pool. Downloads in flight are lost when the
+    process stops, so a restarted scheduler submits them again.
+    """
+
+    resumable = False
+
+    def __init__(self, out_dir=".", scale=30, crs="EPSG:4326", max_workers=4):
+        """Initialize the DownloadBackend object.
+
+        Args:
+            out_dir (str, optional): The folder to download the images to. Defaults to ".".
+            scale (float, optional): The download scale in meters. Defaults to 30.
+            crs (str, optional): The download CRS. Defaults to "EPSG:4326".
+            max_workers (int, optional): The number of concurrent downloads. Defaults to 4.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.out_dir = os.path.abspath(out_dir)
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.scale = scale
+        self.crs = crs
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self._futures = {}
+
+    def _download(self, job):
+        from .common import download_ee_image
+
+        image, region = _job_image(job)
+        filename = os.path.join(self.out_dir, f"{job_name(job)}.tif")
+        download_ee_image(image, filename, region=region, crs=self.crs, scale=self.scale)
+        return filename
+
+    def submit(self, job):
+        """Starts the download of a job and returns its id."""
+        task_id = f"download-{job['id']}-{time.time_ns()}"
+        self._futures[task_id] = self._executor.submit(self._download, job)
+        return task_id
+
+    def status(self, task_ids):
+        """Returns the states of many downloads as a dictionary mapping ids to (state, error message)."""
+        result = {}
+        for task_id in task_ids:
+            future = self._futures.get(task_id)
+            if future is None:
+                result[task_id] = (FAILED, "Unknown download.")
+            elif not future.done():
+                result[task_id] = (RUNNING, None)
+            elif future.exception() is not None:
+                result[task_id] = (FAILED, str(future.exception()))
+            else:
+                result[task_id] = (COMPLETED, None)
+        return result
+
+
+class FakeBackend:
+    """A backend that completes jobs after a number of polls without contacting Earth Engine. Used to test the scheduler."""
+
+    resumable = True
+
+    def __init__(self, polls_to_complete=2, fail=None):
+        """Initialize the FakeBackend object.
+
+        Args:
+            polls_to_complete (int, optional): The number of status polls before a task completes. Defaults to 2.
+            fail (function, optional): A function taking a job and returning True if its task should fail. Defaults to None.
+        """
+        self.polls_to_complete = polls_to_complete
+        self.fail = fail
+        self.submitted = []
+        self._tasks = {}
+
+    def submit(self, job):
+        task_id = f"fake-{len(self.submitted)}"
+        self.submitted.append(job)
+        self._tasks[task_id] = [job, 0]
+        return task_id
+
+    def status(self, task_ids):
+        result = {}
+        for task_id in task_ids:
+            job, polls = self._tasks[task_id]
+            self._tasks[task_id][1] = polls + 1
+            if polls + 1 < self.polls_to_complete:
+                result[task_id] = (RUNNING, None)
+            elif self.fail is not None and self.fail(job):
+                result[task_id] = (FAILED, "Fake failure.")
+            else:
+                result[task_id] = (COMPLETED, None)
+        return result
+
+
+class ExportScheduler:
+    """Schedules (site, product, period) jobs on a backend with a bounded number of jobs in flight."""
+
+    def __init__(
+        self,
+        backend,
+        db_path="export_jobs.db",
+        max_in_flight=5,
+        poll_interval=5,
+        max_poll_interval=60,
+        max_retries=2,
+    ):
+        """Initialize the ExportScheduler object.
+
+        Args:
+            backend (EETaskBackend | DownloadBackend | FakeBackend): The backend that runs the jobs.
+            db_path (str, optional): The SQLite database storing the job state. Use ":memory:" for a throwaway queue. Defaults to "export_jobs.db".
+            max_in_flight (int, optional): The maximum number of jobs submitted and not finished. Earth Engine limits the
+                number of concurrent tasks per account, so keep it at or below that limit. Defaults to 5.
+            poll_interval (float, optional): The initial number of seconds between status polls. Defaults to 5.
+            max_poll_interval (float, optional): The maximum number of seconds between status polls. Defaults to 60.
+            max_retries (int, optional): The number of times a failed job is submitted again. Defaults to 2.
+        """
+        self.backend = backend
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_retries = max_retries
+
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                site TEXT NOT NULL,
+                product TEXT NOT NULL,
+                period TEXT NOT NULL,
+                params TEXT NOT NULL,
+                state TEXT NOT NULL,
+                task_id TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                submitted_at REAL,
+                finished_at REAL,
+                UNIQUE (site, product, period, params)
+            )"""
+        )
+        self.db.commit()
+
+        if not getattr(backend, "resumable", False):
+            self.db.execute(
+                "UPDATE jobs SET state = ?, task_id = NULL WHERE state = ?",
+                (PENDING, RUNNING),
+            )
+            self.db.commit()
+
+    def add_jobs(self, jobs):
+        """Adds jobs to the queue. Jobs that are already in the database are skipped.
+
+        Args:
+            jobs (list): A list of (site, product, period) or (site, product, period, params) tuples. site is a DEIMS id,
+                product is 'water_mask', 'lst' or 'phenometrics', period is a (start, end) tuple of dates or a year for
+                phenometrics, and params is a dict of keyword arguments for the product function.
+
+        Returns:
+            int: The number of jobs added.
+        """
+        rows = []
+        for job in jobs:
+            site, product, period = job[:3]
+            params = job[3] if len(job) > 3 else {}
+            if isinstance(period, (list, tuple)):
+                period = "/".join(str(p) for p in period)
+            rows.append(
+                (str(site), product, str(period), json.dumps(params, sort_keys=True), PENDING)
+            )
+        before = self.db.total_changes
+        self.db.executemany(
+            "INSERT OR IGNORE INTO jobs (site, product, period, params, state) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.db.commit()
+        return self.db.total_changes - before
+
+    def _jobs(self, state, limit=None):
+        query = "SELECT * FROM jobs WHERE state = ? ORDER BY id"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        jobs = []
+        for row in self.db.execute(query, (state,)):
+            job = dict(row)
+            job["params"] = json.loads(job["params"])
+            jobs.append(job)
+        return jobs
+
+    def _submit(self, job):
+        try:
+            task_id = self.backend.submit(job)
+        except Exception as e:
+            self._finish(job, FAILED, str(e))
+            return
+        self.db.execute(
+            "UPDATE jobs SET state = ?, task_id = ?, attempts = attempts + 1, submitted_at = ?, error = NULL WHERE id = ?",
+            (RUNNING, task_id, time.time(), job["id"]),
+        )
+
+    def _finish(self, job, state, error=None):
+        attempts = job["attempts"] + (1 if job["state"] == PENDING else 0)
+        if state == FAILED and attempts <= self.max_retries:
+            state = PENDING
+        self.db.execute(
+            "UPDATE jobs SET state = ?, task_id = NULL, attempts = ?, error = ?, finished_at = ? WHERE id = ?",
+            (state, attempts, error, time.time(), job["id"]),
+        )
+
+    def step(self):
+        """Polls the jobs in flight once and submits pending jobs up to max_in_flight.
+
+        Returns:
+            bool: True if any job changed state.
+        """
+        changed = False
+        running = self._jobs(RUNNING)
+        if running:
+            states = self.backend.status([job["task_id"] for job in running])
+            for job in running:
+                state, error = states.get(job["task_id"], (RUNNING, None))
+                if state != RUNNING:
+                    self._finish(job, state, error)
+                    changed = True
+
+        free = self.max_in_flight - len(self._jobs(RUNNING))
+        if free > 0:
+            for job in self._jobs(PENDING, limit=free):
+                self._submit(job)
+                changed = True
+
+        self.db.commit()
+        return changed
+
+    def run(self, timeout=None, verbose=True, sleep=time.sleep):
+        """Runs the queue until all jobs are completed or failed, or until the timeout is reached.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to run. Defaults to None.
+            verbose (bool, optional): Whether to print the progress. Defaults to True.
+            sleep (function, optional): The function used to wait between polls. Defaults to time.sleep.
+
+        Returns:
+            dict: The report of the run, see report().
+        """
+        start = time.time()
+        interval = self.poll_interval
+        completed_before = self.counts().get(COMPLETED, 0)
+
+        while True:
+            changed = self.step()
+            counts = self.counts()
+            if verbose and changed:
+                print(
+                    ", ".join(f"{state}: {count}" for state, count in sorted(counts.items()))
+                )
+            if counts.get(PENDING, 0) == 0 and counts.get(RUNNING, 0) == 0:
+                break
+            if timeout is not None and time.time() - start > timeout:
+                break
+            # Poll quickly while jobs are changing state and back off while they are not.
+            interval = (
+                self.poll_interval
+                if changed
+                else min(interval * 2, self.max_poll_interval)
+            )
+            sleep(interval)
+
+        return self.report(
+            elapsed=time.time() - start,
+            completed=self.counts().get(COMPLETED, 0) - completed_before,
+        )
+
+    def counts(self):
+        """Returns the number of jobs in each state."""
+        return {
+            row["state"]: row["n"]
+            for row in self.db.execute(
+                "SELECT state, COUNT(*) AS n FROM jobs GROUP BY state"
+            )
+        }
+
+    def report(self, elapsed=None, completed=None):
+        """Returns a summary of the queue.
+
+        Args:
+            elapsed (float, optional): The duration of the run in seconds. Defaults to None.
+            completed (int, optional): The number of jobs completed during the run. Defaults to None.
+
+        Returns:
+            dict: The job counts per state, the failed jobs with their errors and, when elapsed is given, the throughput in jobs per hour.
+        """
+        report = {"counts": self.counts()}
+        report["failed"] = [
+            {key: job[key] for key in ["site", "product", "period", "error"]}
+            for job in self._jobs(FAILED)
+        ]
+        if elapsed is not None:
+            report["elapsed"] = elapsed
+            report["completed"] = completed
+            report["jobs_per_hour"] = completed / elapsed * 3600 if elapsed > 0 else None
+        return report
+
+    def close(self):
+        """Closes the job database."""
+        self.db.close()
@@ -929,7 +929,7 @@ def create_timelapse(
     out_dir = os.path.dirname(out_gif)
 
     if bands is None:
-        names = col.first().bandNames().getInfo()
+        names = ee_object_info(col, "band_names")["band_names"]
         if len(names) < 3:
             bands = [names[0]]
         else:
@@ -946,15 +946,20 @@ def create_timelapse(
     elif palette is not None:
         raise Exception("The palette must be a string or a list of strings.")
 
-    if vis_params is None:
+    def min_max_values():
+        # min and max are reduced in a single request
         img = col.first().select(bands)
         scale = collection.first().select(0).projection().nominalScale().multiply(10)
-        min_value = min(
-            image_min_value(img, region=region, scale=scale).getInfo().values()
-        )
-        max_value = max(
-            image_max_value(img, region=region, scale=scale).getInfo().values()
-        )
+        stats = ee.Dictionary(
+            {
+                "min": image_min_value(img, region=region, scale=scale),
+                "max": image_max_value(img, region=region, scale=scale),
+            }
+        ).getInfo()
+        return min(stats["min"].values()), max(stats["max"].values())
+
+    if vis_params is None:
+        min_value, max_value = min_max_values()
         vis_params = {"bands": bands, "min": min_value, "max": max_value}
 
         if len(bands) == 1:
@@ -965,22 +970,10 @@ def create_timelapse(
     elif isinstance(vis_params, dict):
         if "bands" not in vis_params:
             vis_params["bands"] = bands
-        if "min" not in vis_params:
-            img = col.first().select(bands)
-            scale = (
-                collection.first().select(0).projection().nominalScale().multiply(10)
-            )
-            vis_params["min"] = min(
-                image_min_value(img, region=region, scale=scale).getInfo().values()
-            )
-        if "max" not in vis_params:
-            img = col.first().select(bands)
-            scale = (
-                collection.first().select(0).projection().nominalScale().multiply(10)
-            )
-            vis_params["max"] = max(
-                image_max_value(img, region=region, scale=scale).getInfo().values()
-            )
+        if "min" not in vis_params or "max" not in vis_params:
+            min_value, max_value = min_max_values()
+            vis_params.setdefault("min", min_value)
+            vis_params.setdefault("max", max_value)
         if palette is None and (len(bands) == 1) and ("palette" not in vis_params):
             vis_params["palette"] = cm.palettes.ndvi
         elif palette is not None and ("palette" not in vis_params):
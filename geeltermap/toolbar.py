@@ -3,16 +3,21 @@
 import os
 import deims
 import ee
-import pandas as pd
 import ipyevents
 import ipyleaflet
 import ipywidgets as widgets
 from ipyfilechooser import FileChooser
 from IPython.core.display import display
-from ndvi2gif import NdviSeasonality
 from datetime import datetime
 
 from .common import *
+from .products import (
+    filter_site_collection,
+    load_phenometrics,
+    lst_collections,
+    reduce_composite,
+    water_index_collection,
+)
 
 eLTER_SITES = {}
 downloads_images = {}
@@ -1770,6 +1775,8 @@ def PhenoApp(m=None):
             m.centerObject(geom)
             if ndvi2gif.value==True:
 
+                from ndvi2gif import NdviSeasonality
+
                 MyClass = NdviSeasonality(roi=geom, sat='S2', key='perc_90', periods=4,start_year=2018, end_year=2022, index='ndvi')
                 median = MyClass.get_year_composite().mean()
                 vizParams = {'bands': ['spring', 'autumn', 'winter'], 'min': 0.15, 'max': 0.8}
@@ -1842,17 +1849,11 @@ def PhenoApp(m=None):
         # else:
         #     add_progress_bar = True
 
-        start_date = str(start_year.value) + "-01-01"
-        end_date = str(start_year.value) + "-12-31"
-
         cur_date = datetime.date(start_year.value, 1, 1) #Today's date
         epoch_date = datetime.date(1970, 1, 1) #Jan 1 1970
         min_val = (cur_date - epoch_date).days
         max_val = min_val + 365
 
-        dataset = {'MODIS MCD12Q2.006': ee.ImageCollection('MODIS/061/MCD12Q2')}
-        bands = {'SOS': 'Greenup_1', 'MOS': 'Peak_1', 'EOS': 'Senescence_1', 'LOS': 'EVI_Amplitude_1'}
-
         with output:
             print("Loading data... Please wait...")
 
@@ -1865,10 +1866,7 @@ def PhenoApp(m=None):
         if m is not None and collection.value == "MODIS MCD12Q2.006":
             
             geom = country_sites[site.value]    
-            dataset = dataset[collection.value].filterBounds(geom).filterDate(start_date, end_date)
-            clipped = dataset.map(lambda image: image.clip(geom))
-            banda = bands[phenometrics.value]
-            vegetationrs = clipped.select(banda).first()
+            vegetationrs = load_phenometrics(geom, start_year.value, phenometrics.value)
 
             modis_vis = {
                 'min': min_val,
@@ -1888,31 +1886,15 @@ def PhenoApp(m=None):
 
         elif m is not None and collection.value != "MODIS MCD12Q2.006":
             
-            if phenometrics.value == 'MOS':
-                keyPhen = 'MAX'
-            else:
-                keyPhen = phenometrics.value
-
-            #Aqui hay que poner el site como variable
-            #Vamos a mapear el nombre de los sites a los assets de GEE
-            dnames = {"Doñana Long-Term Socio-ecological Research Platform": "Donana",
-                      "Braila Islands": "Braila",
-                      "LTSER-Sabor": "Baixo",
-                      "River Exe": "River_Exe",
-                      "Cairngorms National Park LTSER": "Cairngorms",
-                      "LTSER Veluwe": "Veluwe",
-                      "Gran Paradiso National Park": "Gran_Paradiso",
-                      "Schorfheide-Chorin": "Schorfheide",
-                      "LTSER Platform Neusiedler See": "Neusiedler"}
-            
-            if site.value in dnames.keys():
-                pheno_name = dnames[site.value]
-            else:
-                pheno_name = site.value
-            base = 'projects/ee-digdgeografo/assets/{}_{}_{}{}'.format(pheno_name, start_year.value, keyPhen, 
-                                                                       str(phenometrics_val.value)[0])
-            nbase = ee.Image(base)
             geom = country_sites[site.value]    
+            nbase = load_phenometrics(
+                geom,
+                start_year.value,
+                phenometrics.value,
+                phenometrics_val.value,
+                collection.value,
+                site_name=site.value,
+            )
 
             #print(base)
             #geom = eLTER_SITES[site.value][1]   
@@ -2159,36 +2141,6 @@ def WaterDetect(m=None):
     m.centerObject(eelter_object)
 
 
-    #############################################
-    # GEE collections stuffs
-    #############################################
-
-
-    LC09col = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2")#.filterBounds(self.roi) 
-    LC08col = ee.ImageCollection("LANDSAT/LC08/C02/T1_L2")#.filterBounds(self.roi) 
-    LE07col = ee.ImageCollection("LANDSAT/LE07/C02/T1_L2")#.filterBounds(self.roi) 
-    LT05col = ee.ImageCollection("LANDSAT/LT05/C02/T1_L2")#.filterBounds(self.roi) 
-    LT04col = ee.ImageCollection("LANDSAT/LT04/C02/T1_L2")#.filterBounds(self.roi) 
-    
-    OLI = LC09col.merge(LC08col)
-    ETM = LE07col.merge(LT05col).merge(LT04col)
-    OLI_ = OLI.map(scale_OLI) 
-    ETM_ = ETM.map(scale_ETM)
-    Landsat = OLI_.merge(ETM_)
-    
-    # Notice that S2 is not in Surface Reflectance but in TOA, this because otherwise only
-    # had data starting in 2017. Using BOA we have 2 extra years, starting at 2015
-    # We use the wide 8 band instead of the 8A narrower badn, that is also more similar to landsat NIR
-    # But this way we have NDVI at 10 m instead of 20. And we are using TOA instead of SR so, who cares?
-    
-    #"COPERNICUS/S2_SR_HARMONIZED"
-    S2col = ee.ImageCollection("COPERNICUS/S2_HARMONIZED").select(['B2', 'B3', 'B4', 'B8', 'B11', 'B12'], 
-                                                                        ['Blue', 'Green', 'Red', 'Nir', 'Swir1', 'Swir2'])#.filterBounds(self.roi)
-    
-    
-    collections = {'Landsat': Landsat, 'Sentinel 2': S2col}
-
-
     #############################################
     # Widgets stuffs
     #############################################
@@ -2414,6 +2366,8 @@ def WaterDetect(m=None):
             m.centerObject(geom)
             if ndvi2gif.value==True:
 
+                from ndvi2gif import NdviSeasonality
+
                 MyClass = NdviSeasonality(roi=geom, sat='S2', key='perc_90', periods=4,start_year=2018, end_year=2022, index='ndvi')
                 median = MyClass.get_year_composite().mean()
                 vizParams = {'bands': ['spring', 'autumn', 'winter'], 'min': 0.15, 'max': 0.8}
@@ -2460,81 +2414,10 @@ def WaterDetect(m=None):
 
     def submit_clicked(b):
 
-        #####################################################################
-        #functions to compute water indexes
-        #####################################################################
-
-        def get_ndvi(image):
-
-            '''Here we apply the NDVI calculation'''   
-
-            return image.normalizedDifference(['Nir', 'Red']).rename('NDVI')
-        
-        def get_bsi(image):
-
-            '''Here we apply the BSI calculation'''
-            # Compute the SAVI using an expression.
-            return image.expression(
-                ('((SWIR2 + RED)-(NIR + BLUE)) / ((SWIR2 + RED)+(NIR + BLUE))'), {
-                'NIR': image.select('Nir'),
-                'BLUE': image.select('Blue'),
-                'RED': image.select('Red'),
-                'SWIR1':image.select('Swir1'),
-                'SWIR2':image.select('Swir2')}).rename(['BSI'])
-
-        
-        def get_mndwi(image):
-
-            '''Here we apply the NDVI calculation'''   
-
-            return image.normalizedDifference(['Green', 'Swir1']).rename('MNDWI')
-        
-        def get_ndwi_McFeeters(image):
-
-            '''Here we apply the NDWI calculation'''   
-
-            return image.normalizedDifference(['Green', 'Nir']).rename('NDWI_McFeeters')
-        
-        def get_ndwi_gao(image):
-
-            '''Here we apply the NDWI calculation'''   
-
-            return image.normalizedDifference(['Nir', 'Swir1']).rename('NDWI_Gao')
-    
-        def get_awei(image):
-            
-            '''Here we apply the SAVI calculation'''   
-
-            # Compute the SAVI using an expression.
-            return image.expression(
-                ('BLUE + 2.5 * GREEN - 1.5 * (NIR + SWIR1) - 0.25 * SWIR2'), {
-                'NIR': image.select('Nir'),
-                'BLUE': image.select('Blue'),
-                'GREEN': image.select('Green'),
-                'SWIR1':image.select('Swir1'),
-                'SWIR2':image.select('Swir2')}).rename(['AEWI'])
-        
-        def get_swir2(image):
-
-            '''Here we apply the NDWI calculation'''   
-            if collection.value == 'Sentinel 2':
-                return image.select('Swir2').divide(1000).rename('SWIR2')
-            elif collection.value == 'Landsat':
-                return image.select('Swir2').rename('SWIR2')
-            else:
-                print('Please, check your collection choice')
-        
-        d = {'NDWI_McFeeters': get_ndwi_McFeeters, 
-             'NDWI_Gao': get_ndwi_gao,  
-             'AWEI': get_awei, 
-             'MNDWI': get_mndwi,
-             'SWIR2': get_swir2}
-
         #col = collection.value
 
         sdate = str(start_date.value)
         edate = str(end_date.value)
-        col = collections[collection.value]
 
         with output:
             print("Loading data... Please wait...")
@@ -2549,25 +2432,9 @@ def WaterDetect(m=None):
             
             geom = country_sites[site.value]
             
-            if collection.value == 'Sentinel 2':
-                dataset = col.filterBounds(geom).filterDate(ee.Date(sdate), 
-                    ee.Date(edate)).filterMetadata('CLOUDY_PIXEL_PERCENTAGE', 'less_than', int(clouds.value))
-            elif collection.value == 'Landsat':
-                dataset = col.filterBounds(geom).filterDate(ee.Date(sdate), 
-                    ee.Date(edate)).filterMetadata('CLOUD_COVER', 'less_than', int(clouds.value))
-            else:
-                print('Please, check your collection choice')
-
-            clipped = dataset.map(lambda image: image.clip(geom))
-            # Add ndvi band to clipped collection
-
-            clipped = clipped.map(lambda image: image.addBands(get_ndvi(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_mndwi(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_ndwi_McFeeters(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_ndwi_gao(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_awei(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_bsi(image)))
-            clipped = clipped.map(lambda image: image.addBands(get_swir2(image)))
+            clipped = water_index_collection(
+                geom, collection.value, (sdate, edate), clouds.value
+            )
 
             #banda = clipped.map(d[windex.value])
             banda = clipped.select(windex.value)
@@ -2580,24 +2447,7 @@ def WaterDetect(m=None):
             }
 
 
-            if compendium.value == 'Max':
-                banda = banda.max()
-            elif compendium.value == 'Min':
-                banda = banda.min()
-            elif compendium.value == 'Mean':
-                banda = banda.mean()
-            elif compendium.value == 'Median':
-                banda = banda.median()
-            elif compendium.value == 'Percentile 10':
-                banda = banda.reduce(ee.Reducer.percentile([10]))
-            elif compendium.value == 'Percentile 20':
-                banda = banda.reduce(ee.Reducer.percentile([20]))
-            elif compendium.value == 'Percentile 90':
-                banda = banda.reduce(ee.Reducer.percentile([90]))
-            elif compendium.value == 'Percentile 95':
-                banda = banda.reduce(ee.Reducer.percentile([95]))
-            else:
-                banda = banda.median()
+            banda = reduce_composite(banda, compendium.value)
 
             # Here we apply the mask
             if mask.value == True:
@@ -2858,21 +2708,7 @@ def LST(m=None):
     #############################################
 
 
-    LC09col = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2")#.filterBounds(self.roi) 
-    LC08col = ee.ImageCollection("LANDSAT/LC08/C02/T1_L2")#.filterBounds(self.roi) 
-    OLI = LC08col.merge(LC09col)
-    Landsat = OLI.map(scale_OLI_ST)
-    
-    # Notice that S2 is not in Surface Reflectance but in TOA, this because otherwise only
-    # had data starting in 2017. Using BOA we have 2 extra years, starting at 2015
-    # We use the wide 8 band instead of the 8A narrower badn, that is also more similar to landsat NIR
-    # But this way we have NDVI at 10 m instead of 20. And we are using TOA instead of SR so, who cares?
-    
-    #"MODIS/061/MOD11A1"
-    MODIS = ee.ImageCollection("MODIS/061/MOD11A1").map(scale_MODIS_ST)
-    
-    
-    collections = {'Landsat': Landsat, 'MODIS': MODIS}
+    collections = lst_collections()
 
 
     #############################################
@@ -3077,6 +2913,8 @@ def LST(m=None):
             m.centerObject(geom)
             if ndvi2gif.value==True:
 
+                from ndvi2gif import NdviSeasonality
+
                 MyClass = NdviSeasonality(roi=geom, sat='S2', key='perc_90', periods=4,start_year=2018, end_year=2022, index='ndvi')
                 median = MyClass.get_year_composite().mean()
                 vizParams = {'bands': ['spring', 'autumn', 'winter'], 'min': 0.15, 'max': 0.8}
@@ -3134,7 +2972,6 @@ def LST(m=None):
 
         sdate = str(start_date.value)
         edate = str(end_date.value)
-        col = collections[collection.value]
 
         with output:
             print("Loading data... Please wait...")
@@ -3149,16 +2986,10 @@ def LST(m=None):
             
             geom = country_sites[site.value] 
 
-            # Apply cloud filter to landsat
-            if collection.value == 'Landsat':
-                dataset = col.filterBounds(geom).filterDate(ee.Date(sdate), 
-                    ee.Date(edate)).filterMetadata('CLOUD_COVER', 'less_than', int(clouds.value))
-            else:
-                #print('Please, check your collection choice')
-                dataset = col.filterBounds(geom).filterDate(ee.Date(sdate), ee.Date(edate)) 
-
-
-            clipped = dataset.map(lambda image: image.clip(geom))
+            cloud_property = 'CLOUD_COVER' if collection.value == 'Landsat' else None
+            clipped = filter_site_collection(
+                collections[collection.value], geom, sdate, edate, clouds.value, cloud_property
+            )
 
             #banda = clipped.map(d[windex.value])
             banda = clipped.select(windex.value)
@@ -3179,24 +3010,7 @@ def LST(m=None):
             name = windex.value + ' ' + collection.value + ' ' + compendium.value
 
         
-            if compendium.value == 'Max':
-                banda = banda.max()
-            elif compendium.value == 'Min':
-                banda = banda.min()
-            elif compendium.value == 'Mean':
-                banda = banda.mean()
-            elif compendium.value == 'Median':
-                banda = banda.median()
-            elif compendium.value == 'Percentile 10':
-                banda = banda.reduce(ee.Reducer.percentile([10]))
-            elif compendium.value == 'Percentile 20':
-                banda = banda.reduce(ee.Reducer.percentile([20]))
-            elif compendium.value == 'Percentile 90':
-                banda = banda.reduce(ee.Reducer.percentile([90]))
-            elif compendium.value == 'Percentile 95':
-                banda = banda.reduce(ee.Reducer.percentile([95]))
-            else:
-                banda = banda.median()
+            banda = reduce_composite(banda, compendium.value)
             
             # We made a dict with the images loaded in the map, key is the name and image and geometry are the values for each entry
             downloads_images[name] = [banda, geom]
@@ -3635,6 +3449,8 @@ def Form(m=None):
             m.centerObject(geom)
             if ndvi2gif.value==True:
 
+                from ndvi2gif import NdviSeasonality
+
                 MyClass = NdviSeasonality(roi=geom, sat='S2', key='perc_90', periods=4,start_year=2018, end_year=2022, index='ndvi')
                 median = MyClass.get_year_composite().mean()
                 vizParams = {'bands': ['spring', 'autumn', 'winter'], 'min': 0.15, 'max': 0.8}
@@ -3695,6 +3511,8 @@ def Form(m=None):
                     now = datetime.datetime.now().strftime('%Y-%m-%d')
                     content = csv['content']
                     content = io.StringIO(content.decode('utf-8'))
+                    import pandas as pd
+
                     df = pd.read_csv(content)
                     dfname = filename.value + "_" + now + ".csv"
                     #print(dfname)
@@ -0,0 +1,30 @@
+"""Tests for the lazily built palettes of the colormaps module."""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from geeltermap import colormaps as cm
+
+
+@pytest.fixture
+def fresh_palettes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cm, "_builtin_path", lambda: str(tmp_path / "colormaps.npz"))
+    monkeypatch.setattr(cm, "_builtin_loaded", False)
+    monkeypatch.setattr(cm, "_builtin_names", [])
+    monkeypatch.setattr(cm, "_lut_cache", {})
+    monkeypatch.setattr(cm, "_palette_cache", {})
+    monkeypatch.setattr(cm, "_palettes", None)
+    return tmp_path
+
+
+def test_palettes_after_single_palette_without_saved_file(fresh_palettes):
+    cm.get_palette("terrain")
+    assert len(cm.palettes.viridis.n05) == 5
+    assert (fresh_palettes / "colormaps.npz").exists()
+
+
+def test_palettes_from_saved_file(fresh_palettes):
+    cm.save_palettes()
+    cm.get_palette("terrain")
+    assert list(cm.palettes.viridis.default) == cm.get_palette("viridis")
@@ -0,0 +1,43 @@
+"""Tests for the point placement of extract_transects."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+shapely = pytest.importorskip("shapely")
+pyproj = pytest.importorskip("pyproj")
+pytest.importorskip("geopandas")
+
+from geeltermap import common
+
+
+@pytest.fixture
+def no_sampling(monkeypatch):
+    # Skip the Earth Engine requests; only the point placement is tested.
+    monkeypatch.setattr(
+        common,
+        "sample_points",
+        lambda image, df, **kwargs: df.assign(sampled=True, batch=0, elevation=1.0),
+    )
+
+
+def test_dist_interval_is_geodesic(no_sampling):
+    # A north-south segment at high latitude followed by an oblique one.
+    line = shapely.LineString([(10, 60), (10, 70), (20, 75)])
+    df = common.extract_transects(None, [line], dist_interval=5000)
+
+    geod = pyproj.Geod(ellps="WGS84")
+    lon, lat = df["longitude"].to_numpy(), df["latitude"].to_numpy()
+    _, _, spacing = geod.inv(lon[:-1], lat[:-1], lon[1:], lat[1:])
+
+    # Only the last step is shorter; the chord around the vertex is slightly shorter than the path.
+    assert np.allclose(np.diff(df["distance"])[:-1], 5000)
+    assert np.allclose(spacing[:-1], 5000, rtol=1e-2)
+    assert df["distance"].iloc[-1] == pytest.approx(geod.geometry_length(line))
+    assert (lon[-1], lat[-1]) == pytest.approx((20, 75))
+
+
+def test_n_points(no_sampling):
+    lines = [[(0, 0), (1, 1)], [(5, 5), (5, 6), (6, 6)]]
+    df = common.extract_transects(None, lines, n_points=10)
+    assert df.groupby("transect").size().tolist() == [10, 10]
+    assert np.allclose(np.diff(df[df["transect"] == 1]["distance"]), df["distance"].max() / 9)
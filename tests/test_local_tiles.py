@@ -0,0 +1,59 @@
+"""Tests for the in-process local tile client."""
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+rasterio = pytest.importorskip("rasterio")
+pytest.importorskip("PIL")
+
+from rasterio.transform import from_origin
+
+from geeltermap import local_tiles
+
+
+def write_raster(path, value):
+    data = np.full((1, 16, 16), value, dtype="float32")
+    profile = {
+        "driver": "GTiff",
+        "width": 16,
+        "height": 16,
+        "count": 1,
+        "dtype": "float32",
+        "crs": "EPSG:4326",
+        "transform": from_origin(-10, 10, 1.25, 1.25),
+    }
+    tmp_path = str(path) + ".part"
+    with rasterio.open(tmp_path, "w", **profile) as dst:
+        dst.write(data)
+    os.replace(tmp_path, path)
+
+
+def test_rewritten_raster_is_read_again(tmp_path):
+    path = str(tmp_path / "data.tif")
+    write_raster(path, 1)
+    client = local_tiles.get_tile_client(path)
+    assert client.metadata()["bands"]["b1"]["max"] == 1
+    old_tile = client.tile(0, 0, 0, vmin=0, vmax=10)
+
+    # Make sure the modification time differs on coarse clocks.
+    write_raster(path, 5)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert local_tiles.get_tile_client(path) is client
+    assert client.metadata()["bands"]["b1"]["max"] == 5
+    assert client.tile(0, 0, 0, vmin=0, vmax=10) != old_tile
+    local_tiles.close_datasets()
+
+
+def test_evict(tmp_path):
+    path = str(tmp_path / "data.tif")
+    write_raster(path, 1)
+    client = local_tiles.get_tile_client(path)
+    dataset, _ = local_tiles.open_dataset(path)
+    local_tiles.evict(path)
+    assert dataset.closed
+    assert client.metadata()["bands"]["b1"]["max"] == 1
+    local_tiles.close_datasets()
@@ -0,0 +1,56 @@
+"""Tests for the streaming Parquet writer used by zonal_stats_batch and ee_to_parquet."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from geeltermap.common import _ParquetStreamWriter
+
+
+COLUMNS = ["system:index", "name", "area", "mean"]
+
+
+def batch_table(rows):
+    # Batches are aligned to the union of the zone properties like in zonal_stats_batch.
+    df = pd.DataFrame(rows).reindex(columns=COLUMNS)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def test_mixed_property_zones(tmp_path):
+    filename = str(tmp_path / "zones.parquet")
+    writer = _ParquetStreamWriter(filename, COLUMNS)
+    writer.write(batch_table([{"system:index": "0", "area": 1, "mean": 0.5}]))
+    writer.write(
+        batch_table([{"system:index": "1", "name": "site", "area": 2, "mean": 0.7}])
+    )
+    writer.close()
+
+    table = pq.read_table(filename)
+    assert table.schema.field("name").type == pa.string()
+    assert table.schema.field("area").type == pa.float64()
+    assert table.column("name").to_pylist() == [None, "site"]
+
+
+def test_property_missing_from_buffered_batches(tmp_path):
+    filename = str(tmp_path / "zones.parquet")
+    writer = _ParquetStreamWriter(filename, COLUMNS, max_buffered=1)
+    writer.write(batch_table([{"system:index": "0", "area": 1, "mean": 0.5}]))
+    writer.write(
+        batch_table([{"system:index": "1", "name": "site", "area": 2, "mean": 0.7}])
+    )
+    writer.close()
+
+    table = pq.read_table(filename)
+    assert table.column("name").to_pylist() == [None, "site"]
+
+
+def test_conflicting_types(tmp_path):
+    filename = str(tmp_path / "zones.parquet")
+    writer = _ParquetStreamWriter(filename, COLUMNS, max_buffered=1)
+    writer.write(batch_table([{"system:index": "0", "name": 1.5}]))
+    with pytest.raises(TypeError):
+        writer.write(batch_table([{"system:index": "1", "name": "site"}]))
+    writer.abort()
+    assert not (tmp_path / "zones.parquet").exists()